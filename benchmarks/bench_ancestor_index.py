@@ -0,0 +1,71 @@
+"""Benchmark AncestorIndex queries against parent walks on a random tree.
+
+Builds a random binary tree of two hundred thousand positions, then answers
+the same lowest-common-ancestor and depth queries by walking parent links
+and through an AncestorIndex, including the time to build the index.
+
+Run from the repository root:  python benchmarks/bench_ancestor_index.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dloud_ads.ancestor_index import AncestorIndex
+from dloud_ads.linked_binary_tree import LinkedBinaryTree
+
+SIZE = 200000
+QUERIES = 100000
+
+
+def timed(label, action):
+    """Print the time taken by action() and return its result."""
+    start = time.perf_counter()
+    result = action()
+    print('  %-28s %8.3f s' % (label, time.perf_counter() - start))
+    return result
+
+
+def random_tree(rng):
+    """Return a random LinkedBinaryTree and the list of its positions."""
+    the_tree = LinkedBinaryTree()
+    positions = [the_tree._add_root(0)]
+    while len(positions) < SIZE:
+        pos = rng.choice(positions)
+        if the_tree.left(pos) is None:
+            positions.append(the_tree._add_left(pos, len(positions)))
+        elif the_tree.right(pos) is None:
+            positions.append(the_tree._add_right(pos, len(positions)))
+    return the_tree, positions
+
+
+def naive_lca(the_tree, pos1, pos2):
+    """Return the lowest common ancestor by walking parent links."""
+    seen = set()
+    while pos1 is not None:
+        seen.add(pos1)
+        pos1 = the_tree.parent(pos1)
+    while pos2 not in seen:
+        pos2 = the_tree.parent(pos2)
+    return pos2
+
+
+def main():
+    """Run the benchmark."""
+    rng = random.Random(11)
+    the_tree, positions = random_tree(rng)
+    pairs = [(rng.choice(positions), rng.choice(positions)) for _ in range(QUERIES)]
+    print('%d positions, height %d, %d queries' % (SIZE, the_tree.height(), QUERIES))
+    walked = timed('parent-walk lca', lambda: [naive_lca(the_tree, p, q) for p, q in pairs])
+    timed('parent-walk depth', lambda: [the_tree.depth(p) for p, _ in pairs])
+    index = timed('index build', lambda: AncestorIndex(the_tree))
+    indexed = timed('index lca', lambda: [index.lca(p, q) for p, q in pairs])
+    timed('index depth', lambda: [index.depth(p) for p, _ in pairs])
+    assert walked == indexed
+
+
+if __name__ == '__main__':
+    main()
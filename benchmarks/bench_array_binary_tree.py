@@ -0,0 +1,72 @@
+"""Benchmark ArrayBinaryTree against LinkedBinaryTree.
+
+Reports memory per node and traversal throughput for complete trees.
+Run from the repository root:  python benchmarks/bench_array_binary_tree.py
+"""
+
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dloud_ads.array_binary_tree import ArrayBinaryTree
+from dloud_ads.linked_binary_tree import LinkedBinaryTree
+
+
+def complete_tree(cls, size):
+    """Return a complete binary tree of type cls with the given number of nodes."""
+    tree = cls()
+    level = [tree._add_root(0)]
+    count = 1
+    while count < size:
+        fringe = []
+        for pos in level:
+            for add in (tree._add_left, tree._add_right):
+                if count < size:
+                    fringe.append(add(pos, count))
+                    count += 1
+        level = fringe
+    return tree
+
+
+def bytes_per_node(cls, size):
+    """Return the memory retained per node by a complete tree of type cls."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    tree = complete_tree(cls, size)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del tree
+    return float(after - before) / size
+
+
+def consume(iterable):
+    """Exhaust an iterable."""
+    for _ in iterable:
+        pass
+
+
+def measure(label, func, count):
+    """Print the best throughput of func, which visits count nodes."""
+    best = min(timeit.repeat(func, number=1, repeat=3))
+    print('  %-28s %10.0f nodes/s' % (label, count / best))
+
+
+def main():
+    """Run the benchmark."""
+    size = 2 ** 18 - 1
+    for cls in (LinkedBinaryTree, ArrayBinaryTree):
+        print('%s (%d nodes)' % (cls.__name__, size))
+        print('  %-28s %10.1f bytes' % ('memory per node', bytes_per_node(cls, size)))
+        tree = complete_tree(cls, size)
+        measure('inorder positions', lambda: consume(tree.inorder()), size)
+        measure('preorder elements', lambda: consume(tree.iter_elements('preorder')), size)
+        measure('inorder elements', lambda: consume(tree.iter_elements('inorder')), size)
+        measure('breadthfirst elements',
+                lambda: consume(tree.iter_elements('breadthfirst')), size)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""Benchmark ArrayQueue batch operations and capacity control.
+
+Compares batch operations against per-element calls, and tracks the
+resident set size across traffic spikes followed by drains, with and
+without automatic shrinking.
+
+Run from the repository root:  python benchmarks/bench_array_queue.py
+"""
+
+import ctypes
+import ctypes.util
+import itertools
+import multiprocessing
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dloud_ads.array_queue import ArrayQueue
+
+BURST = 100000
+BURSTS = 20
+
+
+def per_element(burst):
+    """Ingest and drain bursts one element at a time."""
+    queue = ArrayQueue()
+    for _ in range(BURSTS):
+        for element in burst:
+            queue.enqueue(element)
+        for _ in range(len(burst)):
+            queue.dequeue()
+
+
+def batched(burst):
+    """Ingest and drain bursts with enqueue_many and dequeue_many."""
+    queue = ArrayQueue()
+    for _ in range(BURSTS):
+        queue.enqueue_many(burst)
+        queue.dequeue_many(len(burst))
+
+
+def rss_bytes():
+    """Return the resident set size of this process (Linux only)."""
+    with open('/proc/self/statm') as statm:
+        return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+
+def release_free_heap():
+    """Ask glibc to return freed heap memory to the system, if possible.
+
+    glibc raises its mmap threshold after large frees, so later large lists
+    come from the heap and their memory is only returned by malloc_trim.
+    """
+    name = ctypes.util.find_library('c')
+    if name:
+        libc = ctypes.CDLL(name)
+        if hasattr(libc, 'malloc_trim'):
+            libc.malloc_trim(0)
+
+
+def spike_and_drain(keep_peak):
+    """Print the RSS after each of several spike/drain cycles.
+
+    With keep_peak, the queue reserves its peak capacity, which is how
+    ArrayQueue behaved before it could shrink.
+    """
+    element = object()
+    queue = ArrayQueue()
+    label = 'reserved peak' if keep_peak else 'automatic shrink'
+    for spike in (10 ** 6, 4 * 10 ** 6, 10 ** 6):
+        queue.enqueue_many(itertools.repeat(element, spike))
+        peak = rss_bytes()
+        if keep_peak:
+            queue.reserve(len(queue))
+        while len(queue) > 10:
+            queue.dequeue_many(min(1000, len(queue) - 10))
+        release_free_heap()
+        print('  %-18s spike %8d: peak %6.1f MB, drained %6.1f MB, capacity %d' %
+              (label, spike, peak / 2.0 ** 20, rss_bytes() / 2.0 ** 20, len(queue._data)))
+
+
+def main():
+    """Run the benchmark."""
+    burst = list(range(BURST))
+    print('%d bursts of %d elements' % (BURSTS, BURST))
+    for label, func in (('enqueue/dequeue', per_element),
+                        ('enqueue_many/dequeue_many', batched)):
+        best = min(timeit.repeat(lambda: func(burst), number=1, repeat=3))
+        print('  %-28s %8.1f ns/element' % (label, 1e9 * best / (BURST * BURSTS)))
+    if os.path.exists('/proc/self/statm'):
+        print('RSS across spike/drain cycles')
+        context = multiprocessing.get_context('spawn')
+        for keep_peak in (True, False):
+            child = context.Process(target=spike_and_drain, args=(keep_peak,))
+            child.start()
+            child.join()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""Benchmark subtree sums on AugmentedBinaryTree against full traversals.
+
+Builds a complete tree of one hundred thousand elements, then interleaves
+element replacements anywhere with subtree-sum queries at random
+positions among the top six levels.  The
+baseline recomputes each sum by traversing the subtree of a plain
+LinkedBinaryTree; the augmented tree pays O(depth) per replacement and
+reads each sum in O(1) time.
+
+Run from the repository root:  python benchmarks/bench_augmented_binary_tree.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dloud_ads.augmented_binary_tree import AugmentedBinaryTree
+from dloud_ads.linked_binary_tree import LinkedBinaryTree
+
+SIZE = 100000
+OPERATIONS = 2000
+
+
+def timed(label, action):
+    """Print the time taken by action() and return its result."""
+    start = time.perf_counter()
+    result = action()
+    print('  %-28s %8.3f s' % (label, time.perf_counter() - start))
+    return result
+
+
+def run(the_tree, ops, query):
+    """Apply the replacements and queries of ops, returning the query results."""
+    positions = list(the_tree.breadthfirst())
+    results = []
+    for index, elem, top in ops:
+        the_tree._replace(positions[index], elem)
+        results.append(query(the_tree, positions[top]))
+    return results
+
+
+def main():
+    """Run the benchmark."""
+    rng = random.Random(13)
+    elements = [rng.randrange(1000) for _ in range(SIZE)]
+    ops = [(rng.randrange(SIZE), rng.randrange(1000), rng.randrange(63)) for _ in range(OPERATIONS)]
+    print('%d elements, %d replace-then-query operations' % (SIZE, OPERATIONS))
+    plain = LinkedBinaryTree.from_level_order(elements)
+    augmented = timed('augmented build', lambda: AugmentedBinaryTree.from_level_order(elements))
+    walked = timed('traversal sums', lambda: run(
+        plain, ops, lambda tree, pos: sum(p.element() for p in tree._subtree_preorder(pos))))
+    stored = timed('aggregate sums', lambda: run(
+        augmented, ops, lambda tree, pos: tree.aggregate(pos)))
+    assert walked == stored
+
+
+if __name__ == '__main__':
+    main()
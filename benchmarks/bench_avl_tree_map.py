@@ -0,0 +1,107 @@
+"""Benchmark AVLTreeMap against a sorted index kept with bisect on lists.
+
+Builds both indexes from one million sorted keys, then times random
+lookups, inserts, deletes and range scans on them.
+
+Run from the repository root:  python benchmarks/bench_avl_tree_map.py
+"""
+
+import bisect
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dloud_ads.avl_tree_map import AVLTreeMap
+
+SIZE = 1000000
+OPERATIONS = 20000
+SPAN = 100
+
+
+class BisectIndex:
+    """Sorted map kept as parallel key and value lists managed with bisect."""
+
+    def __init__(self, items):
+        self._keys = [key for key, _ in items]
+        self._values = [value for _, value in items]
+
+    def __getitem__(self, key):
+        index = bisect.bisect_left(self._keys, key)
+        if index == len(self._keys) or self._keys[index] != key:
+            raise KeyError(key)
+        return self._values[index]
+
+    def __setitem__(self, key, value):
+        index = bisect.bisect_left(self._keys, key)
+        if index < len(self._keys) and self._keys[index] == key:
+            self._values[index] = value
+        else:
+            self._keys.insert(index, key)
+            self._values.insert(index, value)
+
+    def __delitem__(self, key):
+        index = bisect.bisect_left(self._keys, key)
+        if index == len(self._keys) or self._keys[index] != key:
+            raise KeyError(key)
+        del self._keys[index]
+        del self._values[index]
+
+    def find_range(self, start, stop):
+        first = bisect.bisect_left(self._keys, start)
+        last = bisect.bisect_left(self._keys, stop)
+        return zip(self._keys[first:last], self._values[first:last])
+
+
+def timed(label, action):
+    """Print the time taken by action() and return its result."""
+    start = time.perf_counter()
+    result = action()
+    print('  %-36s %8.3f s' % (label, time.perf_counter() - start))
+    return result
+
+
+def workload(name, index, lookups, inserts, deletes):
+    """Time the random operations against index."""
+    def lookup():
+        for key in lookups:
+            index[key]
+
+    def insert():
+        for key in inserts:
+            index[key] = key
+
+    def delete():
+        for key in deletes:
+            del index[key]
+
+    def scan():
+        for key in lookups:
+            for _ in index.find_range(key, key + 2 * SPAN):
+                pass
+
+    timed('%s %d lookups' % (name, OPERATIONS), lookup)
+    timed('%s %d inserts' % (name, OPERATIONS), insert)
+    timed('%s %d deletes' % (name, OPERATIONS), delete)
+    timed('%s %d range scans of %d' % (name, OPERATIONS, SPAN), scan)
+
+
+def main():
+    """Run the benchmark."""
+    rng = random.Random(1)
+    items = [(2 * k, k) for k in range(SIZE)]
+    lookups = [2 * rng.randrange(SIZE) for _ in range(OPERATIONS)]
+    inserts = [2 * rng.randrange(SIZE) + 1 for _ in range(OPERATIONS)]
+    deletes = rng.sample(range(0, 2 * SIZE, 2), OPERATIONS)
+    print('%d keys' % SIZE)
+    tree = timed('AVLTreeMap.from_sorted', lambda: AVLTreeMap.from_sorted(items))
+    workload('AVLTreeMap', tree, lookups, inserts, deletes)
+    del tree
+    index = timed('bisect lists build', lambda: BisectIndex(items))
+    workload('bisect', index, lookups, inserts, deletes)
+
+
+if __name__ == '__main__':
+    main()
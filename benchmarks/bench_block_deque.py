@@ -0,0 +1,65 @@
+"""Benchmark BlockDeque against LinkedDeque and collections.deque.
+
+Reports memory per element and the throughput of appending at the back
+and removing from the front.
+Run from the repository root:  python benchmarks/bench_block_deque.py
+"""
+
+import collections
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dloud_ads.block_deque import BlockDeque
+from dloud_ads.linked_deque import LinkedDeque
+
+SIZE = 10 ** 6
+
+
+class CollectionsDeque(collections.deque):
+    """collections.deque exposing the LinkedDeque method names."""
+    insert_first = collections.deque.appendleft
+    insert_last = collections.deque.append
+    delete_first = collections.deque.popleft
+    delete_last = collections.deque.pop
+
+
+def bytes_per_element(cls):
+    """Return the memory retained per element by a filled deque of type cls."""
+    element = object()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    the_deque = cls()
+    for _ in range(SIZE):
+        the_deque.insert_last(element)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del the_deque
+    return float(after - before) / SIZE
+
+
+def fill_and_drain(cls):
+    """Append SIZE elements at the back and remove them from the front."""
+    the_deque = cls()
+    insert_last = the_deque.insert_last
+    delete_first = the_deque.delete_first
+    for k in range(SIZE):
+        insert_last(k)
+    for _ in range(SIZE):
+        delete_first()
+
+
+def main():
+    """Run the benchmark."""
+    print('%d elements' % SIZE)
+    for cls in (LinkedDeque, BlockDeque, CollectionsDeque):
+        best = min(timeit.repeat(lambda: fill_and_drain(cls), number=1, repeat=3))
+        print('  %-18s %6.1f bytes/element %12.0f ops/s' %
+              (cls.__name__, bytes_per_element(cls), 2 * SIZE / best))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""Benchmark multi-producer/multi-consumer throughput of the queue wrappers.
+
+Compares the standard library's queue.Queue and asyncio.Queue with
+BlockingQueue and AsyncQueue, consumed one element at a time and in
+batches with get_many.
+Run from the repository root:  python benchmarks/bench_blocking_queue.py
+"""
+
+import asyncio
+import os
+import queue
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dloud_ads.async_queue import AsyncQueue
+from dloud_ads.blocking_queue import BlockingQueue
+
+PRODUCERS = 4
+CONSUMERS = 4
+PER_PRODUCER = 100000
+DONE = object()
+
+
+def run(label, the_queue, batch):
+    """Time PRODUCERS threads feeding CONSUMERS threads through the_queue."""
+
+    def produce():
+        for k in range(PER_PRODUCER):
+            the_queue.put(k)
+
+    def consume():
+        while True:
+            if batch:
+                elements = the_queue.get_many(batch)
+            else:
+                elements = [the_queue.get()]
+            finished = elements.count(DONE)
+            if finished:
+                for _ in range(finished - 1):
+                    the_queue.put(DONE)     # leave the rest for other consumers
+                break
+
+    producers = [threading.Thread(target=produce) for _ in range(PRODUCERS)]
+    consumers = [threading.Thread(target=consume) for _ in range(CONSUMERS)]
+    start = time.perf_counter()
+    for thread in producers + consumers:
+        thread.start()
+    for thread in producers:
+        thread.join()
+    for _ in consumers:
+        the_queue.put(DONE)
+    for thread in consumers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    print('  %-32s %10.0f elements/s' % (label, PRODUCERS * PER_PRODUCER / elapsed))
+
+
+def run_async(label, make_queue, batch):
+    """Time PRODUCERS tasks feeding CONSUMERS tasks through a queue."""
+
+    async def scenario():
+        the_queue = make_queue()
+
+        async def produce():
+            for k in range(PER_PRODUCER):
+                await the_queue.put(k)
+
+        async def consume():
+            while True:
+                if batch:
+                    elements = await the_queue.get_many(batch)
+                else:
+                    elements = [await the_queue.get()]
+                finished = elements.count(DONE)
+                if finished:
+                    for _ in range(finished - 1):
+                        await the_queue.put(DONE)
+                    break
+
+        consumers = [asyncio.ensure_future(consume()) for _ in range(CONSUMERS)]
+        await asyncio.gather(*[produce() for _ in range(PRODUCERS)])
+        for _ in consumers:
+            await the_queue.put(DONE)
+        await asyncio.gather(*consumers)
+
+    start = time.perf_counter()
+    asyncio.run(scenario())
+    elapsed = time.perf_counter() - start
+    print('  %-32s %10.0f elements/s' % (label, PRODUCERS * PER_PRODUCER / elapsed))
+
+
+def main():
+    """Run the benchmark."""
+    print('%d producers, %d consumers, %d elements' %
+          (PRODUCERS, CONSUMERS, PRODUCERS * PER_PRODUCER))
+    run('queue.Queue get', queue.Queue(), 0)
+    run('BlockingQueue get', BlockingQueue(), 0)
+    run('BlockingQueue get_many(64)', BlockingQueue(), 64)
+    run_async('asyncio.Queue get', lambda: asyncio.Queue(maxsize=1000), 0)
+    run_async('AsyncQueue get', lambda: AsyncQueue(maxsize=1000), 0)
+    run_async('AsyncQueue get_many(64)', lambda: AsyncQueue(maxsize=1000), 64)
+
+
+if __name__ == '__main__':
+    main()
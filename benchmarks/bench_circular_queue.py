@@ -0,0 +1,71 @@
+"""Benchmark CircularQueue rotation and bulk operations.
+
+Simulates a round-robin scheduler that skips k entries at a time, calling
+rotate() k times versus rotate(k), and compares bulk enqueue/dequeue with
+per-element calls.
+
+Run from the repository root:  python benchmarks/bench_circular_queue.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dloud_ads.circular_queue import CircularQueue
+
+SIZE = 1000
+STEPS = 2000
+ELEMENTS = 100000
+
+
+def rotate_stepwise(queue, k):
+    """Skip k entries STEPS times with single-step rotations."""
+    for _ in range(STEPS):
+        for _ in range(k % len(queue)):
+            queue.rotate()
+
+
+def rotate_by_k(queue, k):
+    """Skip k entries STEPS times with rotate(k)."""
+    for _ in range(STEPS):
+        queue.rotate(k)
+
+
+def per_element():
+    """Fill and drain a queue one element at a time."""
+    queue = CircularQueue()
+    for k in range(ELEMENTS):
+        queue.enqueue(k)
+    for _ in range(ELEMENTS):
+        queue.dequeue()
+
+
+def batched():
+    """Fill and drain a queue with enqueue_many and dequeue_many."""
+    queue = CircularQueue()
+    queue.enqueue_many(range(ELEMENTS))
+    queue.dequeue_many(ELEMENTS)
+
+
+def measure(label, stmt):
+    """Print the best of three timings of stmt."""
+    print('  %-28s %8.4f s' % (label, min(timeit.repeat(stmt, number=1, repeat=3))))
+
+
+def main():
+    """Run the benchmark."""
+    queue = CircularQueue()
+    queue.enqueue_many(range(SIZE))
+    print('%d rotations of a %d-element queue' % (STEPS, SIZE))
+    for k in (1, 10, 500, -10):
+        measure('rotate() x %d' % (k % SIZE), lambda: rotate_stepwise(queue, k))
+        measure('rotate(%d)' % k, lambda: rotate_by_k(queue, k))
+    print('%d elements in and out' % ELEMENTS)
+    measure('enqueue/dequeue', per_element)
+    measure('enqueue_many/dequeue_many', batched)
+
+
+if __name__ == '__main__':
+    main()
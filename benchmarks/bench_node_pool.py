@@ -0,0 +1,81 @@
+"""Benchmark node pooling in the linked containers.
+
+For each container, runs steady-state fill/drain cycles with and without
+a node pool, and reports the peak memory tracemalloc sees during a cycle
+(with a warm pool, what remains is the integer elements themselves), the
+garbage collections the cycles triggered, and the elapsed time.
+Run from the repository root:  python benchmarks/bench_node_pool.py
+"""
+
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dloud_ads.circular_queue import CircularQueue
+from dloud_ads.linked_deque import LinkedDeque
+from dloud_ads.linked_queue import LinkedQueue
+from dloud_ads.linked_stack import LinkedStack
+
+BATCH = 1000
+CYCLES = 1000
+
+
+def cycle_stack(container):
+    """Push and pop one batch."""
+    for k in range(BATCH):
+        container.push(k)
+    for _ in range(BATCH):
+        container.pop()
+
+
+def cycle_queue(container):
+    """Enqueue and dequeue one batch."""
+    for k in range(BATCH):
+        container.enqueue(k)
+    for _ in range(BATCH):
+        container.dequeue()
+
+
+def cycle_deque(container):
+    """Insert and delete one batch at the back of a deque."""
+    for k in range(BATCH):
+        container.insert_last(k)
+    for _ in range(BATCH):
+        container.delete_first()
+
+
+def run(label, container, cycle):
+    """Report allocation and timing figures for one configuration."""
+    cycle(container)                # warm the pool
+    gc.collect()
+    collections = gc.get_stats()[0]['collections']
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    cycle(container)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    start = time.perf_counter()
+    for _ in range(CYCLES):
+        cycle(container)
+    elapsed = time.perf_counter() - start
+    collections = gc.get_stats()[0]['collections'] - collections
+    print('  %-24s peak %9d bytes/cycle %6d gen0 GCs %7.3f s' %
+          (label, peak, collections, elapsed))
+
+
+def main():
+    """Run the benchmark."""
+    print('%d cycles of %d inserts then %d removals' % (CYCLES, BATCH, BATCH))
+    for cls, cycle in ((LinkedStack, cycle_stack), (LinkedQueue, cycle_queue),
+                       (CircularQueue, cycle_queue), (LinkedDeque, cycle_deque)):
+        print(cls.__name__)
+        run('no pool', cls(), cycle)
+        run('pool_size=%d' % BATCH, cls(pool_size=BATCH), cycle)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""Benchmark PersistentQueue throughput at different sync levels.
+
+Enqueues and then dequeues 64-byte records one at a time and in batches,
+flushing the file to disk after every call, every 100 calls, or only on
+close.
+
+Run from the repository root:  python benchmarks/bench_persistent_queue.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dloud_ads.persistent_queue import PersistentQueue
+
+RECORD = b'x' * 64
+BATCH = 1000
+
+
+def run(label, directory, count, sync_every, batch):
+    """Print the record throughput of one enqueue/dequeue cycle."""
+    path = os.path.join(directory, 'queue.dat')
+    queue = PersistentQueue(path, record_size=64, sync_every=sync_every)
+    start = time.perf_counter()
+    if batch:
+        records = [RECORD] * batch
+        for _ in range(count // batch):
+            queue.enqueue_many(records)
+        for _ in range(count // batch):
+            queue.dequeue_many(batch)
+    else:
+        for _ in range(count):
+            queue.enqueue(RECORD)
+        for _ in range(count):
+            queue.dequeue()
+    queue.close()
+    elapsed = time.perf_counter() - start
+    os.remove(path)
+    print('  %-40s %12.0f records/s' % (label, 2 * count / elapsed))
+
+
+def main():
+    """Run the benchmark."""
+    with tempfile.TemporaryDirectory(dir='.') as directory:
+        for sync_every, single, batched in ((1, 2000, 200000), (100, 100000, 200000),
+                                            (0, 200000, 200000)):
+            level = 'sync every %d' % sync_every if sync_every else 'sync on close'
+            run('%s, one at a time' % level, directory, single, sync_every, 0)
+            run('%s, batches of %d' % (level, BATCH), directory, batched, sync_every, BATCH)
+
+
+if __name__ == '__main__':
+    main()
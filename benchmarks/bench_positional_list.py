@@ -0,0 +1,52 @@
+"""Micro-benchmark PositionalList iteration.
+
+Compares the node-walking generators with the former Position-based walk
+that called first() and after() for every element.
+Run from the repository root:  python benchmarks/bench_positional_list.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dloud_ads.positional_list import PositionalList
+
+
+def position_walk(the_list):
+    """Reference implementation of the former __iter__."""
+    cursor = the_list.first()
+    while cursor is not None:
+        yield cursor.element()
+        cursor = the_list.after(cursor)
+
+
+def consume(iterable):
+    """Exhaust an iterable."""
+    for _ in iterable:
+        pass
+
+
+def measure(label, func, count):
+    """Print the best per-element cost of func, which visits count elements."""
+    best = min(timeit.repeat(func, number=1, repeat=5))
+    print('  %-28s %8.1f ns/element' % (label, 1e9 * best / count))
+
+
+def main():
+    """Run the benchmark."""
+    size = 10 ** 6
+    the_list = PositionalList()
+    for k in range(size):
+        the_list.add_last(k)
+    print('PositionalList iteration (%d elements)' % size)
+    measure('first()/after() walk', lambda: consume(position_walk(the_list)), size)
+    measure('__iter__', lambda: consume(the_list), size)
+    measure('__reversed__', lambda: consume(reversed(the_list)), size)
+    measure('positions()', lambda: consume(the_list.positions()), size)
+    measure('iter_range()', lambda: consume(the_list.iter_range()), size)
+
+
+if __name__ == '__main__':
+    main()
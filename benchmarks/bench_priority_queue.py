@@ -0,0 +1,90 @@
+"""Benchmark the heap priority queues against heapq.
+
+Runs a decrease-key workload, as in Dijkstra's algorithm: every entry is
+added, random entries have their keys lowered, and the queue is drained.
+AdaptableHeapPriorityQueue updates entries in place through locators,
+while heapq pushes a new entry and skips stale ones lazily when popping.
+Also compares bulk construction with the bottom-up heapify.
+
+Run from the repository root:  python benchmarks/bench_priority_queue.py
+"""
+
+import heapq
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dloud_ads.adaptable_heap_priority_queue import AdaptableHeapPriorityQueue
+from dloud_ads.heap_priority_queue import HeapPriorityQueue
+
+ENTRIES = 100000
+UPDATES = 300000
+
+
+def make_workload():
+    """Return the initial keys and the (entry, decrease) updates."""
+    rng = random.Random(5)
+    keys = [rng.random() * ENTRIES for _ in range(ENTRIES)]
+    updates = [(rng.randrange(ENTRIES), rng.random()) for _ in range(UPDATES)]
+    return keys, updates
+
+
+def adaptable(keys, updates):
+    """Decrease keys in place through locators."""
+    queue = AdaptableHeapPriorityQueue()
+    current = list(keys)
+    locators = [queue.add(key, entry) for entry, key in enumerate(keys)]
+    for entry, decrease in updates:
+        current[entry] -= decrease
+        queue.update(locators[entry], current[entry])
+    while not queue.is_empty():
+        queue.remove_min()
+
+
+def lazy_heapq(keys, updates):
+    """Push a fresh entry per decrease and skip stale entries when popping."""
+    heap = []
+    current = list(keys)
+    for entry, key in enumerate(keys):
+        heapq.heappush(heap, (key, entry))
+    for entry, decrease in updates:
+        current[entry] -= decrease
+        heapq.heappush(heap, (current[entry], entry))
+    done = 0
+    while done < len(keys):
+        key, entry = heapq.heappop(heap)
+        if key == current[entry]:
+            current[entry] = None
+            done += 1
+
+
+def add_all(pairs):
+    """Build a HeapPriorityQueue one add at a time."""
+    queue = HeapPriorityQueue()
+    for key, value in pairs:
+        queue.add(key, value)
+
+
+def measure(label, stmt):
+    """Print the best of three timings of stmt."""
+    print('  %-40s %8.3f s' % (label, min(timeit.repeat(stmt, number=1, repeat=3))))
+
+
+def main():
+    """Run the benchmark."""
+    keys, updates = make_workload()
+    print('%d entries, %d decrease-key operations' % (ENTRIES, UPDATES))
+    measure('AdaptableHeapPriorityQueue.update', lambda: adaptable(keys, updates))
+    measure('heapq with lazy deletion', lambda: lazy_heapq(keys, updates))
+    pairs = [(key, entry) for entry, key in enumerate(keys)]
+    print('building from %d entries' % ENTRIES)
+    measure('HeapPriorityQueue(contents) heapify', lambda: HeapPriorityQueue(pairs))
+    measure('HeapPriorityQueue repeated add', lambda: add_all(pairs))
+    measure('heapq.heapify', lambda: heapq.heapify(list(pairs)))
+
+
+if __name__ == '__main__':
+    main()
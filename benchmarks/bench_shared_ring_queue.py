@@ -0,0 +1,104 @@
+"""Benchmark cross-process record handoff through SharedRingQueue.
+
+One producer process sends numeric records to the parent process, either
+pickled through multiprocessing.Queue or packed into the slots of a
+SharedRingQueue, one record at a time and in batches.
+Run from the repository root:  python benchmarks/bench_shared_ring_queue.py
+"""
+
+import multiprocessing
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dloud_ads.shared_ring_queue import SharedRingQueue
+
+RECORDS = 1000000
+PICKLED_RECORDS = 100000
+BATCH = 256
+
+
+def produce_pickled(the_queue, count):
+    """Send count records through a multiprocessing.Queue."""
+    for k in range(count):
+        the_queue.put((k, 0.5))
+    the_queue.put(None)
+
+
+def produce_shared(name, count, batch):
+    """Send count records through the SharedRingQueue called name."""
+    the_queue = SharedRingQueue.attach(name)
+    sent = 0
+    if batch:
+        while sent < count:
+            sent += the_queue.enqueue_many(
+                (k, 0.5) for k in range(sent, min(sent + batch, count)))
+    else:
+        record = [0, 0.5]
+        while sent < count:
+            record[0] = sent
+            try:
+                the_queue.enqueue(record)
+                sent += 1
+            except ValueError:
+                pass
+    the_queue.close()
+
+
+def report(label, count, elapsed):
+    """Print the throughput of one run."""
+    print('  %-34s %12.0f records/s' % (label, count / elapsed))
+
+
+def run_pickled(context):
+    """Time PICKLED_RECORDS records through multiprocessing.Queue."""
+    the_queue = context.Queue()
+    producer = context.Process(target=produce_pickled, args=(the_queue, PICKLED_RECORDS))
+    start = time.perf_counter()
+    producer.start()
+    while the_queue.get() is not None:
+        pass
+    elapsed = time.perf_counter() - start
+    producer.join()
+    report('multiprocessing.Queue', PICKLED_RECORDS, elapsed)
+
+
+def run_shared(context, batch):
+    """Time RECORDS records through a SharedRingQueue."""
+    the_queue = SharedRingQueue(capacity=4096, record_format='<qd')
+    producer = context.Process(target=produce_shared,
+                               args=(the_queue.name(), RECORDS, batch))
+    start = time.perf_counter()
+    producer.start()
+    received = 0
+    if batch:
+        while received < RECORDS:
+            received += len(the_queue.dequeue_many(batch))
+    else:
+        while received < RECORDS:
+            try:
+                the_queue.dequeue()
+                received += 1
+            except ValueError:
+                pass
+    elapsed = time.perf_counter() - start
+    producer.join()
+    the_queue.close()
+    the_queue.unlink()
+    label = 'SharedRingQueue batch %d' % batch if batch else 'SharedRingQueue one at a time'
+    report(label, RECORDS, elapsed)
+
+
+def main():
+    """Run the benchmark."""
+    context = multiprocessing.get_context('spawn')
+    print('one producer process, (int64, float64) records')
+    run_pickled(context)
+    run_shared(context, 0)
+    run_shared(context, BATCH)
+
+
+if __name__ == '__main__':
+    main()
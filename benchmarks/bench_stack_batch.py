@@ -0,0 +1,55 @@
+"""Benchmark batched push_many/pop_many against per-element stack calls.
+
+Simulates a DFS-style workload that pushes whole neighbour lists and pops
+them back in batches, and reports the cost per element.
+
+Run from the repository root:  python benchmarks/bench_stack_batch.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dloud_ads.array_stack import ArrayStack
+from dloud_ads.linked_stack import LinkedStack
+
+ROUNDS = 20000
+NEIGHBOURS = list(range(50))
+
+
+def looping(stack):
+    """Push and pop each neighbour list one element at a time."""
+    for _ in range(ROUNDS):
+        for element in NEIGHBOURS:
+            stack.push(element)
+        for _ in range(len(NEIGHBOURS)):
+            stack.pop()
+
+
+def batched(stack):
+    """Push and pop each neighbour list with push_many and pop_many."""
+    for _ in range(ROUNDS):
+        stack.push_many(NEIGHBOURS)
+        stack.pop_many(len(NEIGHBOURS))
+
+
+def measure(label, stmt):
+    """Print the best of three timings of stmt, per element moved."""
+    best = min(timeit.repeat(stmt, number=1, repeat=3))
+    print('  %-44s %8.1f ns/element' % (label, 1e9 * best / (ROUNDS * len(NEIGHBOURS))))
+
+
+def main():
+    """Run the benchmark."""
+    print('%d rounds of %d pushes and pops' % (ROUNDS, len(NEIGHBOURS)))
+    for name, make in (('ArrayStack', ArrayStack),
+                       ('LinkedStack', LinkedStack),
+                       ('LinkedStack(pool_size=64)', lambda: LinkedStack(pool_size=64))):
+        measure('%s push/pop' % name, lambda: looping(make()))
+        measure('%s push_many/pop_many' % name, lambda: batched(make()))
+
+
+if __name__ == '__main__':
+    main()
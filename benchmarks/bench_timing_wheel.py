@@ -0,0 +1,89 @@
+"""Benchmark TimingWheel against a heapq timer queue at one million timers.
+
+Arms one million timeouts, cancels half of them (as when connections
+close before timing out), then advances time until every timer expired.
+The heapq baseline marks cancelled entries and skips them when popping.
+
+Run from the repository root:  python benchmarks/bench_timing_wheel.py
+"""
+
+import heapq
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dloud_ads.timing_wheel import TimingWheel
+
+TIMERS = 1000000
+MAX_DELAY = 60000
+
+
+def timed(label, action):
+    """Print the time taken by action() and return its result."""
+    start = time.perf_counter()
+    result = action()
+    print('  %-28s %8.3f s' % (label, time.perf_counter() - start))
+    return result
+
+
+def run_wheel(delays, cancels):
+    """Arm, cancel and expire the timers on a TimingWheel."""
+    wheel = TimingWheel()
+    timers = timed('wheel schedule', lambda: [wheel.schedule(delay, k)
+                                              for k, delay in enumerate(delays)])
+
+    def cancel():
+        for k in cancels:
+            wheel.cancel(timers[k])
+
+    timed('wheel cancel', cancel)
+    expired = timed('wheel advance', lambda: wheel.advance(MAX_DELAY + 1))
+    return len(expired)
+
+
+def run_heap(delays, cancels):
+    """Arm, cancel and expire the timers on a heapq list."""
+    heap = []
+
+    def schedule():
+        entries = []
+        for k, delay in enumerate(delays):
+            entry = [delay, k, True]
+            heapq.heappush(heap, entry)
+            entries.append(entry)
+        return entries
+
+    entries = timed('heapq schedule', schedule)
+
+    def cancel():
+        for k in cancels:
+            entries[k][2] = False
+
+    timed('heapq cancel', cancel)
+
+    def advance():
+        expired = []
+        for now in range(1, MAX_DELAY + 2):
+            while heap and heap[0][0] <= now:
+                _, k, active = heapq.heappop(heap)
+                if active:
+                    expired.append(k)
+        return expired
+
+    return len(timed('heapq advance', advance))
+
+
+def main():
+    """Run the benchmark."""
+    rng = random.Random(9)
+    delays = [rng.randrange(1, MAX_DELAY) for _ in range(TIMERS)]
+    cancels = rng.sample(range(TIMERS), TIMERS // 2)
+    print('%d timers over %d ticks, %d cancelled' % (TIMERS, MAX_DELAY, len(cancels)))
+    assert run_wheel(delays, cancels) == run_heap(delays, cancels) == TIMERS - len(cancels)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""Benchmark bulk LinkedBinaryTree constructors against per-node insertion.
+
+Run from the repository root:  python benchmarks/bench_tree_construction.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dloud_ads.linked_binary_tree import LinkedBinaryTree
+
+
+def incremental_level_order(seq):
+    """Build a complete tree with one _add_left/_add_right call per node."""
+    tree = LinkedBinaryTree()
+    if not seq:
+        return tree
+    positions = [tree._add_root(seq[0])]
+    for index in range(1, len(seq)):
+        parent = positions[(index - 1) // 2]
+        if index % 2 == 1:
+            positions.append(tree._add_left(parent, seq[index]))
+        else:
+            positions.append(tree._add_right(parent, seq[index]))
+    return tree
+
+
+def measure(label, func, count):
+    """Print the best time of func, which builds count nodes."""
+    best = min(timeit.repeat(func, number=1, repeat=3))
+    print('  %-28s %8.3f s %12.0f nodes/s' % (label, best, count / best))
+
+
+def main():
+    """Run the benchmark."""
+    size = 10 ** 6
+    seq = list(range(size))
+    tree = LinkedBinaryTree.from_sorted(seq)
+    pre = list(tree.iter_elements('preorder'))
+    ino = list(tree.iter_elements('inorder'))
+    del tree
+
+    print('LinkedBinaryTree construction (%d nodes)' % size)
+    measure('_add_left/_add_right', lambda: incremental_level_order(seq), size)
+    measure('from_level_order', lambda: LinkedBinaryTree.from_level_order(seq), size)
+    measure('from_sorted', lambda: LinkedBinaryTree.from_sorted(seq), size)
+    measure('from_preorder_inorder',
+            lambda: LinkedBinaryTree.from_preorder_inorder(pre, ino), size)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""Benchmark iterative tree traversals against the former recursive generators.
+
+Run from the repository root:  python benchmarks/bench_tree_traversal.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dloud_ads.linked_binary_tree import LinkedBinaryTree
+
+
+def recursive_preorder(tree, pos):
+    """Reference implementation of the recursive preorder generator."""
+    yield pos
+    for child in tree.children(pos):
+        for other in recursive_preorder(tree, child):
+            yield other
+
+
+def recursive_postorder(tree, pos):
+    """Reference implementation of the recursive postorder generator."""
+    for child in tree.children(pos):
+        for other in recursive_postorder(tree, child):
+            yield other
+    yield pos
+
+
+def recursive_inorder(tree, pos):
+    """Reference implementation of the recursive inorder generator."""
+    if tree.left(pos) is not None:
+        for other in recursive_inorder(tree, tree.left(pos)):
+            yield other
+    yield pos
+    if tree.right(pos) is not None:
+        for other in recursive_inorder(tree, tree.right(pos)):
+            yield other
+
+
+def balanced_tree(size):
+    """Return a complete binary tree with the given number of nodes."""
+    tree = LinkedBinaryTree()
+    level = [tree._add_root(0)]
+    count = 1
+    while count < size:
+        fringe = []
+        for pos in level:
+            for add in (tree._add_left, tree._add_right):
+                if count < size:
+                    fringe.append(add(pos, count))
+                    count += 1
+        level = fringe
+    return tree
+
+
+def chain_tree(depth):
+    """Return a degenerate tree in which every node has a single left child."""
+    tree = LinkedBinaryTree()
+    walk = tree._add_root(0)
+    for k in range(1, depth):
+        walk = tree._add_left(walk, k)
+    return tree
+
+
+def consume(iterable):
+    """Exhaust an iterable."""
+    for _ in iterable:
+        pass
+
+
+def measure(label, func, repeat=3):
+    """Print the best of several timings for func."""
+    best = min(timeit.repeat(func, number=1, repeat=repeat))
+    print('%-40s %10.4f s' % (label, best))
+
+
+def compare(name, tree):
+    """Time recursive and iterative traversals of one tree."""
+    root = tree.root()
+    print('%s (%d nodes)' % (name, len(tree)))
+    measure('  preorder  recursive', lambda: consume(recursive_preorder(tree, root)))
+    measure('  preorder  iterative', lambda: consume(tree.preorder()))
+    measure('  postorder recursive', lambda: consume(recursive_postorder(tree, root)))
+    measure('  postorder iterative', lambda: consume(tree.postorder()))
+    measure('  inorder   recursive', lambda: consume(recursive_inorder(tree, root)))
+    measure('  inorder   iterative', lambda: consume(tree.inorder()))
+    measure('  elements via positions',
+            lambda: consume(p.element() for p in tree.inorder()))
+    measure('  elements via iter_elements', lambda: consume(tree.iter_elements()))
+
+
+def main():
+    """Run the benchmark."""
+    compare('balanced', balanced_tree(2 ** 17 - 1))
+    compare('degenerate', chain_tree(900))
+
+    deep = chain_tree(10 ** 6)
+    print('degenerate (%d nodes, iterative only)' % len(deep))
+    measure('  preorder  iterative', lambda: consume(deep.preorder()), repeat=1)
+    measure('  postorder iterative', lambda: consume(deep.postorder()), repeat=1)
+    measure('  inorder   iterative', lambda: consume(deep.inorder()), repeat=1)
+    measure('  breadthfirst', lambda: consume(deep.breadthfirst()), repeat=1)
+
+
+if __name__ == '__main__':
+    main()
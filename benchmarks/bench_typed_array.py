@@ -0,0 +1,116 @@
+"""Benchmark TypedArrayStack and TypedArrayQueue against the list-backed classes.
+
+Compares the memory used to hold float elements, and the time to push
+and pop them one at a time or in batches.
+
+Run from the repository root:  python benchmarks/bench_typed_array.py
+"""
+
+import os
+import sys
+import timeit
+import tracemalloc
+from array import array
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dloud_ads.array_queue import ArrayQueue
+from dloud_ads.array_stack import ArrayStack
+from dloud_ads.typed_array_queue import TypedArrayQueue
+from dloud_ads.typed_array_stack import TypedArrayStack
+
+SIZE = 1000000
+BATCH = 1000
+
+
+def traced_bytes(fill):
+    """Return the bytes allocated by fill() and still held when it returns."""
+    tracemalloc.start()
+    container = fill()
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del container
+    return used
+
+
+def stack_cycle(stack):
+    """Push and pop SIZE floats one at a time."""
+    for k in range(SIZE):
+        stack.push(k * 0.5)
+    for _ in range(SIZE):
+        stack.pop()
+
+
+def queue_cycle(queue):
+    """Enqueue and dequeue SIZE floats one at a time."""
+    for k in range(SIZE):
+        queue.enqueue(k * 0.5)
+    for _ in range(SIZE):
+        queue.dequeue()
+
+
+def typed_batches(values, push, pop):
+    """Move SIZE floats in and out in arrays of BATCH elements."""
+    for start in range(0, SIZE, BATCH):
+        push(values[start:start + BATCH])
+    for _ in range(SIZE // BATCH):
+        pop(BATCH)
+
+
+def measure(label, stmt):
+    """Print the best of three timings of stmt."""
+    print('  %-42s %8.3f s' % (label, min(timeit.repeat(stmt, number=1, repeat=3))))
+
+
+def main():
+    """Run the benchmark."""
+    values = array('d', (k * 0.5 for k in range(SIZE)))
+    boxed = values.tolist()
+
+    def fill_list_stack():
+        stack = ArrayStack()
+        for value in boxed:
+            stack.push(value * 1.0)
+        return stack
+
+    def fill_typed_stack():
+        stack = TypedArrayStack('d')
+        stack.push_many(values)
+        return stack
+
+    def fill_list_queue():
+        queue = ArrayQueue()
+        queue.enqueue_many(value * 1.0 for value in boxed)
+        return queue
+
+    def fill_typed_queue():
+        queue = TypedArrayQueue('d')
+        queue.enqueue_many(values)
+        return queue
+
+    print('memory held by %d floats' % SIZE)
+    for label, fill in (('ArrayStack', fill_list_stack),
+                        ('TypedArrayStack', fill_typed_stack),
+                        ('ArrayQueue', fill_list_queue),
+                        ('TypedArrayQueue', fill_typed_queue)):
+        print('  %-42s %8.1f bytes/element' % (label, traced_bytes(fill) / SIZE))
+
+    print('push and pop %d floats' % SIZE)
+    measure('ArrayStack push/pop', lambda: stack_cycle(ArrayStack()))
+    measure('TypedArrayStack push/pop', lambda: stack_cycle(TypedArrayStack('d')))
+    typed_stack = TypedArrayStack('d')
+    measure('TypedArrayStack push_many/pop_many',
+            lambda: typed_batches(values, typed_stack.push_many, typed_stack.pop_many))
+    measure('ArrayQueue enqueue/dequeue', lambda: queue_cycle(ArrayQueue()))
+    measure('TypedArrayQueue enqueue/dequeue', lambda: queue_cycle(TypedArrayQueue('d')))
+    list_queue = ArrayQueue()
+    measure('ArrayQueue enqueue_many/dequeue_many',
+            lambda: typed_batches(boxed, list_queue.enqueue_many, list_queue.dequeue_many))
+    typed_queue = TypedArrayQueue('d')
+    measure('TypedArrayQueue enqueue_many/dequeue_many',
+            lambda: typed_batches(values, typed_queue.enqueue_many,
+                                  typed_queue.dequeue_many))
+
+
+if __name__ == '__main__':
+    main()
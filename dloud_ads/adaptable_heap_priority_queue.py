@@ -0,0 +1,90 @@
+"""A locator-based priority queue implemented with a binary heap."""
+
+from .heap_priority_queue import HeapPriorityQueue
+
+_KEEP = object()    # marks a value left unchanged by update
+
+class AdaptableHeapPriorityQueue(HeapPriorityQueue):
+    """A locator-based priority queue implemented with a binary heap.
+
+    add returns a locator token that records the current index of its item
+    in the heap, so the item can later be updated or removed in O(log n)
+    time.
+    """
+
+    class Locator(HeapPriorityQueue._Item):
+        """Token for locating an entry of the priority queue."""
+        __slots__ = '_index',
+
+        def __init__(self, key, value, j):
+            HeapPriorityQueue._Item.__init__(self, key, value)
+            self._index = j
+
+    def _make_item(self, key, value):
+        """Return a new locator for key and value."""
+        return self.Locator(key, value, len(self._data))
+
+    def _place(self, item, j):
+        """Store item at index j of the heap and record the index in it."""
+        self._data[j] = item
+        item._index = j
+
+    def _validate(self, loc):
+        """Return the index of locator loc, if it is valid for this queue.
+
+        Raise TypeError if loc is not a locator, or ValueError if it does
+        not belong to this queue (for instance because it was removed).
+        """
+        if not isinstance(loc, self.Locator):
+            raise TypeError('loc must be proper Locator type')
+        j = loc._index
+        if not (0 <= j < len(self._data) and self._data[j] is loc):
+            raise ValueError('Invalid locator')
+        return j
+
+    def _bubble(self, j):
+        """Restore the heap property around index j after its key changed."""
+        if j > 0 and self._data[j] < self._data[(j - 1) // 2]:
+            self._upheap(j)
+        else:
+            self._downheap(j)
+
+    def add(self, key, value):
+        """Add a key-value pair and return the locator of the new entry."""
+        token = self._make_item(key, value)
+        self._data.append(token)
+        self._upheap(len(self._data) - 1)
+        return token
+
+    def update(self, loc, newkey, newval=_KEEP):
+        """Update the key (and optionally the value) of the entry at locator loc.
+
+        Raise TypeError or ValueError if loc is not a valid locator.
+        """
+        j = self._validate(loc)
+        loc._key = newkey
+        if newval is not _KEEP:
+            loc._value = newval
+        self._bubble(j)
+
+    def remove(self, loc):
+        """Remove and return the (k,v) pair identified by locator loc.
+
+        Raise TypeError or ValueError if loc is not a valid locator.
+        """
+        j = self._validate(loc)
+        last = self._data.pop()
+        if last is not loc:
+            self._place(last, j)
+            self._bubble(j)
+        loc._index = -1
+        return (loc._key, loc._value)
+
+    def remove_min(self):
+        """Remove and return (k,v) tuple with minimum key.
+
+        Raise ValueError exception if the priority queue is empty.
+        """
+        if self.is_empty():
+            raise ValueError('Priority queue is empty')
+        return self.remove(self._data[0])
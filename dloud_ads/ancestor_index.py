@@ -0,0 +1,140 @@
+"""Precomputed index answering ancestor queries on a tree."""
+
+from array import array
+from bisect import bisect_right
+
+class AncestorIndex:
+    """Precomputed index answering ancestor queries on a tree.
+
+    The index numbers the positions of any Tree in preorder during a single
+    iterative pass, recording the depth and parent of each and the last
+    rank of its subtree, so a position is an ancestor of another exactly
+    when the other's rank falls within its subtree range.  The lowest
+    common ancestor of two positions is the parent of the shallowest
+    position ranked after the first and up to the second, found in O(1)
+    time with a sparse table of range minima over the depths.
+
+    Building takes O(n log n) time and space.  Any change to the shape of
+    the tree invalidates the index: queries then raise ValueError until
+    rebuild is called.
+    """
+
+    def __init__(self, tree):
+        """Build the index for the current shape of tree."""
+        self._tree = tree
+        self.rebuild()
+
+    def rebuild(self):
+        """Recompute the index for the current shape of the tree."""
+        tree = self._tree
+        self._version = tree._version
+        self._positions = []
+        self._parents = array('l')
+        self._depths = array('l')
+        if not tree.is_empty():
+            stack = [(tree.root(), -1)]
+            while stack:
+                pos, parent = stack.pop()
+                rank = len(self._positions)
+                self._positions.append(pos)
+                self._parents.append(parent)
+                self._depths.append(self._depths[parent] + 1 if parent >= 0 else 0)
+                children = list(tree.children(pos))
+                children.reverse()
+                stack.extend((child, rank) for child in children)
+        count = len(self._positions)
+        self._ranks = {pos: rank for rank, pos in enumerate(self._positions)}
+        self._last = array('l', range(count))
+        for rank in range(count - 1, 0, -1):
+            parent = self._parents[rank]
+            if self._last[rank] > self._last[parent]:
+                self._last[parent] = self._last[rank]
+        self._by_depth = []
+        for rank in range(count):
+            depth = self._depths[rank]
+            if depth == len(self._by_depth):
+                self._by_depth.append(array('l'))
+            self._by_depth[depth].append(rank)
+        self._build_sparse_table()
+
+    def _build_sparse_table(self):
+        """Build rows of the ranks of minimum depth over windows of 2**j ranks."""
+        depths = self._depths
+        row = array('l', range(len(depths)))
+        self._table = [row]
+        half = 1
+        while 2 * half <= len(depths):
+            row = array('l', (a if depths[a] <= depths[b] else b
+                              for a, b in zip(row, row[half:])))
+            self._table.append(row)
+            half *= 2
+
+    def is_valid(self):
+        """Return True if the tree has not changed shape since the index was built."""
+        return self._tree._version == self._version
+
+    def _rank(self, pos):
+        """Return the preorder rank of Position p.
+
+        Raise ValueError if the index is stale or p is not in the indexed tree.
+        """
+        if self._tree._version != self._version:
+            raise ValueError('tree has changed since the index was built')
+        rank = self._ranks.get(pos)
+        if rank is None:
+            raise ValueError('p does not belong to the indexed tree')
+        return rank
+
+    def _shallowest(self, start, stop):
+        """Return the rank of minimum depth among ranks start to stop inclusive."""
+        level = (stop - start + 1).bit_length() - 1
+        row = self._table[level]
+        first, second = row[start], row[stop - (1 << level) + 1]
+        return first if self._depths[first] <= self._depths[second] else second
+
+    def _lca_rank(self, rank1, rank2):
+        """Return the rank of the lowest common ancestor of two ranks."""
+        if rank1 > rank2:
+            rank1, rank2 = rank2, rank1
+        if rank2 <= self._last[rank1]:
+            return rank1
+        return self._parents[self._shallowest(rank1 + 1, rank2)]
+
+    def __len__(self):
+        """Return the number of positions indexed."""
+        return len(self._positions)
+
+    def depth(self, pos):
+        """Return the depth of Position p in O(1) time."""
+        return self._depths[self._rank(pos)]
+
+    def is_ancestor(self, pos1, pos2):
+        """Return True if Position p is q or an ancestor of q, in O(1) time."""
+        rank1 = self._rank(pos1)
+        return rank1 <= self._rank(pos2) <= self._last[rank1]
+
+    def lca(self, pos1, pos2):
+        """Return the lowest common ancestor of Positions p and q, in O(1) time."""
+        return self._positions[self._lca_rank(self._rank(pos1), self._rank(pos2))]
+
+    def distance(self, pos1, pos2):
+        """Return the number of edges between Positions p and q, in O(1) time."""
+        rank1 = self._rank(pos1)
+        rank2 = self._rank(pos2)
+        top = self._lca_rank(rank1, rank2)
+        return self._depths[rank1] + self._depths[rank2] - 2 * self._depths[top]
+
+    def kth_ancestor(self, pos, k):
+        """Return the ancestor k levels above Position p (or None if p is
+        shallower than k), in O(log n) time.
+
+        Raise ValueError if k is negative.
+        """
+        if k < 0:
+            raise ValueError('k must be non-negative')
+        rank = self._rank(pos)
+        depth = self._depths[rank] - k
+        if depth < 0:
+            return None
+        ranks = self._by_depth[depth]
+        return self._positions[ranks[bisect_right(ranks, rank) - 1]]
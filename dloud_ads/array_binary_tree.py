@@ -0,0 +1,302 @@
+"""Array-based (implicit) representation of a binary tree structure."""
+
+from .binary_tree import BinaryTree
+
+class ArrayBinaryTree(BinaryTree):
+    """Array-based representation of a binary tree structure.
+
+    Elements are stored in a single Python list, with the children of the
+    element at index i stored at indices 2i+1 and 2i+2.  Positions wrap an
+    integer index, so no per-node objects are kept.  This representation is
+    compact for complete or nearly complete trees, but wastes space on
+    sparse, deep trees.
+    """
+
+    _EMPTY = object()       # marker for an unused slot of the list
+
+    class Position(BinaryTree.Position):
+        """An abstraction representing the location of a single element."""
+        __slots__ = '_container', '_index'
+
+        def __init__(self, container, index):
+            """Constructor should not be invoked by user."""
+            self._container = container
+            self._index = index
+
+        def element(self):
+            """Return the element stored at this Position."""
+            return self._container._data[self._index]
+
+        def __eq__(self, other):
+            """Return True if other is a Position representing the same
+            location."""
+            return (type(other) is type(self) and
+                    other._container is self._container and
+                    other._index == self._index)
+
+        def __hash__(self):
+            """Return a hash value based on the index of the slot."""
+            return hash(self._index)
+
+    _INDEX_WALKS = {
+        'preorder': '_preorder_indices',
+        'postorder': '_postorder_indices',
+        'inorder': '_inorder_indices',
+    }
+
+    def _validate(self, pos):
+        """Return associated index, if position is valid."""
+        if not isinstance(pos, self.Position):
+            raise TypeError('p must be proper Position type')
+        if pos._container is not self:
+            raise ValueError('p does not belong to this container')
+        if not self._occupied(pos._index):
+            raise ValueError('p is no longer valid')
+        return pos._index
+
+    def _occupied(self, index):
+        """Return True if the slot at index stores an element."""
+        return index < len(self._data) and self._data[index] is not self._EMPTY
+
+    def _make_position(self, index):
+        """Return Position instance for given index (or None if slot unused)."""
+        return self.Position(self, index) if self._occupied(index) else None
+
+    def __init__(self):
+        """Create an initially empty binary tree."""
+        self._data = []
+        self._size = 0
+        self._version = 0
+
+    def __len__(self):
+        """Return the total number of elements in the tree."""
+        return self._size
+
+    def root(self):
+        """Return the root Position of the tree (or None if tree is empty)."""
+        return self._make_position(0)
+
+    def parent(self, pos):
+        """Return the Position of p's parent (or None if p is root)."""
+        index = self._validate(pos)
+        if index == 0:
+            return None
+        return self._make_position((index - 1) // 2)
+
+    def left(self, pos):
+        """Return the Position of p's left child (or None if no left child)."""
+        return self._make_position(2 * self._validate(pos) + 1)
+
+    def right(self, pos):
+        """Return the Position of p's right child (or None if no right child)"""
+        return self._make_position(2 * self._validate(pos) + 2)
+
+    def num_children(self, pos):
+        """Return the number of children of Position p."""
+        index = self._validate(pos)
+        return int(self._occupied(2 * index + 1)) + int(self._occupied(2 * index + 2))
+
+    def children(self, pos):
+        """Generate an iteration of Positions representing p's children."""
+        index = self._validate(pos)
+        if self._occupied(2 * index + 1):
+            yield self.Position(self, 2 * index + 1)
+        if self._occupied(2 * index + 2):
+            yield self.Position(self, 2 * index + 2)
+
+    def depth(self, pos):
+        """Return the number of levels separating Position p from the root."""
+        return (self._validate(pos) + 1).bit_length() - 1
+
+    def _place(self, index, elem):
+        """Store element e at the unused slot index, growing the list if needed."""
+        if index >= len(self._data):
+            self._data.extend([self._EMPTY] * (index + 1 - len(self._data)))
+        self._data[index] = elem
+        self._size += 1
+        self._version += 1
+        return self.Position(self, index)
+
+    def _add_root(self, elem):
+        """Place element e at the root of an empty tree and return new Position.
+
+        Raise ValueError if tree nonempty.
+        """
+        if self._size > 0:
+            raise ValueError('Root exists')
+        return self._place(0, elem)
+
+    def _add_left(self, pos, elem):
+        """Create a new left child for Position p, storing element e.
+
+        Return the Position of new node.
+        Raise ValueError if Position p is invalid or p already has a left child.
+        """
+        index = 2 * self._validate(pos) + 1
+        if self._occupied(index):
+            raise ValueError('Left child exists')
+        return self._place(index, elem)
+
+    def _add_right(self, pos, elem):
+        """Create a new right child for Position pos, storing element elem.
+
+        Return the Position of new node.
+        Raise ValueError if Position pos is invalid or pos already has
+        a right child.
+        """
+        index = 2 * self._validate(pos) + 2
+        if self._occupied(index):
+            raise ValueError('Right child exists')
+        return self._place(index, elem)
+
+    def _replace(self, pos, elem):
+        """Replace the element at position p with e, and return old element."""
+        index = self._validate(pos)
+        old = self._data[index]
+        self._data[index] = elem
+        return old
+
+    def _delete(self, pos):
+        """Delete the leaf at Position p, and return its element.
+
+        Unlike the linked representation, an array-based tree cannot promote
+        a child in O(1) time, so only leaves may be deleted.
+        Raise ValueError if Position p is invalid or p has children.
+        """
+        index = self._validate(pos)
+        if self.num_children(pos) > 0:
+            raise ValueError('Position has children')
+        old = self._data[index]
+        self._data[index] = self._EMPTY
+        self._size -= 1
+        self._version += 1
+        while self._data and self._data[-1] is self._EMPTY:
+            self._data.pop()
+        return old
+
+    def __iter__(self):
+        """Generate an inorder iteration of the tree's elements."""
+        return self.iter_elements()
+
+    def iter_elements(self, order='inorder'):
+        """Generate an iteration of the tree's elements in the given order.
+
+        order is one of 'preorder', 'postorder', 'inorder' or 'breadthfirst'.
+        Raise ValueError if order is unknown.
+        """
+        data = self._data
+        return (data[index] for index in self._iter_indices(order))
+
+    def _iter_indices(self, order='inorder'):
+        """Return an iteration of the tree's occupied indices in the given order.
+
+        Raise ValueError if order is unknown.
+        """
+        if order == 'breadthfirst':
+            return self._breadthfirst_indices()
+        if order not in self._INDEX_WALKS:
+            raise ValueError('unknown traversal order: %r' % (order,))
+        if self._size == 0:
+            return iter(())
+        return getattr(self, self._INDEX_WALKS[order])(0)
+
+    def _subtree_preorder(self, pos):
+        """Generate a preorder iteration of positions in subtree rooted at p."""
+        for index in self._preorder_indices(self._validate(pos)):
+            yield self.Position(self, index)
+
+    def _subtree_postorder(self, pos):
+        """Generate a postorder iteration of positions in subtree rooted at p."""
+        for index in self._postorder_indices(self._validate(pos)):
+            yield self.Position(self, index)
+
+    def _subtree_inorder(self, pos):
+        """Generate an inorder iteration of positions in subtree rooted at p."""
+        for index in self._inorder_indices(self._validate(pos)):
+            yield self.Position(self, index)
+
+    def breadthfirst(self):
+        """Generate a breadth-first iteration of the positions of the tree."""
+        for index in self._breadthfirst_indices():
+            yield self.Position(self, index)
+
+    def _breadthfirst_indices(self):
+        """Generate the occupied indices in level order (a scan of the list)."""
+        empty = self._EMPTY
+        for index, elem in enumerate(self._data):
+            if elem is not empty:
+                yield index
+
+    def _preorder_indices(self, top):
+        """Generate a preorder iteration of the indices in subtree rooted at top.
+
+        Walks parent links via index arithmetic instead of keeping a stack.
+        """
+        data, empty = self._data, self._EMPTY
+        size = len(data)
+        index = top
+        while True:
+            yield index
+            child = 2 * index + 1
+            if child < size and data[child] is not empty:
+                index = child
+            elif child + 1 < size and data[child + 1] is not empty:
+                index = child + 1
+            else:
+                while index != top:
+                    if index % 2 == 1 and index + 1 < size and data[index + 1] is not empty:
+                        index += 1
+                        break
+                    index = (index - 1) // 2
+                else:
+                    return
+
+    def _postorder_indices(self, top):
+        """Generate a postorder iteration of the indices in subtree rooted at top.
+
+        Walks parent links via index arithmetic instead of keeping a stack.
+        """
+        data, empty = self._data, self._EMPTY
+        size = len(data)
+        index = top
+        while True:
+            while True:
+                child = 2 * index + 1
+                if child < size and data[child] is not empty:
+                    index = child
+                elif child + 1 < size and data[child + 1] is not empty:
+                    index = child + 1
+                else:
+                    break
+            while True:
+                yield index
+                if index == top:
+                    return
+                if index % 2 == 1 and index + 1 < size and data[index + 1] is not empty:
+                    index += 1
+                    break
+                index = (index - 1) // 2
+
+    def _inorder_indices(self, top):
+        """Generate an inorder iteration of the indices in subtree rooted at top.
+
+        Walks parent links via index arithmetic instead of keeping a stack.
+        """
+        data, empty = self._data, self._EMPTY
+        size = len(data)
+        index = top
+        while 2 * index + 1 < size and data[2 * index + 1] is not empty:
+            index = 2 * index + 1
+        while True:
+            yield index
+            child = 2 * index + 2
+            if child < size and data[child] is not empty:
+                index = child
+                while 2 * index + 1 < size and data[2 * index + 1] is not empty:
+                    index = 2 * index + 1
+            else:
+                while index != top and index % 2 == 0:
+                    index = (index - 1) // 2
+                if index == top:
+                    return
+                index = (index - 1) // 2
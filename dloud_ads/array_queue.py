@@ -2,14 +2,42 @@
 
 """
 class ArrayQueue:
-    """FIFO queue implementation using a Python list as underlying storage."""
-    DEFAULT_CAPACITY = 10
+    """FIFO queue implementation using a Python list as underlying storage.
 
-    def __init__(self):
-        """Create an empty queue."""
-        self._data = [None] * ArrayQueue.DEFAULT_CAPACITY
+    The capacity of the underlying list is always a power of two, so
+    circular indices are wrapped with a bit mask instead of a modulo.  The
+    list doubles when full and halves when less than a quarter full, but
+    never shrinks automatically below its minimum capacity.
+    """
+    DEFAULT_CAPACITY = 16       # must be a power of two
+    _VACANT = None              # stored in slots that hold no element
+
+    def __init__(self, capacity=None):
+        """Create an empty queue.
+
+        capacity is a hint for the number of elements the queue will hold;
+        it is rounded up to a power of two and becomes the minimum capacity.
+        """
+        if capacity is None:
+            capacity = ArrayQueue.DEFAULT_CAPACITY
+        self._data = self._slots(self._capacity_for(capacity))
         self._size = 0
         self._front = 0
+        self._min_capacity = len(self._data)
+
+    @staticmethod
+    def _capacity_for(count):
+        """Return the smallest power of two that can hold count elements."""
+        return 1 << (max(count, 1) - 1).bit_length()
+
+    def _slots(self, count):
+        """Return new storage of count vacant slots."""
+        return [None] * count
+
+    def _items(self, iterable):
+        """Return the elements of iterable as a sequence that can be sliced
+        into the storage."""
+        return list(iterable)
 
     def __len__(self):
         """Return the number of elements in the queue."""
@@ -36,25 +64,93 @@ class ArrayQueue:
         if self.is_empty():
             raise ValueError('Queue is empty')
         answer = self._data[self._front]
-        self._data[self._front] = None
-        self._front = (self._front + 1) % len(self._data)
+        self._data[self._front] = self._VACANT
+        self._front = (self._front + 1) & (len(self._data) - 1)
         self._size -= 1
+        if self._size < len(self._data) // 4 and len(self._data) > self._min_capacity:
+            self._resize(len(self._data) // 2)
         return answer
 
     def enqueue(self, element):
         """Add an element to the back of queue."""
         if self._size == len(self._data):
             self._resize(2 * len(self._data))
-        avail = (self._front + self._size) % len(self._data)
+        avail = (self._front + self._size) & (len(self._data) - 1)
         self._data[avail] = element
         self._size += 1
 
+    def enqueue_many(self, iterable):
+        """Add the elements of iterable, in order, to the back of the queue.
+
+        The elements are copied with at most two slice assignments, and the
+        list is resized at most once.
+        """
+        items = self._items(iterable)
+        count = len(items)
+        if count == 0:
+            return
+        cap = len(self._data)
+        if self._size + count > cap:
+            while cap < self._size + count:
+                cap *= 2
+            self._resize(cap)
+        start = (self._front + self._size) & (cap - 1)
+        head = min(count, cap - start)
+        self._data[start:start + head] = items[:head]
+        if head < count:
+            self._data[:count - head] = items[head:]
+        self._size += count
+
+    def dequeue_many(self, count):
+        """Remove and return a list of the first count elements of the queue.
+
+        The elements are copied with at most two slice operations.
+        Raise ValueError exception if the queue has fewer than count elements.
+        """
+        if count < 0 or count > self._size:
+            raise ValueError('Queue has fewer than %d elements' % count)
+        answer = self._copy_out(count)
+        cap = len(self._data)
+        head = min(count, cap - self._front)
+        self._data[self._front:self._front + head] = self._slots(head)
+        if head < count:
+            self._data[:count - head] = self._slots(count - head)
+        self._front = (self._front + count) & (cap - 1)
+        self._size -= count
+        while self._size < cap // 4 and cap > self._min_capacity:
+            cap //= 2
+        if cap < len(self._data):
+            self._resize(cap)
+        return answer
+
+    def reserve(self, count):
+        """Make room for at least count elements without further resizing.
+
+        The reserved capacity also becomes the minimum capacity, so the
+        queue does not shrink below it until shrink_to_fit is called.
+        """
+        cap = self._capacity_for(count)
+        if cap > len(self._data):
+            self._resize(cap)
+        self._min_capacity = max(self._min_capacity, cap)
+
+    def shrink_to_fit(self):
+        """Shrink the underlying list to the smallest power of two that holds
+        the current elements, releasing any reserved capacity.
+        """
+        cap = self._capacity_for(self._size)
+        if cap < len(self._data):
+            self._resize(cap)
+        self._min_capacity = min(self._min_capacity, cap)
+
+    def _copy_out(self, count):
+        """Return the first count elements, using at most two slices."""
+        end = self._front + count
+        if end <= len(self._data):
+            return self._data[self._front:end]
+        return self._data[self._front:] + self._data[:end - len(self._data)]
+
     def _resize(self, cap):
-        """Resize to a new list of capacity >= len(self)."""
-        old = self._data
-        self._data = [None] * cap
-        walk = self._front
-        for k in range(self._size):
-            self._data[k] = old[walk]
-            walk = (1 + walk) % len(old)
+        """Resize to new storage of capacity >= len(self), a power of two."""
+        self._data = self._copy_out(self._size) + self._slots(cap - self._size)
         self._front = 0
@@ -36,3 +36,31 @@ class ArrayStack:
         if self.is_empty():
             raise ValueError('Stack is empty')
         return self._data.pop()
+
+    def push_many(self, iterable):
+        """Add the elements of iterable, in order, to the top of the stack.
+
+        The last element ends up at the top of the stack.
+        """
+        self._data.extend(iterable)
+
+    def pop_many(self, count):
+        """Remove and return a list of the top count elements, top first
+        (i.e., LIFO), using a single slice.
+
+        Raise ValueError exception if the stack has fewer than count elements.
+        """
+        answer = self.peek_many(count)
+        del self._data[len(self._data) - count:]
+        return answer
+
+    def peek_many(self, count):
+        """Return (but do not remove) a list of the top count elements, top first.
+
+        Raise ValueError exception if the stack has fewer than count elements.
+        """
+        if count < 0 or count > len(self._data):
+            raise ValueError('Stack has fewer than %d elements' % count)
+        answer = self._data[len(self._data) - count:]
+        answer.reverse()
+        return answer
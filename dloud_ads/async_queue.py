@@ -0,0 +1,125 @@
+"""asyncio queue wrapping one of the package's queues or stacks."""
+
+import asyncio
+import collections
+
+from .array_queue import ArrayQueue
+from .blocking_queue import Empty, Full, _container_methods
+
+class AsyncQueue:
+    """asyncio queue wrapping one of the package's queues or stacks.
+
+    Elements are stored in the wrapped container, so its ordering applies.
+    Coroutines waiting on a full or empty queue are parked on futures and
+    woken one at a time, as in asyncio.Queue.  An AsyncQueue must only be
+    used from the thread running its event loop; wrap waits in
+    asyncio.wait_for to bound them.
+    """
+
+    def __init__(self, container=None, maxsize=0):
+        """Create an empty asyncio queue.
+
+        container is an empty queue or stack to store the elements in (a
+        new ArrayQueue by default).  If maxsize is positive, put waits
+        while the queue holds maxsize elements.
+        """
+        if container is None:
+            container = ArrayQueue()
+        self._container = container
+        self._put, self._get, self._get_many = _container_methods(container)
+        self._maxsize = maxsize
+        self._getters = collections.deque()
+        self._putters = collections.deque()
+
+    def __len__(self):
+        """Return the number of elements in the queue."""
+        return len(self._container)
+
+    def is_empty(self):
+        """Return True if the queue is empty."""
+        return len(self._container) == 0
+
+    def is_full(self):
+        """Return True if the queue holds maxsize elements."""
+        return 0 < self._maxsize <= len(self._container)
+
+    @staticmethod
+    def _wakeup_next(waiters):
+        """Wake up the first waiter that is still waiting."""
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    async def _wait(self, waiters, blocked):
+        """Park the current task on waiters until blocked() is false."""
+        while blocked():
+            waiter = asyncio.get_running_loop().create_future()
+            waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                try:
+                    waiters.remove(waiter)
+                except ValueError:
+                    pass
+                if not blocked() and not waiter.cancelled():
+                    self._wakeup_next(waiters)
+                raise
+
+    async def put(self, element):
+        """Add an element to the queue, waiting while the queue is full."""
+        await self._wait(self._putters, self.is_full)
+        self.put_nowait(element)
+
+    def put_nowait(self, element):
+        """Add an element to the queue without waiting.
+
+        Raise Full exception if the queue is full.
+        """
+        if self.is_full():
+            raise Full('Queue is full')
+        self._put(element)
+        self._wakeup_next(self._getters)
+
+    async def get(self):
+        """Remove and return the next element, waiting while the queue is empty."""
+        await self._wait(self._getters, self.is_empty)
+        return self.get_nowait()
+
+    def get_nowait(self):
+        """Remove and return the next element without waiting.
+
+        Raise Empty exception if the queue is empty.
+        """
+        if self.is_empty():
+            raise Empty('Queue is empty')
+        element = self._get()
+        self._wakeup_next(self._putters)
+        return element
+
+    async def get_many(self, count):
+        """Remove and return a list of up to count elements, waiting while the
+        queue is empty."""
+        await self._wait(self._getters, self.is_empty)
+        return self.get_many_nowait(count)
+
+    def get_many_nowait(self, count):
+        """Remove and return a list of up to count elements without waiting.
+
+        Raise Empty exception if the queue is empty.
+        """
+        if self.is_empty():
+            raise Empty('Queue is empty')
+        count = min(count, len(self._container))
+        if self._get_many is not None:
+            elements = self._get_many(count)
+        else:
+            elements = [self._get() for _ in range(count)]
+        for _ in elements:
+            if not self._putters:
+                break
+            self._wakeup_next(self._putters)
+        return elements
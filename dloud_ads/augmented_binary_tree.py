@@ -0,0 +1,249 @@
+"""Linked binary tree maintaining an aggregate of every subtree."""
+
+import operator
+
+from .linked_binary_tree import LinkedBinaryTree
+
+class AugmentedBinaryTree(LinkedBinaryTree):
+    """Linked binary tree maintaining an aggregate of every subtree.
+
+    Aggregates are taken over a monoid given by an associative combine
+    function and its identity, applied to value(e) for each element e.
+    Every node records the aggregate of its subtree, combined in inorder
+    (left subtree, node, right subtree), so combine need not be
+    commutative.  Each update recomputes the aggregates along the path to
+    the root in O(depth) time, and the aggregate of any subtree is read
+    in O(1) time.
+
+    The default monoid sums the elements; for instance combine=min with
+    identity=float('inf') keeps subtree minima, and value=lambda e: 1
+    keeps subtree sizes.
+
+    Subtrees move between trees only if they share a monoid: the same
+    combine and value objects, compared by identity, and equal identities.
+    Two trees built with separate but equivalent lambdas therefore cannot
+    be attached or grafted together; define the functions once and pass
+    the same objects to both.
+    """
+
+    class _Node(LinkedBinaryTree._Node):
+        """Node class with a field storing the aggregate of its subtree."""
+        __slots__ = '_aggregate',
+
+        def __init__(self, element, parent=None, left=None, right=None):
+            LinkedBinaryTree._Node.__init__(self, element, parent, left, right)
+            self._aggregate = None
+
+    def __init__(self, combine=operator.add, identity=0, value=None,
+                 intern_positions=False):
+        """Create an initially empty tree aggregating with the given monoid.
+
+        combine must be associative with identity as its identity element.
+        value maps an element to the quantity aggregated (the element
+        itself if value is None).
+        """
+        LinkedBinaryTree.__init__(self, intern_positions)
+        self._combine = combine
+        self._identity = identity
+        self._value = value
+
+    def _new_empty(self):
+        """Return a new empty tree of the same kind and monoid as this one."""
+        return type(self)(self._combine, self._identity, self._value,
+                          self._positions is not None)
+
+    def _set_monoid(self, combine, identity, value):
+        """Use the given monoid and recompute every aggregate in O(n) time."""
+        self._combine = combine
+        self._identity = identity
+        self._value = value
+        if self._root is not None:
+            for node in self._postorder_nodes(self._root):
+                self._recompute(node)
+
+    @classmethod
+    def from_level_order(cls, iterable, combine=operator.add, identity=0, value=None):
+        """Return a complete tree whose level-order traversal yields iterable.
+
+        Aggregates use the given monoid and are computed in O(n) time.
+        """
+        tree = super(AugmentedBinaryTree, cls).from_level_order(iterable)
+        tree._set_monoid(combine, identity, value)
+        return tree
+
+    @classmethod
+    def from_sorted(cls, seq, combine=operator.add, identity=0, value=None):
+        """Return a height-balanced tree whose inorder traversal yields seq.
+
+        Aggregates use the given monoid and are computed in O(n) time.
+        """
+        tree = super(AugmentedBinaryTree, cls).from_sorted(seq)
+        tree._set_monoid(combine, identity, value)
+        return tree
+
+    @classmethod
+    def from_preorder_inorder(cls, preorder, inorder, combine=operator.add,
+                              identity=0, value=None):
+        """Return the tree with the given preorder and inorder traversals.
+
+        Aggregates use the given monoid and are computed in O(n) time.
+        Raise ValueError if the traversals do not describe a binary tree.
+        """
+        tree = super(AugmentedBinaryTree, cls).from_preorder_inorder(preorder, inorder)
+        tree._set_monoid(combine, identity, value)
+        return tree
+
+    def _recompute(self, node):
+        """Set the aggregate of node from its element and its children."""
+        total = node._element if self._value is None else self._value(node._element)
+        if node._left is not None:
+            total = self._combine(node._left._aggregate, total)
+        if node._right is not None:
+            total = self._combine(total, node._right._aggregate)
+        node._aggregate = total
+
+    def _update_path(self, node):
+        """Recompute the aggregates from node up to the root."""
+        while node is not None:
+            self._recompute(node)
+            node = node._parent
+
+    def _check_monoid(self, tree):
+        """Raise ValueError if tree does not aggregate with this tree's monoid.
+
+        combine and value are compared by identity, since functions cannot
+        be compared for equivalence.
+        """
+        if isinstance(tree, AugmentedBinaryTree) and (
+                tree._combine is not self._combine or tree._value is not self._value
+                or tree._identity != self._identity):
+            raise ValueError('Tree monoids must match')
+
+    def aggregate(self, pos=None):
+        """Return the aggregate of the subtree rooted at Position p, in O(1) time.
+
+        With no position, return the aggregate of the whole tree (the
+        identity if the tree is empty).
+        """
+        if pos is None:
+            return self._identity if self._root is None else self._root._aggregate
+        return self._validate(pos)._aggregate
+
+    def _add_root(self, elem):
+        """Place element e at the root of an empty tree and return new Position.
+
+        Raise ValueError if tree nonempty.
+        """
+        pos = LinkedBinaryTree._add_root(self, elem)
+        self._recompute(self._root)
+        return pos
+
+    def _add_left(self, pos, elem):
+        """Create a new left child for Position p, storing element e.
+
+        Return the Position of new node.
+        Raise ValueError if Position p is invalid or p already has a left child.
+        """
+        child = LinkedBinaryTree._add_left(self, pos, elem)
+        self._update_path(child._node)
+        return child
+
+    def _add_right(self, pos, elem):
+        """Create a new right child for Position p, storing element e.
+
+        Return the Position of new node.
+        Raise ValueError if Position p is invalid or p already has a right child.
+        """
+        child = LinkedBinaryTree._add_right(self, pos, elem)
+        self._update_path(child._node)
+        return child
+
+    def _replace(self, pos, elem):
+        """Replace the element at position p with e, and return old element."""
+        old = LinkedBinaryTree._replace(self, pos, elem)
+        self._update_path(pos._node)
+        return old
+
+    def _delete(self, pos):
+        """Delete the node at Position p, and replace it with its child, if any.
+
+        Return the element that had been stored at Position p.
+        Raise ValueError if Position p is invalid or p has two children.
+        """
+        parent = self._validate(pos)._parent
+        old = LinkedBinaryTree._delete(self, pos)
+        self._update_path(parent)
+        return old
+
+    def _attach(self, pos, tree1, tree2):
+        """Attach trees tree1 and tree2, respectively, as the left and right
+        subtrees of the external Position p.
+
+        As a side effect, set tree1 and tree2 to empty.
+        Raise TypeError if trees tree1 and tree2 do not match type of this tree.
+        Raise ValueError if Position p is invalid or not external, or if the
+        trees do not share the monoid of this tree.
+        """
+        self._check_monoid(tree1)
+        self._check_monoid(tree2)
+        LinkedBinaryTree._attach(self, pos, tree1, tree2)
+        self._update_path(pos._node)
+
+    def _detach(self, pos):
+        """Remove the subtree rooted at Position p and return it as a new tree.
+
+        The aggregates of the former ancestors of p are recomputed.
+        Raise ValueError if Position p is invalid.
+        """
+        parent = self._validate(pos)._parent
+        tree = LinkedBinaryTree._detach(self, pos)
+        self._update_path(parent)
+        return tree
+
+    def _graft_left(self, pos, tree):
+        """Attach tree as the left subtree of Position p.
+
+        As a side effect, set tree to empty.
+        Raise TypeError if tree does not match type of this tree.
+        Raise ValueError if Position p is invalid or p already has a left
+        child, or if tree does not share the monoid of this tree.
+        """
+        LinkedBinaryTree._graft_left(self, pos, tree)
+        self._update_path(pos._node)
+
+    def _graft_right(self, pos, tree):
+        """Attach tree as the right subtree of Position p.
+
+        As a side effect, set tree to empty.
+        Raise TypeError if tree does not match type of this tree.
+        Raise ValueError if Position p is invalid or p already has a right
+        child, or if tree does not share the monoid of this tree.
+        """
+        LinkedBinaryTree._graft_right(self, pos, tree)
+        self._update_path(pos._node)
+
+    def _take_root(self, tree):
+        """Empty tree, add its size to this tree and return its former root."""
+        self._check_monoid(tree)
+        return LinkedBinaryTree._take_root(self, tree)
+
+    def _swap_subtrees(self, pos1, pos2):
+        """Exchange the subtrees rooted at Positions p and q.
+
+        The aggregates along both former parent paths are recomputed.
+        Raise ValueError if a Position is invalid or one contains the other.
+        """
+        LinkedBinaryTree._swap_subtrees(self, pos1, pos2)
+        self._update_path(pos1._node._parent)
+        self._update_path(pos2._node._parent)
+
+    def _delete_subtree(self, pos):
+        """Delete the whole subtree rooted at Position p.
+
+        Return the element that had been stored at Position p.
+        Raise ValueError if Position p is invalid.
+        """
+        parent = self._validate(pos)._parent
+        old = LinkedBinaryTree._delete_subtree(self, pos)
+        self._update_path(parent)
+        return old
@@ -0,0 +1,370 @@
+"""Sorted map implementation using an AVL tree."""
+
+from collections.abc import MutableMapping
+
+from .linked_binary_tree import LinkedBinaryTree
+from .owner import _Owner
+
+class AVLTreeMap(LinkedBinaryTree, MutableMapping):
+    """Sorted map implementation using an AVL tree.
+
+    Each element of the underlying LinkedBinaryTree is a key-value item,
+    ordered by key, and every node records the height of its subtree so
+    the tree is rebalanced with trinode restructurings after each update.
+    Searches, insertions and deletions take O(log n) time.  Searches and
+    iterations walk nodes directly, so no Position is created per step.
+
+    The shape is changed only by the map operations, which keep heights
+    and keys in order: the inherited builders other than from_sorted and
+    the inherited methods that edit the tree structure directly raise
+    TypeError.
+    """
+
+    class _Item:
+        """Lightweight composite to store key-value pairs as map items."""
+        __slots__ = '_key', '_value'
+
+        def __init__(self, key, value):
+            self._key = key
+            self._value = value
+
+    class _Node(LinkedBinaryTree._Node):
+        """Node class with a field storing the height of its subtree."""
+        __slots__ = '_height',
+
+        def __init__(self, element, parent=None, left=None, right=None):
+            LinkedBinaryTree._Node.__init__(self, element, parent, left, right)
+            self._height = 1
+
+    @classmethod
+    def from_sorted(cls, items):
+        """Return a map holding the (key, value) pairs of items.
+
+        The keys must be strictly increasing.  Nodes are linked directly
+        into a height-balanced tree in O(n) time.
+        Raise ValueError if the keys are not strictly increasing.
+        """
+        tree = cls()
+        seq = [cls._Item(key, value) for key, value in items]
+        for index in range(1, len(seq)):
+            if not seq[index - 1]._key < seq[index]._key:
+                raise ValueError('keys must be strictly increasing')
+        tree._root = tree._build_balanced(seq, 0, len(seq), None)
+        tree._size = len(seq)
+        return tree
+
+    @classmethod
+    def from_level_order(cls, iterable):
+        """Not supported, since the result need not be a search tree.
+
+        Raise TypeError; use from_sorted instead.
+        """
+        raise TypeError('AVLTreeMap must be built with from_sorted')
+
+    @classmethod
+    def from_preorder_inorder(cls, preorder, inorder):
+        """Not supported, since the result need not be balanced.
+
+        Raise TypeError; use from_sorted instead.
+        """
+        raise TypeError('AVLTreeMap must be built with from_sorted')
+
+    def _restructure_directly(self, *args):
+        """Not supported, since it would leave heights and keys unordered.
+
+        Raise TypeError.
+        """
+        raise TypeError('AVLTreeMap is only restructured by its map operations')
+
+    _add_left = _add_right = _delete = _restructure_directly
+    _attach = _detach = _graft_left = _graft_right = _restructure_directly
+    _swap_subtrees = _delete_subtree = _restructure_directly
+
+    def _build_balanced(self, seq, start, stop, parent):
+        """Return the root of a balanced subtree holding seq[start:stop].
+
+        Splitting at the midpoint gives a subtree of n nodes the height
+        n.bit_length(), which is recorded as each node is built.
+        """
+        node = LinkedBinaryTree._build_balanced(self, seq, start, stop, parent)
+        if node is not None:
+            node._height = (stop - start).bit_length()
+        return node
+
+    @staticmethod
+    def _height_of(node):
+        """Return the height of the subtree rooted at node (0 if None)."""
+        return node._height if node is not None else 0
+
+    def _recompute_height(self, node):
+        """Set the height of node from the heights of its children."""
+        node._height = 1 + max(self._height_of(node._left), self._height_of(node._right))
+
+    def _is_balanced(self, node):
+        """Return True if the children heights of node differ by at most one."""
+        return abs(self._height_of(node._left) - self._height_of(node._right)) <= 1
+
+    def _tall_child(self, node, favorleft=False):
+        """Return the child of node with the greater height."""
+        if self._height_of(node._left) + (1 if favorleft else 0) > \
+                self._height_of(node._right):
+            return node._left
+        return node._right
+
+    def _tall_grandchild(self, node):
+        """Return the taller child of the taller child of node."""
+        child = self._tall_child(node)
+        return self._tall_child(child, child is node._left)
+
+    def _relink(self, parent, child, make_left_child):
+        """Relink parent node with child node (child may be None)."""
+        if make_left_child:
+            parent._left = child
+        else:
+            parent._right = child
+        if child is not None:
+            child._parent = parent
+
+    def _rotate(self, node):
+        """Rotate node above its parent."""
+        parent = node._parent
+        grand = parent._parent
+        if grand is None:
+            self._root = node
+            node._parent = None
+        else:
+            self._relink(grand, node, parent is grand._left)
+        if node is parent._left:
+            self._relink(parent, node._right, True)
+            self._relink(node, parent, False)
+        else:
+            self._relink(parent, node._left, False)
+            self._relink(node, parent, True)
+
+    def _restructure(self, node):
+        """Perform a trinode restructure of node with its parent and grandparent.
+
+        Return the node that becomes the root of the restructured subtree.
+        """
+        parent = node._parent
+        grand = parent._parent
+        if (node is parent._right) == (parent is grand._right):
+            self._rotate(parent)
+            return parent
+        self._rotate(node)
+        self._rotate(node)
+        return node
+
+    def _rebalance(self, node):
+        """Restore the AVL property on the path from node to the root."""
+        while node is not None:
+            old_height = node._height
+            if not self._is_balanced(node):
+                node = self._restructure(self._tall_grandchild(node))
+                self._recompute_height(node._left)
+                self._recompute_height(node._right)
+            self._recompute_height(node)
+            if node._height == old_height:
+                node = None
+            else:
+                node = node._parent
+
+    def _search(self, key):
+        """Return the node with the given key, or else the last node searched
+        (None if the map is empty)."""
+        node = self._root
+        last = None
+        while node is not None:
+            last = node
+            node_key = node._element._key
+            if key == node_key:
+                return node
+            node = node._left if key < node_key else node._right
+        return last
+
+    @staticmethod
+    def _first_node(node):
+        """Return the node with the smallest key in the subtree rooted at node."""
+        while node._left is not None:
+            node = node._left
+        return node
+
+    @staticmethod
+    def _last_node(node):
+        """Return the node with the largest key in the subtree rooted at node."""
+        while node._right is not None:
+            node = node._right
+        return node
+
+    @classmethod
+    def _before(cls, node):
+        """Return the node preceding node in key order (or None if first)."""
+        if node._left is not None:
+            return cls._last_node(node._left)
+        while node._parent is not None and node is node._parent._left:
+            node = node._parent
+        return node._parent
+
+    @staticmethod
+    def _pair(node):
+        """Return the (key, value) pair of node (or None if node is None)."""
+        if node is None:
+            return None
+        return (node._element._key, node._element._value)
+
+    def _first_at_least(self, key, strict):
+        """Return the first node whose key is >= key (> key if strict)."""
+        node = self._root
+        best = None
+        while node is not None:
+            node_key = node._element._key
+            if key < node_key or (not strict and key == node_key):
+                best = node
+                node = node._left
+            else:
+                node = node._right
+        return best
+
+    def _last_at_most(self, key, strict):
+        """Return the last node whose key is <= key (< key if strict)."""
+        node = self._root
+        best = None
+        while node is not None:
+            node_key = node._element._key
+            if node_key < key or (not strict and key == node_key):
+                best = node
+                node = node._right
+            else:
+                node = node._left
+        return best
+
+    def __getitem__(self, key):
+        """Return value associated with key (raise KeyError if not found)."""
+        node = self._search(key)
+        if node is None or node._element._key != key:
+            raise KeyError('Key Error: ' + repr(key))
+        return node._element._value
+
+    def __contains__(self, key):
+        """Return True if the map has an item with the given key."""
+        node = self._search(key)
+        return node is not None and node._element._key == key
+
+    def __setitem__(self, key, value):
+        """Assign value to key, overwriting existing value if present."""
+        if self._root is None:
+            self._add_root(self._Item(key, value))
+            return
+        node = self._search(key)
+        if node._element._key == key:
+            node._element._value = value
+            return
+        child = self._make_node(self._Item(key, value), node)
+        if key < node._element._key:
+            node._left = child
+        else:
+            node._right = child
+        self._size += 1
+        self._version += 1
+        self._rebalance(node)
+
+    def __delitem__(self, key):
+        """Remove item associated with key (raise KeyError if not found)."""
+        node = self._search(key)
+        if node is None or node._element._key != key:
+            raise KeyError('Key Error: ' + repr(key))
+        if node._left is not None and node._right is not None:
+            replacement = self._last_node(node._left)
+            node._element = replacement._element
+            node = replacement
+        child = node._left if node._left is not None else node._right
+        parent = node._parent
+        if child is not None:
+            child._parent = parent
+        if parent is None:
+            self._root = child
+        elif node is parent._left:
+            parent._left = child
+        else:
+            parent._right = child
+        self._size -= 1
+        self._version += 1
+        node._parent = node
+        self._rebalance(parent)
+
+    def __iter__(self):
+        """Generate an iteration of all keys in the map in order."""
+        if self._root is not None:
+            for node in self._inorder_nodes(self._root):
+                yield node._element._key
+
+    def __reversed__(self):
+        """Generate an iteration of all keys in the map in reverse order."""
+        if self._root is not None:
+            node = self._last_node(self._root)
+            while node is not None:
+                yield node._element._key
+                node = self._before(node)
+
+    def clear(self):
+        """Remove all items from the map in O(1) time."""
+        self._root = None
+        self._size = 0
+        self._version += 1
+        self._owner = _Owner()
+
+    def find_min(self):
+        """Return (key, value) pair with minimum key (or None if empty)."""
+        if self._root is None:
+            return None
+        return self._pair(self._first_node(self._root))
+
+    def find_max(self):
+        """Return (key, value) pair with maximum key (or None if empty)."""
+        if self._root is None:
+            return None
+        return self._pair(self._last_node(self._root))
+
+    def find_lt(self, key):
+        """Return (key, value) pair with greatest key strictly less than key
+        (or None if there is no such key)."""
+        return self._pair(self._last_at_most(key, True))
+
+    def find_le(self, key):
+        """Return (key, value) pair with greatest key less than or equal to key
+        (or None if there is no such key)."""
+        return self._pair(self._last_at_most(key, False))
+
+    def find_gt(self, key):
+        """Return (key, value) pair with least key strictly greater than key
+        (or None if there is no such key)."""
+        return self._pair(self._first_at_least(key, True))
+
+    def find_ge(self, key):
+        """Return (key, value) pair with least key greater than or equal to key
+        (or None if there is no such key)."""
+        return self._pair(self._first_at_least(key, False))
+
+    def find_range(self, start, stop):
+        """Iterate all (key, value) pairs such that start <= key < stop.
+
+        If start is None, iteration begins with minimum key of map.
+        If stop is None, iteration continues through the maximum key of map.
+        Nodes are walked directly in O(log n + s) time for s pairs.
+        """
+        if self._root is None:
+            return
+        if start is None:
+            node = self._first_node(self._root)
+        else:
+            node = self._first_at_least(start, False)
+        while node is not None and (stop is None or node._element._key < stop):
+            yield (node._element._key, node._element._value)
+            if node._right is not None:
+                node = node._right
+                while node._left is not None:
+                    node = node._left
+            else:
+                while node._parent is not None and node is node._parent._right:
+                    node = node._parent
+                node = node._parent
@@ -32,10 +32,12 @@ class BinaryTree(Tree):
 
     def children(self, pos):
         """Generate an iteration of Positions representing p's children."""
-        if self.left(pos) is not None:
-            yield self.left(pos)
-        if self.right(pos) is not None:
-            yield self.right(pos)
+        left = self.left(pos)
+        if left is not None:
+            yield left
+        right = self.right(pos)
+        if right is not None:
+            yield right
 
     def inorder(self):
         """Generate an inorder iteration of positions in the tree."""
@@ -44,14 +46,19 @@ class BinaryTree(Tree):
                 yield pos
 
     def _subtree_inorder(self, pos):
-        """Generate an inorder iteration of positions in subtree rooted at p."""
-        if self.left(pos) is not None:
-            for other in self._subtree_inorder(self.left(pos)):
-                yield other
-        yield pos
-        if self.right(pos) is not None:
-            for other in self._subtree_inorder(self.right(pos)):
-                yield other
+        """Generate an inorder iteration of positions in subtree rooted at p.
+
+        Uses an explicit stack of pending ancestors instead of recursion.
+        """
+        stack = []
+        walk = pos
+        while stack or walk is not None:
+            while walk is not None:
+                stack.append(walk)
+                walk = self.left(walk)
+            walk = stack.pop()
+            yield walk
+            walk = self.right(walk)
 
     def positions(self):
         """Generate an iteration of the tree's positions."""
@@ -0,0 +1,134 @@
+"""Double-ended queue implementation based on a linked list of fixed-size blocks."""
+
+class BlockDeque:
+    """Double-ended queue implementation based on a linked list of fixed-size blocks.
+
+    Elements are stored in Python lists of BLOCK_SIZE slots that are linked
+    to each other, much like CPython's collections.deque.  A block is only
+    allocated or released once every BLOCK_SIZE insertions or deletions at
+    an end, so the per-element overhead is a single list slot.
+    """
+    BLOCK_SIZE = 64
+
+    class _Block:
+        """Lightweight, nonpublic class for storing a doubly linked block."""
+        __slots__ = '_data', '_prev', '_next'
+
+        def __init__(self, size, prev, next_block):
+            self._data = [None] * size
+            self._prev = prev
+            self._next = next_block
+
+    def __init__(self):
+        """Create an empty deque."""
+        block = self._Block(self.BLOCK_SIZE, None, None)
+        self._left = self._right = block
+        self._left_index = self.BLOCK_SIZE // 2     # slot of the first element
+        self._right_index = self._left_index - 1    # slot of the last element
+        self._size = 0
+
+    def __len__(self):
+        """Return the number of elements in the deque."""
+        return self._size
+
+    def is_empty(self):
+        """Return True if the deque is empty."""
+        return self._size == 0
+
+    def first(self):
+        """Return (but do not remove) the element at the front of the deque.
+
+        Raise ValueError exception if the deque is empty.
+        """
+        if self._size == 0:
+            raise ValueError("Deque is empty")
+        return self._left._data[self._left_index]
+
+    def last(self):
+        """Return (but do not remove) the element at the back of the deque.
+
+        Raise ValueError exception if the deque is empty.
+        """
+        if self._size == 0:
+            raise ValueError("Deque is empty")
+        return self._right._data[self._right_index]
+
+    def insert_first(self, elem):
+        """Add an element to the front of the deque."""
+        if self._left_index == 0:
+            block = self._Block(self.BLOCK_SIZE, None, self._left)
+            self._left._prev = block
+            self._left = block
+            self._left_index = self.BLOCK_SIZE
+        self._left_index -= 1
+        self._left._data[self._left_index] = elem
+        self._size += 1
+
+    def insert_last(self, elem):
+        """Add an element to the back of the deque."""
+        if self._right_index == self.BLOCK_SIZE - 1:
+            block = self._Block(self.BLOCK_SIZE, self._right, None)
+            self._right._next = block
+            self._right = block
+            self._right_index = -1
+        self._right_index += 1
+        self._right._data[self._right_index] = elem
+        self._size += 1
+
+    def delete_first(self):
+        """Remove and return the element from the front of the deque.
+
+        Raise ValueError exception if the deque is empty.
+        """
+        if self._size == 0:
+            raise ValueError("Deque is empty")
+        data = self._left._data
+        answer = data[self._left_index]
+        data[self._left_index] = None
+        self._left_index += 1
+        self._size -= 1
+        if self._size == 0:
+            self._recenter()
+        elif self._left_index == self.BLOCK_SIZE:
+            self._left = self._left._next
+            self._left._prev = None
+            self._left_index = 0
+        return answer
+
+    def delete_last(self):
+        """Remove and return the element from the back of the deque.
+
+        Raise ValueError exception if the deque is empty.
+        """
+        if self._size == 0:
+            raise ValueError("Deque is empty")
+        data = self._right._data
+        answer = data[self._right_index]
+        data[self._right_index] = None
+        self._right_index -= 1
+        self._size -= 1
+        if self._size == 0:
+            self._recenter()
+        elif self._right_index == -1:
+            self._right = self._right._prev
+            self._right._next = None
+            self._right_index = self.BLOCK_SIZE - 1
+        return answer
+
+    def _recenter(self):
+        """Reset the indices of an empty deque to the middle of its block."""
+        self._left_index = self.BLOCK_SIZE // 2
+        self._right_index = self._left_index - 1
+
+    def __iter__(self):
+        """Generate a forward iteration of the elements of the deque."""
+        block = self._left
+        start = self._left_index
+        remaining = self._size
+        while remaining > 0:
+            stop = min(self.BLOCK_SIZE, start + remaining)
+            for elem in block._data[start:stop]:
+                yield elem
+            remaining -= stop - start
+            block = block._next
+            start = 0
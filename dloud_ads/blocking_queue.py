@@ -0,0 +1,115 @@
+"""Thread-safe blocking queue wrapping one of the package's queues or stacks."""
+
+import threading
+
+from .array_queue import ArrayQueue
+
+class Empty(ValueError):
+    """Raised when an element is requested from an empty queue."""
+
+class Full(ValueError):
+    """Raised when an element is added to a full queue."""
+
+def _container_methods(container):
+    """Return the (put, get, get_many) callables of a queue or stack.
+
+    get_many is None if the container has no batch removal method.
+    Raise TypeError if container is neither a queue nor a stack.
+    """
+    if hasattr(container, 'enqueue') and hasattr(container, 'dequeue'):
+        return (container.enqueue, container.dequeue,
+                getattr(container, 'dequeue_many', None))
+    if hasattr(container, 'push') and hasattr(container, 'pop'):
+        return container.push, container.pop, getattr(container, 'pop_many', None)
+    raise TypeError('container must provide enqueue/dequeue or push/pop')
+
+class BlockingQueue:
+    """Thread-safe blocking queue wrapping one of the package's queues or stacks.
+
+    Elements are stored in the wrapped container, so its ordering applies:
+    FIFO for ArrayQueue, LinkedQueue or CircularQueue, and LIFO for
+    ArrayStack or LinkedStack.  All access goes through one lock, with
+    conditions to block producers on a full queue and consumers on an
+    empty one.
+    """
+
+    def __init__(self, container=None, maxsize=0):
+        """Create an empty blocking queue.
+
+        container is an empty queue or stack to store the elements in (a
+        new ArrayQueue by default).  If maxsize is positive, put blocks
+        while the queue holds maxsize elements.
+        """
+        if container is None:
+            container = ArrayQueue()
+        self._container = container
+        self._put, self._get, self._get_many = _container_methods(container)
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def __len__(self):
+        """Return the number of elements in the queue."""
+        with self._lock:
+            return len(self._container)
+
+    def is_empty(self):
+        """Return True if the queue is empty."""
+        return len(self) == 0
+
+    def _has_room(self):
+        """Return True if another element may be added; lock must be held."""
+        return self._maxsize <= 0 or len(self._container) < self._maxsize
+
+    def _has_element(self):
+        """Return True if an element is available; lock must be held."""
+        return len(self._container) > 0
+
+    def put(self, element, block=True, timeout=None):
+        """Add an element to the queue.
+
+        If the queue is full, wait until there is room, for at most timeout
+        seconds if timeout is not None.
+        Raise Full exception if there is no room after waiting, or at once
+        if block is False.
+        """
+        with self._not_full:
+            if not self._not_full.wait_for(self._has_room, timeout if block else 0):
+                raise Full('Queue is full')
+            self._put(element)
+            self._not_empty.notify()
+
+    def get(self, block=True, timeout=None):
+        """Remove and return the next element of the queue.
+
+        If the queue is empty, wait until an element is available, for at
+        most timeout seconds if timeout is not None.
+        Raise Empty exception if the queue is still empty after waiting,
+        or at once if block is False.
+        """
+        with self._not_empty:
+            if not self._not_empty.wait_for(self._has_element, timeout if block else 0):
+                raise Empty('Queue is empty')
+            element = self._get()
+            self._not_full.notify()
+            return element
+
+    def get_many(self, count, block=True, timeout=None):
+        """Remove and return a list of up to count elements of the queue.
+
+        The lock is acquired once for the whole batch.  If the queue is
+        empty, wait as get does until at least one element is available.
+        Raise Empty exception if the queue is still empty after waiting,
+        or at once if block is False.
+        """
+        with self._not_empty:
+            if not self._not_empty.wait_for(self._has_element, timeout if block else 0):
+                raise Empty('Queue is empty')
+            count = min(count, len(self._container))
+            if self._get_many is not None:
+                elements = self._get_many(count)
+            else:
+                elements = [self._get() for _ in range(count)]
+            self._not_full.notify(len(elements))
+            return elements
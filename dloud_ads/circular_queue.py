@@ -1,21 +1,33 @@
 """Queue implementation using circularly linked list for storage."""
 
+from .node_pool import _NodePool
+
 class CircularQueue:
-    """Queue implementation using circularly linked list for storage."""
+    """Queue implementation using circularly linked list for storage.
+
+    Nodes are linked in both directions, so the queue can be rotated by k
+    steps walking min(k, n - k) nodes.
+    """
 
     class _Node:
-        """Lightweight, nonpublic class for storing a singly linked node."""
-        __slots__ = '_element', '_next'
+        """Lightweight, nonpublic class for storing a doubly linked node."""
+        __slots__ = '_element', '_prev', '_next'
 
-        def __init__(self, element, next_element):
+        def __init__(self, element, prev_element, next_element):
             self._element = element
+            self._prev = prev_element
             self._next = next_element
 
 
-    def __init__(self):
-        """Create an empty queue."""
+    def __init__(self, pool_size=0):
+        """Create an empty queue.
+
+        If pool_size is positive, up to pool_size unlinked nodes are kept
+        for reuse instead of being allocated anew.
+        """
         self._tail = None
         self._size = 0
+        self._pool = _NodePool(pool_size) if pool_size else None
 
     def __len__(self):
         """Return the number of elements in the queue."""
@@ -47,21 +59,116 @@ class CircularQueue:
             self._tail = None
         else:
             self._tail._next = oldhead._next
+            oldhead._next._prev = self._tail
         self._size -= 1
-        return oldhead._element
+        answer = oldhead._element
+        oldhead._prev = oldhead._next = None    # a lone node links to itself
+        if self._pool is not None:
+            oldhead._element = None
+            self._pool.release(oldhead)
+        return answer
 
     def enqueue(self, element):
         """Add an element to the back of queue."""
-        newest = self._Node(element, None)
+        if self._pool is None:
+            newest = self._Node(element, None, None)
+        else:
+            newest = self._pool.acquire(self._Node, element, None, None)
         if self.is_empty():
-            newest._next = newest
+            newest._prev = newest._next = newest
         else:
-            newest._next = self._tail._next
-            self._tail._next = newest
+            self._link_after_tail(newest, newest)
         self._tail = newest
         self._size += 1
 
-    def rotate(self):
-        """Rotate front element to the back of the queue."""
-        if self._size > 0:
-            self._tail = self._tail._next
+    def _link_after_tail(self, first, last):
+        """Link the chain from first to last between the tail and the head."""
+        head = self._tail._next
+        first._prev = self._tail
+        self._tail._next = first
+        last._next = head
+        head._prev = last
+
+    def enqueue_many(self, iterable):
+        """Add the elements of iterable, in order, to the back of the queue.
+
+        The new nodes are chained on their own and spliced in once.
+        """
+        first = last = None
+        count = 0
+        for element in iterable:
+            if self._pool is None:
+                node = self._Node(element, last, None)
+            else:
+                node = self._pool.acquire(self._Node, element, last, None)
+            if last is None:
+                first = node
+            else:
+                last._next = node
+            last = node
+            count += 1
+        if count == 0:
+            return
+        if self.is_empty():
+            first._prev = last
+            last._next = first
+        else:
+            self._link_after_tail(first, last)
+        self._tail = last
+        self._size += count
+
+    def dequeue_many(self, count):
+        """Remove and return a list of the first count elements of the queue.
+
+        Raise ValueError exception if the queue has fewer than count elements.
+        """
+        if count < 0 or count > self._size:
+            raise ValueError('Queue has fewer than %d elements' % count)
+        answer = []
+        if count == 0:
+            return answer
+        walk = self._tail._next
+        pool = self._pool
+        for _ in range(count):
+            answer.append(walk._element)
+            node, walk = walk, walk._next
+            node._prev = node._next = None      # removed nodes must not form a cycle
+            if pool is not None:
+                node._element = None
+                pool.release(node)
+        self._size -= count
+        if self._size == 0:
+            self._tail = None
+        else:
+            self._tail._next = walk
+            walk._prev = self._tail
+        return answer
+
+    def rotate(self, k=1):
+        """Rotate the queue by k steps, moving the first k elements to the back.
+
+        A negative k moves the last -k elements to the front.  k is taken
+        modulo the size of the queue, and the shorter way round is walked,
+        so the cost is O(min(k, n - k)).
+        """
+        if self._size == 0:
+            return
+        k %= self._size
+        if k <= self._size - k:
+            for _ in range(k):
+                self._tail = self._tail._next
+        else:
+            for _ in range(self._size - k):
+                self._tail = self._tail._prev
+
+    def __iter__(self):
+        """Generate the elements of the queue, front to back, without
+        modifying it."""
+        walk = self._tail
+        for _ in range(self._size):
+            walk = walk._next
+            yield walk._element
+
+    def pool_stats(self):
+        """Return node pool statistics (or None if pooling is disabled)."""
+        return self._pool.stats() if self._pool is not None else None
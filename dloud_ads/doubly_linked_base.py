@@ -1,5 +1,7 @@
 """A base class providing a doubly linked list representation."""
 
+from .node_pool import _NodePool
+
 class _DoublyLinkedBase:
     """A base class providing a doubly linked list representation."""
     class _Node:
@@ -11,8 +13,13 @@ class _DoublyLinkedBase:
             self._prev = prev
             self._next = next_element
 
-    def __init__(self):
-        """Create an empty list."""
+    def __init__(self, pool_size=0):
+        """Create an empty list.
+
+        If pool_size is positive, up to pool_size unlinked nodes are kept
+        for reuse instead of being allocated anew.
+        """
+        self._pool = _NodePool(pool_size) if pool_size else None
         self._header = self._Node(None, None, None)
         self._trailer = self._Node(None, None, None)
         self._header._next = self._trailer
@@ -29,7 +36,10 @@ class _DoublyLinkedBase:
 
     def _insert_between(self, elem, predecessor, successor):
         """Add element e between two existing nodes and return new node."""
-        newest = self._Node(elem, predecessor, successor)
+        if self._pool is None:
+            newest = self._Node(elem, predecessor, successor)
+        else:
+            newest = self._pool.acquire(self._Node, elem, predecessor, successor)
         predecessor._next = newest
         successor._prev = newest
         self._size += 1
@@ -44,4 +54,70 @@ class _DoublyLinkedBase:
         self._size -= 1
         element = node._element
         node._prev = node._next = node._element = None
+        if self._pool is not None:
+            self._pool.release(node)
         return element
+
+    def pool_stats(self):
+        """Return node pool statistics (or None if pooling is disabled)."""
+        return self._pool.stats() if self._pool is not None else None
+
+    def extend(self, iterable):
+        """Add the elements of iterable to the back of the list."""
+        self._insert_chain(iterable, self._trailer._prev, self._trailer)
+
+    def concat(self, other):
+        """Move every element of other to the back of this list, in O(1) time.
+
+        As a side effect, other becomes empty.
+        Raise TypeError if other does not match the type of this list.
+        """
+        if type(other) is not type(self):
+            raise TypeError('List types must match')
+        if other is self:
+            raise ValueError('Cannot concatenate a list with itself')
+        if not other.is_empty():
+            self._move_chain(other, other._header._next, other._trailer._prev,
+                             other._size, self._trailer._prev, self._trailer)
+
+    def _insert_chain(self, elements, predecessor, successor):
+        """Add the given elements, in order, between two existing nodes.
+
+        The new nodes are linked to each other first and then spliced in
+        with a single relink, so a failing iterable leaves the list intact.
+        Return the number of elements added.
+        """
+        first = last = None
+        count = 0
+        pool = self._pool
+        for elem in elements:
+            if pool is None:
+                node = self._Node(elem, last, None)
+            else:
+                node = pool.acquire(self._Node, elem, last, None)
+            if last is None:
+                first = node
+            else:
+                last._next = node
+            last = node
+            count += 1
+        if count:
+            first._prev = predecessor
+            last._next = successor
+            predecessor._next = first
+            successor._prev = last
+            self._size += count
+        return count
+
+    def _move_chain(self, other, first, last, count, predecessor, successor):
+        """Move the run of count nodes from first to last out of list other
+        and link it between two existing nodes of this list.
+        """
+        first._prev._next = last._next
+        last._next._prev = first._prev
+        other._size -= count
+        first._prev = predecessor
+        last._next = successor
+        predecessor._next = first
+        successor._prev = last
+        self._size += count
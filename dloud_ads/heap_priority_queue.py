@@ -0,0 +1,99 @@
+"""A min-oriented priority queue implemented with a binary heap."""
+
+from .priority_queue_base import PriorityQueueBase
+
+class HeapPriorityQueue(PriorityQueueBase):
+    """A min-oriented priority queue implemented with a binary heap.
+
+    The heap is stored level by level in a Python list, so the children of
+    the item at index j are at indices 2j+1 and 2j+2.
+    """
+
+    def __init__(self, contents=()):
+        """Create a new priority queue.
+
+        By default, queue will be empty.  If contents is given, it should be
+        an iterable sequence of (key, value) tuples specifying the initial
+        contents, which are heapified bottom-up in O(n) time.
+        """
+        self._data = []
+        for key, value in contents:
+            self._data.append(self._make_item(key, value))
+        for j in range(len(self._data) // 2 - 1, -1, -1):
+            self._downheap(j)
+
+    def _make_item(self, key, value):
+        """Return a new item for key and value, ready to be stored in the heap."""
+        return self._Item(key, value)
+
+    def _place(self, item, j):
+        """Store item at index j of the heap."""
+        self._data[j] = item
+
+    def _upheap(self, j):
+        """Move the item at index j up until its parent's key is not larger.
+
+        Return the final index of the item.
+        """
+        item = self._data[j]
+        while j > 0:
+            parent = (j - 1) // 2
+            if not item < self._data[parent]:
+                break
+            self._place(self._data[parent], j)
+            j = parent
+        self._place(item, j)
+        return j
+
+    def _downheap(self, j):
+        """Move the item at index j down until no child has a smaller key.
+
+        Return the final index of the item.
+        """
+        data = self._data
+        item = data[j]
+        size = len(data)
+        child = 2 * j + 1
+        while child < size:
+            if child + 1 < size and data[child + 1] < data[child]:
+                child += 1
+            if not data[child] < item:
+                break
+            self._place(data[child], j)
+            j = child
+            child = 2 * j + 1
+        self._place(item, j)
+        return j
+
+    def __len__(self):
+        """Return the number of items in the priority queue."""
+        return len(self._data)
+
+    def add(self, key, value):
+        """Add a key-value pair to the priority queue."""
+        self._data.append(self._make_item(key, value))
+        self._upheap(len(self._data) - 1)
+
+    def min(self):
+        """Return but do not remove (k,v) tuple with minimum key.
+
+        Raise ValueError exception if the priority queue is empty.
+        """
+        if self.is_empty():
+            raise ValueError('Priority queue is empty')
+        item = self._data[0]
+        return (item._key, item._value)
+
+    def remove_min(self):
+        """Remove and return (k,v) tuple with minimum key.
+
+        Raise ValueError exception if the priority queue is empty.
+        """
+        if self.is_empty():
+            raise ValueError('Priority queue is empty')
+        item = self._data[0]
+        last = self._data.pop()
+        if self._data:
+            self._place(last, 0)
+            self._downheap(0)
+        return (item._key, item._value)
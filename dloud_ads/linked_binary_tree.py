@@ -1,22 +1,28 @@
 """Linked representation of a binary tree structure."""
 
+from array import array
+from weakref import WeakValueDictionary
+
 from .binary_tree import BinaryTree
+from .owner import _Owner
 
 class LinkedBinaryTree(BinaryTree):
     """Linked representation of a binary tree structure."""
 
     class _Node:
         """Lightweight, nonpublic class for storing a node."""
-        __slots__ = '_element', '_parent', '_left', '_right'
+        __slots__ = '_element', '_parent', '_left', '_right', '_owner'
 
         def __init__(self, element, parent=None, left=None, right=None):
             self._element = element
             self._parent = parent
             self._left = left
             self._right = right
+            self._owner = None
 
     class Position(BinaryTree.Position):
         """An abstraction representing the location of a single element."""
+        __slots__ = '_container', '_node', '__weakref__'
 
         def __init__(self, container, node):
             """Constructor should not be invoked by user."""
@@ -32,29 +38,183 @@ class LinkedBinaryTree(BinaryTree):
             location."""
             return type(other) is type(self) and other._node is self._node
 
+        def __hash__(self):
+            """Return a hash value based on the identity of the node."""
+            return hash(self._node)
+
+    _NODE_WALKS = {
+        'preorder': '_preorder_nodes',
+        'postorder': '_postorder_nodes',
+        'inorder': '_inorder_nodes',
+        'breadthfirst': '_breadthfirst_nodes',
+    }
+
     def _validate(self, pos):
         """Return associated node, if position is valid."""
         if not isinstance(pos, self.Position):
             raise TypeError('p must be proper Position type')
         if pos._container is not self:
             raise ValueError('p does not belong to this container')
-        if pos._node._parent is pos._node:
+        node = pos._node
+        if node._parent is node:
             raise ValueError('p is no longer valid')
-        return pos._node
+        if node._owner is not self._owner:
+            owner = node._owner._resolve()
+            if owner is not self._owner:
+                raise ValueError('p is no longer in this container')
+            node._owner = owner
+        return node
+
+    def _make_node(self, elem, parent=None):
+        """Return a new node owned by this tree."""
+        node = self._Node(elem, parent)
+        node._owner = self._owner
+        return node
 
     def _make_position(self, node):
-        """Return Position instance for given node (or None if no node)."""
-        return self.Position(self, node) if node is not None else None
+        """Return Position instance for given node (or None if no node).
 
-    def __init__(self):
-        """Create an initially empty binary tree."""
+        If positions are interned, return the live Position for node if one
+        exists, so that repeated navigation yields the same object.
+        """
+        if node is None:
+            return None
+        if self._positions is None:
+            return self.Position(self, node)
+        pos = self._positions.get(node)
+        if pos is None:
+            pos = self.Position(self, node)
+            self._positions[node] = pos
+        return pos
+
+    def __init__(self, intern_positions=False):
+        """Create an initially empty binary tree.
+
+        If intern_positions is True, keep a weak-valued cache of the live
+        Position of each node.
+        """
         self._root = None
         self._size = 0
+        self._version = 0
+        self._owner = _Owner()
+        self._positions = WeakValueDictionary() if intern_positions else None
 
     def __len__(self):
         """Return the total number of elements in the tree."""
         return self._size
 
+    def is_empty(self):
+        """Return True if the tree is empty."""
+        return self._root is None
+
+    def _adopt(self, donor):
+        """Take ownership of every node of tree donor in O(1) time.
+
+        The donor's token is forwarded to this tree's token, and the donor
+        gets a fresh one.
+        """
+        donor._owner._forward = self._owner
+        donor._owner = _Owner()
+
+    def _restamp(self, top, owner):
+        """Stamp owner on every node of the subtree rooted at top.
+
+        Return the number of nodes stamped.
+        """
+        count = 0
+        for node in self._preorder_nodes(top):
+            node._owner = owner
+            count += 1
+        return count
+
+    def _new_empty(self):
+        """Return a new empty tree of the same kind as this one."""
+        return type(self)(intern_positions=self._positions is not None)
+
+    @classmethod
+    def from_level_order(cls, iterable):
+        """Return a complete tree whose level-order traversal yields iterable.
+
+        The elements fill the tree level by level, left to right, so the
+        element at index i has its children at indices 2i+1 and 2i+2.
+        Nodes are linked directly in O(n) time.
+        """
+        tree = cls()
+        nodes = [tree._make_node(elem) for elem in iterable]
+        for index in range(1, len(nodes)):
+            parent = nodes[(index - 1) // 2]
+            child = nodes[index]
+            child._parent = parent
+            if index % 2 == 1:
+                parent._left = child
+            else:
+                parent._right = child
+        if nodes:
+            tree._root = nodes[0]
+        tree._size = len(nodes)
+        return tree
+
+    @classmethod
+    def from_sorted(cls, seq):
+        """Return a height-balanced tree whose inorder traversal yields seq.
+
+        Nodes are linked directly in O(n) time.
+        """
+        tree = cls()
+        seq = list(seq)
+        tree._root = tree._build_balanced(seq, 0, len(seq), None)
+        tree._size = len(seq)
+        return tree
+
+    def _build_balanced(self, seq, start, stop, parent):
+        """Return the root of a balanced subtree holding seq[start:stop]."""
+        if start >= stop:
+            return None
+        mid = (start + stop) // 2
+        node = self._make_node(seq[mid], parent)
+        node._left = self._build_balanced(seq, start, mid, node)
+        node._right = self._build_balanced(seq, mid + 1, stop, node)
+        return node
+
+    @classmethod
+    def from_preorder_inorder(cls, preorder, inorder):
+        """Return the tree with the given preorder and inorder traversals.
+
+        Elements must be distinct.  Nodes are linked directly in O(n) time
+        using an explicit stack of nodes whose right subtree is pending.
+        Raise ValueError if the traversals do not describe a binary tree.
+        """
+        preorder = list(preorder)
+        inorder = list(inorder)
+        if len(preorder) != len(inorder):
+            raise ValueError('traversals must have the same length')
+        tree = cls()
+        if not preorder:
+            return tree
+        tree._root = tree._make_node(preorder[0])
+        stack = [tree._root]
+        done = 0
+        for elem in preorder[1:]:
+            node = tree._make_node(elem)
+            parent = stack[-1]
+            if parent._element != inorder[done]:
+                if parent._left is not None:
+                    raise ValueError('inconsistent preorder and inorder traversals')
+                parent._left = node
+            else:
+                while stack and done < len(inorder) and stack[-1]._element == inorder[done]:
+                    parent = stack.pop()
+                    done += 1
+                parent._right = node
+            node._parent = parent
+            stack.append(node)
+        while stack:
+            if done >= len(inorder) or stack.pop()._element != inorder[done]:
+                raise ValueError('inconsistent preorder and inorder traversals')
+            done += 1
+        tree._size = len(preorder)
+        return tree
+
     def root(self):
         """Return the root Position of the tree (or None if tree is empty)."""
         return self._make_position(self._root)
@@ -84,6 +244,38 @@ class LinkedBinaryTree(BinaryTree):
             count += 1
         return count
 
+    def children(self, pos):
+        """Generate an iteration of Positions representing p's children."""
+        node = self._validate(pos)
+        if node._left is not None:
+            yield self._make_position(node._left)
+        if node._right is not None:
+            yield self._make_position(node._right)
+
+    def __iter__(self):
+        """Generate an inorder iteration of the tree's elements."""
+        return self.iter_elements()
+
+    def iter_elements(self, order='inorder'):
+        """Generate an iteration of the tree's elements in the given order.
+
+        order is one of 'preorder', 'postorder', 'inorder' or 'breadthfirst'.
+        Nodes are walked directly, so no Position is created per element.
+        Raise ValueError if order is unknown.
+        """
+        return (node._element for node in self._iter_nodes(order))
+
+    def _iter_nodes(self, order='inorder'):
+        """Return an iteration of the tree's nodes in the given order.
+
+        Raise ValueError if order is unknown.
+        """
+        if order not in self._NODE_WALKS:
+            raise ValueError('unknown traversal order: %r' % (order,))
+        if self._root is None:
+            return iter(())
+        return getattr(self, self._NODE_WALKS[order])(self._root)
+
     def _add_root(self, elem):
         """Place element e at the root of an empty tree and return new Position.
 
@@ -92,7 +284,8 @@ class LinkedBinaryTree(BinaryTree):
         if self._root is not None:
             raise ValueError('Root exists')
         self._size = 1
-        self._root = self._Node(elem)
+        self._version += 1
+        self._root = self._make_node(elem)
         return self._make_position(self._root)
 
     def _add_left(self, pos, elem):
@@ -105,7 +298,8 @@ class LinkedBinaryTree(BinaryTree):
         if node._left is not None:
             raise ValueError('Left child exists')
         self._size += 1
-        node._left = self._Node(elem, node)
+        self._version += 1
+        node._left = self._make_node(elem, node)
         return self._make_position(node._left)
 
     def _add_right(self, pos, elem):
@@ -119,7 +313,8 @@ class LinkedBinaryTree(BinaryTree):
         if node._right is not None:
             raise ValueError('Right child exists')
         self._size += 1
-        node._right = self._Node(elem, node)
+        self._version += 1
+        node._right = self._make_node(elem, node)
         return self._make_position(node._right)
 
     def _replace(self, pos, elem):
@@ -150,6 +345,7 @@ class LinkedBinaryTree(BinaryTree):
             else:
                 parent._right = child
         self._size -= 1
+        self._version += 1
         node._parent = node
         return node._element
 
@@ -166,14 +362,292 @@ class LinkedBinaryTree(BinaryTree):
             raise ValueError('position must be leaf')
         if not type(self) is type(tree1) is type(tree2):
             raise TypeError('Tree types must match')
-        self._size += len(tree1) + len(tree2)
+        self._size += tree1._size + tree2._size
+        self._version += 1
+        tree1._version += 1
+        tree2._version += 1
         if not tree1.is_empty():
             tree1._root._parent = node
             node._left = tree1._root
             tree1._root = None
             tree1._size = 0
+            self._adopt(tree1)
         if not tree2.is_empty():
             tree2._root._parent = node
             node._right = tree2._root
             tree2._root = None
             tree2._size = 0
+            self._adopt(tree2)
+
+    def _detach(self, pos):
+        """Remove the subtree rooted at Position p and return it as a new tree.
+
+        Detaching the root moves the whole tree in O(1) time; otherwise the
+        k detached nodes are stamped with their new owner and counted in
+        O(k) time, so both sizes stay exact.  Positions of the detached
+        nodes are no longer valid; navigate the new tree for fresh ones.
+        Raise ValueError if Position p is invalid.
+        """
+        node = self._validate(pos)
+        self._version += 1
+        tree = self._new_empty()
+        tree._root = node
+        if node is self._root:
+            tree._size = self._size
+            tree._adopt(self)
+            self._root = None
+            self._size = 0
+        else:
+            parent = node._parent
+            if node is parent._left:
+                parent._left = None
+            else:
+                parent._right = None
+            node._parent = None
+            tree._size = self._restamp(node, tree._owner)
+            self._size -= tree._size
+        return tree
+
+    def _graft_left(self, pos, tree):
+        """Attach tree as the left subtree of Position p, in O(1) time.
+
+        As a side effect, set tree to empty.
+        Raise TypeError if tree does not match type of this tree.
+        Raise ValueError if Position p is invalid or p already has a left child.
+        """
+        node = self._validate(pos)
+        if node._left is not None:
+            raise ValueError('Left child exists')
+        root = self._take_root(tree)
+        if root is not None:
+            root._parent = node
+            node._left = root
+
+    def _graft_right(self, pos, tree):
+        """Attach tree as the right subtree of Position p, in O(1) time.
+
+        As a side effect, set tree to empty.
+        Raise TypeError if tree does not match type of this tree.
+        Raise ValueError if Position p is invalid or p already has a right child.
+        """
+        node = self._validate(pos)
+        if node._right is not None:
+            raise ValueError('Right child exists')
+        root = self._take_root(tree)
+        if root is not None:
+            root._parent = node
+            node._right = root
+
+    def _take_root(self, tree):
+        """Empty tree, add its size to this tree and return its former root."""
+        if type(self) is not type(tree):
+            raise TypeError('Tree types must match')
+        if tree is self:
+            raise ValueError('Cannot graft a tree onto itself')
+        root = tree._root
+        self._size += tree._size
+        self._version += 1
+        tree._version += 1
+        self._adopt(tree)
+        tree._root = None
+        tree._size = 0
+        return root
+
+    def _swap_subtrees(self, pos1, pos2):
+        """Exchange the subtrees rooted at Positions p and q.
+
+        Pointer work is O(1); checking that neither position is an ancestor
+        of the other takes O(depth) time.
+        Raise ValueError if a Position is invalid or one contains the other.
+        """
+        node1 = self._validate(pos1)
+        node2 = self._validate(pos2)
+        if node1 is node2:
+            return
+        for top, other in ((node1, node2), (node2, node1)):
+            walk = other
+            while walk is not None:
+                if walk is top:
+                    raise ValueError('Subtrees overlap')
+                walk = walk._parent
+        self._version += 1
+        parent1, parent2 = node1._parent, node2._parent
+        left1, left2 = node1 is parent1._left, node2 is parent2._left
+        if left1:
+            parent1._left = node2
+        else:
+            parent1._right = node2
+        if left2:
+            parent2._left = node1
+        else:
+            parent2._right = node1
+        node1._parent, node2._parent = parent2, parent1
+
+    def _delete_subtree(self, pos):
+        """Delete the whole subtree rooted at Position p.
+
+        Return the element that had been stored at Position p.
+        Deleting the root empties the tree in O(1) time; otherwise the k
+        deleted nodes are stamped with an ownerless token and counted in
+        O(k) time, so the size stays exact and their positions invalid.
+        Raise ValueError if Position p is invalid.
+        """
+        node = self._validate(pos)
+        self._version += 1
+        if node is self._root:
+            self._owner = _Owner()
+            self._root = None
+            self._size = 0
+        else:
+            parent = node._parent
+            if node is parent._left:
+                parent._left = None
+            else:
+                parent._right = None
+            self._size -= self._restamp(node, _Owner())
+        node._parent = node
+        return node._element
+
+    def depth(self, pos):
+        """Return the number of levels separating Position p from the root."""
+        node = self._validate(pos)
+        count = 0
+        while node._parent is not None:
+            node = node._parent
+            count += 1
+        return count
+
+    def _height2(self, pos):
+        """Return the height of the subtree rooted at Position p."""
+        best = 0
+        stack = [(self._validate(pos), 0)]
+        while stack:
+            node, level = stack.pop()
+            if level > best:
+                best = level
+            if node._left is not None:
+                stack.append((node._left, level + 1))
+            if node._right is not None:
+                stack.append((node._right, level + 1))
+        return best
+
+    def _preorder_parents(self):
+        """Return an array mapping each preorder rank to its parent's rank.
+
+        The root is mapped to -1.
+        """
+        parents = array('l')
+        if self._root is None:
+            return parents
+        stack = [(self._root, -1)]
+        while stack:
+            node, parent = stack.pop()
+            index = len(parents)
+            parents.append(parent)
+            if node._right is not None:
+                stack.append((node._right, index))
+            if node._left is not None:
+                stack.append((node._left, index))
+        return parents
+
+    def _subtree_preorder(self, pos):
+        """Generate a preorder iteration of positions in subtree rooted at p."""
+        for node in self._preorder_nodes(self._validate(pos)):
+            yield self._make_position(node)
+
+    def _subtree_postorder(self, pos):
+        """Generate a postorder iteration of positions in subtree rooted at p."""
+        for node in self._postorder_nodes(self._validate(pos)):
+            yield self._make_position(node)
+
+    def _subtree_inorder(self, pos):
+        """Generate an inorder iteration of positions in subtree rooted at p."""
+        for node in self._inorder_nodes(self._validate(pos)):
+            yield self._make_position(node)
+
+    def breadthfirst(self):
+        """Generate a breadth-first iteration of the positions of the tree."""
+        if self._root is not None:
+            for node in self._breadthfirst_nodes(self._root):
+                yield self._make_position(node)
+
+    @staticmethod
+    def _preorder_nodes(top):
+        """Generate a preorder iteration of the nodes in subtree rooted at top.
+
+        Walks parent pointers instead of keeping a stack, so it uses O(1)
+        extra space and O(1) amortized time per node.
+        """
+        node = top
+        while node is not None:
+            yield node
+            if node._left is not None:
+                node = node._left
+            elif node._right is not None:
+                node = node._right
+            else:
+                while node is not top:
+                    parent = node._parent
+                    if node is parent._left and parent._right is not None:
+                        node = parent._right
+                        break
+                    node = parent
+                else:
+                    node = None
+
+    @staticmethod
+    def _postorder_nodes(top):
+        """Generate a postorder iteration of the nodes in subtree rooted at top.
+
+        Walks parent pointers instead of keeping a stack.
+        """
+        node = top
+        while True:
+            while node._left is not None or node._right is not None:
+                node = node._left if node._left is not None else node._right
+            while True:
+                yield node
+                if node is top:
+                    return
+                parent = node._parent
+                if node is parent._left and parent._right is not None:
+                    node = parent._right
+                    break
+                node = parent
+
+    @staticmethod
+    def _inorder_nodes(top):
+        """Generate an inorder iteration of the nodes in subtree rooted at top.
+
+        Walks parent pointers instead of keeping a stack.
+        """
+        node = top
+        while node._left is not None:
+            node = node._left
+        while node is not None:
+            yield node
+            if node._right is not None:
+                node = node._right
+                while node._left is not None:
+                    node = node._left
+            else:
+                while node is not top and node is node._parent._right:
+                    node = node._parent
+                node = None if node is top else node._parent
+
+    @staticmethod
+    def _breadthfirst_nodes(top):
+        """Generate a breadth-first iteration of the nodes in subtree rooted at top.
+
+        Processes one level at a time, collecting the next level in a list.
+        """
+        level = [top]
+        while level:
+            fringe = []
+            for node in level:
+                yield node
+                if node._left is not None:
+                    fringe.append(node._left)
+                if node._right is not None:
+                    fringe.append(node._right)
+            level = fringe
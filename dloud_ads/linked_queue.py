@@ -1,5 +1,7 @@
 """FIFO queue implementation using a singly linked list for storage."""
 
+from .node_pool import _NodePool
+
 class LinkedQueue:
     """FIFO queue implementation using a singly linked list for storage."""
     class _Node:
@@ -10,11 +12,16 @@ class LinkedQueue:
             self._element = element
             self._next = next_node
 
-    def __init__(self):
-        """Create an empty queue."""
+    def __init__(self, pool_size=0):
+        """Create an empty queue.
+
+        If pool_size is positive, up to pool_size unlinked nodes are kept
+        for reuse instead of being allocated anew.
+        """
         self._head = None
         self._tail = None
         self._size = 0
+        self._pool = _NodePool(pool_size) if pool_size else None
 
     def __len__(self):
         """Return the number of elements in the queue."""
@@ -40,19 +47,30 @@ class LinkedQueue:
         """
         if self.is_empty():
             raise ValueError('Queue is empty')
-        answer = self._head._element
-        self._head = self._head._next
+        head = self._head
+        answer = head._element
+        self._head = head._next
         self._size -= 1
         if self.is_empty():
             self._tail = None
+        if self._pool is not None:
+            head._element = head._next = None
+            self._pool.release(head)
         return answer
 
     def enqueue(self, element):
         """Add an element to the back of queue."""
-        newest = self._Node(element, None)
+        if self._pool is None:
+            newest = self._Node(element, None)
+        else:
+            newest = self._pool.acquire(self._Node, element, None)
         if self.is_empty():
             self._head = newest
         else:
             self._tail._next = newest
         self._tail = newest
         self._size += 1
+
+    def pool_stats(self):
+        """Return node pool statistics (or None if pooling is disabled)."""
+        return self._pool.stats() if self._pool is not None else None
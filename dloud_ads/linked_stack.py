@@ -1,5 +1,7 @@
 """LIFO Stack implementation using a singly linked list for storage."""
 
+from .node_pool import _NodePool
+
 class LinkedStack:
     """LIFO Stack implementation using a singly linked list for storage."""
     class _Node:
@@ -10,10 +12,15 @@ class LinkedStack:
             self._element = element
             self._next = next_node
 
-    def __init__(self):
-        """Create an empty stack."""
+    def __init__(self, pool_size=0):
+        """Create an empty stack.
+
+        If pool_size is positive, up to pool_size unlinked nodes are kept
+        for reuse instead of being allocated anew.
+        """
         self._head = None
         self._size = 0
+        self._pool = _NodePool(pool_size) if pool_size else None
 
     def __len__(self):
         """Return the number of elements in the stack."""
@@ -25,7 +32,10 @@ class LinkedStack:
 
     def push(self, element):
         """Add element e to the top of the stack."""
-        self._head = self._Node(element, self._head)
+        if self._pool is None:
+            self._head = self._Node(element, self._head)
+        else:
+            self._head = self._pool.acquire(self._Node, element, self._head)
         self._size += 1
 
     def top(self):
@@ -44,7 +54,74 @@ class LinkedStack:
         """
         if self.is_empty():
             raise ValueError('Stack is empty')
-        answer = self._head._element
-        self._head = self._head._next
+        head = self._head
+        answer = head._element
+        self._head = head._next
         self._size -= 1
+        if self._pool is not None:
+            head._element = head._next = None
+            self._pool.release(head)
         return answer
+
+    def push_many(self, iterable):
+        """Add the elements of iterable, in order, to the top of the stack.
+
+        The nodes are chained in a single pass, so the last element ends
+        up at the top of the stack.
+        """
+        head = self._head
+        count = 0
+        if self._pool is None:
+            node_class = self._Node
+            for element in iterable:
+                head = node_class(element, head)
+                count += 1
+        else:
+            acquire = self._pool.acquire
+            for element in iterable:
+                head = acquire(self._Node, element, head)
+                count += 1
+        self._head = head
+        self._size += count
+
+    def pop_many(self, count):
+        """Remove and return a list of the top count elements, top first
+        (i.e., LIFO).
+
+        Raise ValueError exception if the stack has fewer than count elements.
+        """
+        if count < 0 or count > self._size:
+            raise ValueError('Stack has fewer than %d elements' % count)
+        answer = []
+        head = self._head
+        if self._pool is None:
+            for _ in range(count):
+                answer.append(head._element)
+                head = head._next
+        else:
+            for _ in range(count):
+                answer.append(head._element)
+                node, head = head, head._next
+                node._element = node._next = None
+                self._pool.release(node)
+        self._head = head
+        self._size -= count
+        return answer
+
+    def peek_many(self, count):
+        """Return (but do not remove) a list of the top count elements, top first.
+
+        Raise ValueError exception if the stack has fewer than count elements.
+        """
+        if count < 0 or count > self._size:
+            raise ValueError('Stack has fewer than %d elements' % count)
+        answer = []
+        walk = self._head
+        for _ in range(count):
+            answer.append(walk._element)
+            walk = walk._next
+        return answer
+
+    def pool_stats(self):
+        """Return node pool statistics (or None if pooling is disabled)."""
+        return self._pool.stats() if self._pool is not None else None
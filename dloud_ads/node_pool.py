@@ -0,0 +1,61 @@
+"""A bounded free list of nodes, recycled by linked containers."""
+
+class _NodePool:
+    """Bounded free list of nodes for reuse by a linked container.
+
+    Containers that opt in release the nodes they unlink and acquire
+    recycled nodes instead of allocating new ones, so steady-state
+    insert/remove cycles allocate nothing once the pool is warm.
+    """
+    __slots__ = '_free', '_capacity', '_allocated', '_reused', '_discarded'
+
+    def __init__(self, capacity):
+        """Create an empty pool holding at most capacity nodes.
+
+        Raise ValueError if capacity is negative.
+        """
+        if capacity < 0:
+            raise ValueError('capacity must be non-negative')
+        self._free = []
+        self._capacity = capacity
+        self._allocated = 0
+        self._reused = 0
+        self._discarded = 0
+
+    def __len__(self):
+        """Return the number of nodes available for reuse."""
+        return len(self._free)
+
+    def acquire(self, node_class, *args):
+        """Return a node_class node initialized with args.
+
+        A free node is reinitialized if one is available; otherwise a new
+        node is allocated.
+        """
+        if self._free:
+            node = self._free.pop()
+            node.__init__(*args)
+            self._reused += 1
+            return node
+        self._allocated += 1
+        return node_class(*args)
+
+    def release(self, node):
+        """Keep an unlinked node for reuse, unless the pool is full.
+
+        The caller must clear the node's references beforehand.
+        """
+        if len(self._free) < self._capacity:
+            self._free.append(node)
+        else:
+            self._discarded += 1
+
+    def stats(self):
+        """Return a dictionary of pool statistics."""
+        return {
+            'capacity': self._capacity,
+            'free': len(self._free),
+            'allocated': self._allocated,
+            'reused': self._reused,
+            'discarded': self._discarded,
+        }
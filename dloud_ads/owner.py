@@ -0,0 +1,21 @@
+"""Nonpublic ownership token stamped on the nodes of a linked container."""
+
+class _Owner:
+    """Nonpublic ownership token stamped on the nodes of a linked container.
+
+    When every node of one container moves to another at once, the old
+    token is forwarded to the receiving container's token instead of
+    restamping every node, so the owner of a node is the token at the end
+    of its forwarding chain.
+    """
+    __slots__ = '_forward',
+
+    def __init__(self):
+        self._forward = None
+
+    def _resolve(self):
+        """Return the token at the end of the forwarding chain."""
+        owner = self
+        while owner._forward is not None:
+            owner = owner._forward
+        return owner
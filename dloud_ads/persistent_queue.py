@@ -0,0 +1,313 @@
+"""FIFO queue of byte records stored in a memory-mapped file."""
+
+import mmap
+import os
+import struct
+
+from .array_queue import ArrayQueue
+
+class PersistentQueue:
+    """FIFO queue of byte records stored in a memory-mapped file.
+
+    The file holds a header followed by a circular array of fixed-width,
+    length-prefixed slots, laid out as in ArrayQueue: the header records
+    the front index and size, and the power-of-two capacity doubles when
+    full and halves when less than a quarter full.  Resizing rewrites the
+    records in order from slot 0 into a new file that atomically replaces
+    the old one, which also compacts away the space of dequeued records.
+    The queue survives process restarts and may exceed RAM, since only
+    the pages being touched need to be resident and resizing copies
+    between the files in bounded chunks.
+
+    Records are written before the header that makes them visible.  When
+    the sync_every policy flushes, the slots written since the last flush
+    are flushed first and the header afterwards, so with sync_every=1 the
+    header on disk never refers to records that are not.
+    """
+    DEFAULT_CAPACITY = 1024     # must be a power of two
+    DEFAULT_RECORD_SIZE = 256
+    # magic, record_size, min_capacity, capacity, front, size
+    _HEADER = struct.Struct('<8sQQQQQ')
+    _MIN_CAPACITY = struct.Struct('<Q')
+    _MIN_CAPACITY_OFFSET = 16
+    _STATE = struct.Struct('<QQ')       # front, size
+    _STATE_OFFSET = 32
+    _LENGTH = struct.Struct('<I')
+    _MAGIC = b'DLADSPQ1'
+    _DATA_OFFSET = 64
+    _COPY_CHUNK = 1 << 20       # bytes copied at a time when resizing
+    _BATCH = 4096               # records buffered at a time by enqueue_many
+    _MAX_DIRTY = 64             # dirty runs tracked before flushing everything
+
+    def __init__(self, path, record_size=None, capacity=None, sync_every=1):
+        """Open the queue stored at path, creating the file if needed.
+
+        record_size is the largest record in bytes, fixed when the file is
+        created.  capacity is a hint for the number of records the queue
+        will hold; it is rounded up to a power of two and becomes the
+        minimum capacity stored in the file.  The file is flushed to disk
+        after every sync_every calls that change the queue (a batch call
+        counts once); 0 leaves flushing to the operating system, flush and
+        close.
+        Raise ValueError if the file is not a queue or was created with a
+        different record_size.
+        """
+        self._path = path
+        self._sync_every = sync_every
+        self._unsynced = 0
+        if not os.path.exists(path):
+            if record_size is None:
+                record_size = PersistentQueue.DEFAULT_RECORD_SIZE
+            if capacity is None:
+                capacity = PersistentQueue.DEFAULT_CAPACITY
+            cap = ArrayQueue._capacity_for(capacity)
+            self._write_file(path, record_size, cap, cap, 0, [])
+        self._open()
+        if record_size is not None and record_size != self._record_size:
+            self.close()
+            raise ValueError('record_size does not match the queue file')
+        if capacity is not None:
+            cap = ArrayQueue._capacity_for(capacity)
+            if cap != self._min_capacity:
+                self._min_capacity = cap
+                self._MIN_CAPACITY.pack_into(self._map, self._MIN_CAPACITY_OFFSET, cap)
+                if cap > self._capacity:
+                    self._resize(cap)
+
+    def _open(self):
+        """Map the queue file and load its header."""
+        with open(self._path, 'r+b') as file:
+            self._map = mmap.mmap(file.fileno(), 0)
+        magic, record_size, min_capacity, capacity, front, size = \
+            self._HEADER.unpack_from(self._map, 0)
+        if magic != self._MAGIC:
+            self._map.close()
+            raise ValueError('%s is not a persistent queue' % self._path)
+        self._record_size = record_size
+        self._min_capacity = min_capacity
+        self._stride = record_size + self._LENGTH.size
+        self._capacity = capacity
+        self._front = front
+        self._size = size
+        self._dirty = []        # runs written since the last flush, None if too many
+
+    def _write_file(self, path, record_size, min_capacity, capacity, size, runs):
+        """Write a new queue file publishing size records, holding the slots
+        copied in order from the (offset, length) runs of the current file.
+
+        The slots are copied in chunks of at most _COPY_CHUNK bytes.
+        """
+        with open(path, 'wb') as file:
+            file.write(self._HEADER.pack(self._MAGIC, record_size, min_capacity,
+                                         capacity, 0, size))
+            file.seek(self._DATA_OFFSET)
+            for offset, length in runs:
+                stop = offset + length
+                while offset < stop:
+                    step = min(self._COPY_CHUNK, stop - offset)
+                    file.write(self._map[offset:offset + step])
+                    offset += step
+            file.truncate(self._DATA_OFFSET + capacity * (record_size + self._LENGTH.size))
+            file.flush()
+            os.fsync(file.fileno())
+
+    def __len__(self):
+        """Return the number of records in the queue."""
+        return self._size
+
+    def is_empty(self):
+        """Return True if the queue is empty."""
+        return self._size == 0
+
+    def _offset(self, index):
+        """Return the file offset of the slot at circular index."""
+        return self._DATA_OFFSET + (index & (self._capacity - 1)) * self._stride
+
+    def _slot(self, record):
+        """Return the slot bytes for a record.
+
+        Raise ValueError if the record is longer than record_size.
+        """
+        if len(record) > self._record_size:
+            raise ValueError('record is larger than record_size')
+        return self._LENGTH.pack(len(record)) + bytes(record).ljust(self._record_size, b'\0')
+
+    def _record(self, offset):
+        """Return the record stored in the slot at offset."""
+        size = self._LENGTH.unpack_from(self._map, offset)[0]
+        start = offset + self._LENGTH.size
+        return self._map[start:start + size]
+
+    def _runs(self, start, count):
+        """Return the (offset, length) pairs of the at most two contiguous
+        byte runs holding count slots from circular index start."""
+        first = start & (self._capacity - 1)
+        head = min(count, self._capacity - first)
+        runs = [(self._offset(first), head * self._stride)]
+        if head < count:
+            runs.append((self._DATA_OFFSET, (count - head) * self._stride))
+        return runs
+
+    def _write_run(self, offset, data):
+        """Write data into the slots at offset and remember them as dirty."""
+        self._map[offset:offset + len(data)] = data
+        if self._dirty is not None:
+            self._dirty.append((offset, len(data)))
+            if len(self._dirty) > self._MAX_DIRTY:
+                self._dirty = None
+
+    def _flush_range(self, offset, length):
+        """Flush the bytes from offset to offset + length to disk."""
+        start = offset - offset % mmap.ALLOCATIONGRANULARITY
+        self._map.flush(start, offset + length - start)
+
+    def _flush_records(self):
+        """Flush the slots written since the last flush to disk."""
+        if self._dirty is None:
+            self._map.flush()
+        else:
+            for offset, length in self._dirty:
+                self._flush_range(offset, length)
+        self._dirty = []
+
+    def _commit(self, front, size):
+        """Publish a new front and size, and flush if the policy requires it.
+
+        When flushing, the slots are flushed before the header is written.
+        """
+        self._unsynced += 1
+        due = self._sync_every and self._unsynced >= self._sync_every
+        if due:
+            self._flush_records()
+        self._STATE.pack_into(self._map, self._STATE_OFFSET, front, size)
+        self._front = front
+        self._size = size
+        if due:
+            self._flush_range(0, self._DATA_OFFSET)
+            self._unsynced = 0
+
+    def first(self):
+        """Return (but do not remove) the record at the front of the queue.
+
+        Raise ValueError exception if the queue is empty.
+        """
+        if self.is_empty():
+            raise ValueError('Queue is empty')
+        return self._record(self._offset(self._front))
+
+    def enqueue(self, record):
+        """Add a record (bytes-like) to the back of the queue.
+
+        Raise ValueError if the record is longer than record_size.
+        """
+        slot = self._slot(record)
+        if self._size == self._capacity:
+            self._resize(2 * self._capacity)
+        self._write_run(self._offset(self._front + self._size), slot)
+        self._commit(self._front, self._size + 1)
+
+    def enqueue_many(self, records):
+        """Add the records of an iterable, in order, to the back of the queue.
+
+        The records are buffered _BATCH at a time, and each batch is written
+        with at most two slice assignments after the slots of the previous
+        ones; the header is updated once, at the end.
+        Raise ValueError, adding nothing, if a record is longer than
+        record_size.
+        """
+        pending = 0
+        batch = []
+        for record in records:
+            batch.append(self._slot(record))
+            if len(batch) == self._BATCH:
+                self._write_pending(pending, batch)
+                pending += len(batch)
+                batch = []
+        if batch:
+            self._write_pending(pending, batch)
+            pending += len(batch)
+        if pending:
+            self._commit(self._front, self._size + pending)
+
+    def _write_pending(self, pending, slots):
+        """Write slots after the pending slots not yet published by the header,
+        doubling the capacity as needed."""
+        count = self._size + pending + len(slots)
+        if count > self._capacity:
+            cap = self._capacity
+            while cap < count:
+                cap *= 2
+            self._resize(cap, self._size + pending)
+        data = b''.join(slots)
+        written = 0
+        for offset, length in self._runs(self._front + self._size + pending, len(slots)):
+            self._write_run(offset, data[written:written + length])
+            written += length
+
+    def dequeue(self):
+        """Remove and return the first record of the queue (i.e., FIFO).
+
+        Raise ValueError exception if the queue is empty.
+        """
+        answer = self.first()
+        self._commit((self._front + 1) & (self._capacity - 1), self._size - 1)
+        self._shrink()
+        return answer
+
+    def dequeue_many(self, count):
+        """Remove and return a list of the first count records of the queue.
+
+        The slots are read with at most two slice operations and the header
+        is updated once.
+        Raise ValueError exception if the queue has fewer than count records.
+        """
+        if count < 0 or count > self._size:
+            raise ValueError('Queue has fewer than %d records' % count)
+        answer = []
+        for offset, length in self._runs(self._front, count):
+            run = self._map[offset:offset + length]
+            for start in range(0, length, self._stride):
+                size = self._LENGTH.unpack_from(run, start)[0]
+                start += self._LENGTH.size
+                answer.append(run[start:start + size])
+        if count:
+            self._commit((self._front + count) & (self._capacity - 1), self._size - count)
+            self._shrink()
+        return answer
+
+    def _shrink(self):
+        """Halve the capacity while the queue is less than a quarter full."""
+        cap = self._capacity
+        while self._size < cap // 4 and cap > self._min_capacity:
+            cap //= 2
+        if cap < self._capacity:
+            self._resize(cap)
+
+    def _resize(self, cap, count=None):
+        """Rewrite the queue into a new file of capacity cap.
+
+        The first count slots from the front (by default len(self)) are
+        copied, but only len(self) records are published.
+        """
+        if count is None:
+            count = self._size
+        runs = self._runs(self._front, count) if count else []
+        temp = self._path + '.tmp'
+        self._write_file(temp, self._record_size, self._min_capacity, cap,
+                         self._size, runs)
+        self._map.close()
+        os.replace(temp, self._path)
+        self._open()
+
+    def flush(self):
+        """Write all changes to disk, the records before the header."""
+        self._flush_records()
+        self._flush_range(0, self._DATA_OFFSET)
+        self._unsynced = 0
+
+    def close(self):
+        """Flush the queue and unmap its file."""
+        if self._map.closed:
+            return
+        self.flush()
+        self._map.close()
@@ -1,9 +1,20 @@
 """A sequential container of elements allowing positional access."""
 
+from weakref import WeakValueDictionary
+
 from .doubly_linked_base import _DoublyLinkedBase
+from .owner import _Owner
 
 class PositionalList(_DoublyLinkedBase):
     """A sequential container of elements allowing positional access."""
+    class _Node(_DoublyLinkedBase._Node):
+        """Node class with a field recording the owner of the node."""
+        __slots__ = '_owner',
+
+        def __init__(self, element, prev, next_element):
+            _DoublyLinkedBase._Node.__init__(self, element, prev, next_element)
+            self._owner = None
+
     class Position:
         """An abstraction representing the location of a single element.
 
@@ -12,6 +23,7 @@ class PositionalList(_DoublyLinkedBase):
         syntax 'p == q' rather than 'p is q' when testing equivalence of
         positions.
         """
+        __slots__ = '_container', '_node', '__weakref__'
 
         def __init__(self, container, node):
             """Constructor should not be invoked by user."""
@@ -30,22 +42,53 @@ class PositionalList(_DoublyLinkedBase):
             """Return True if other does not represent the same location."""
             return not self == other
 
+        def __hash__(self):
+            """Return a hash value based on the identity of the node."""
+            return hash(self._node)
+
+    def __init__(self, intern_positions=False, pool_size=0):
+        """Create an empty list.
+
+        If intern_positions is True, keep a weak-valued cache of the live
+        Position of each node.  If pool_size is positive, deleted nodes are
+        recycled; a Position of a deleted element must then never be used
+        again, since its node may come back to life holding a new element.
+        """
+        _DoublyLinkedBase.__init__(self, pool_size)
+        self._owner = _Owner()
+        self._positions = WeakValueDictionary() if intern_positions else None
+
     def _validate(self, pos):
         """Return position's node, or raise appropriate error if invalid."""
         if not isinstance(pos, self.Position):
             raise TypeError('p must be proper Position type')
         if pos._container is not self:
             raise ValueError('p does not belong to this container')
-        if pos._node._next is None:
+        node = pos._node
+        if node._next is None:
             raise ValueError('p is no longer valid')
-        return pos._node
+        if node._owner is not self._owner:
+            owner = node._owner._resolve()
+            if owner is not self._owner:
+                raise ValueError('p is no longer in this container')
+            node._owner = owner
+        return node
 
     def _make_position(self, node):
-        """Return Position instance for given node (or None if sentinel)."""
+        """Return Position instance for given node (or None if sentinel).
+
+        If positions are interned, return the live Position for node if one
+        exists, so that repeated navigation yields the same object.
+        """
         if node is self._header or node is self._trailer:
             return None
-
-        return self.Position(self, node)
+        if self._positions is None:
+            return self.Position(self, node)
+        pos = self._positions.get(node)
+        if pos is None:
+            pos = self.Position(self, node)
+            self._positions[node] = pos
+        return pos
 
     def first(self):
         """Return the first Position in the list (or None if list is empty)."""
@@ -67,16 +110,88 @@ class PositionalList(_DoublyLinkedBase):
 
     def __iter__(self):
         """Generate a forward iteration of the elements of the list."""
-        cursor = self.first()
-        while cursor is not None:
-            yield cursor.element()
-            cursor = self.after(cursor)
+        trailer = self._trailer
+        node = self._header._next
+        while node is not trailer:
+            yield node._element
+            node = node._next
+
+    def __reversed__(self):
+        """Generate a backward iteration of the elements of the list."""
+        header = self._header
+        node = self._trailer._prev
+        while node is not header:
+            yield node._element
+            node = node._prev
+
+    def positions(self):
+        """Generate a forward iteration of the Positions of the list."""
+        trailer = self._trailer
+        node = self._header._next
+        while node is not trailer:
+            yield self._make_position(node)
+            node = node._next
+
+    def reversed_positions(self):
+        """Generate a backward iteration of the Positions of the list."""
+        header = self._header
+        node = self._trailer._prev
+        while node is not header:
+            yield self._make_position(node)
+            node = node._prev
+
+    def iter_range(self, start=None, stop=None):
+        """Generate the elements from Position start up to, but excluding,
+        Position stop.
+
+        A start of None begins at the first element and a stop of None
+        runs to the end of the list, as with slicing.  The order of the
+        positions is checked with a pointer walk before anything is yielded.
+        Raise ValueError if a Position is invalid or stop precedes start.
+        """
+        node = self._header._next if start is None else self._validate(start)
+        end = self._trailer if stop is None else self._validate(stop)
+        trailer = self._trailer
+        if end is not trailer:
+            walk = node
+            while walk is not end:
+                if walk is trailer:
+                    raise ValueError('stop does not follow start')
+                walk = walk._next
+        while node is not end:
+            yield node._element
+            node = node._next
 
     def _insert_between(self, elem, predecessor, successor):
         """Add element between existing nodes and return new Position."""
         node = _DoublyLinkedBase._insert_between(self, elem, predecessor, successor)
+        node._owner = self._owner
         return self._make_position(node)
 
+    def _insert_chain(self, elements, predecessor, successor):
+        """Add the given elements, in order, between two existing nodes.
+
+        Return the number of elements added.
+        """
+        count = _DoublyLinkedBase._insert_chain(self, elements, predecessor, successor)
+        owner = self._owner
+        node = predecessor._next
+        while node is not successor:
+            node._owner = owner
+            node = node._next
+        return count
+
+    def concat(self, other):
+        """Move every element of other to the back of this list, in O(1) time.
+
+        As a side effect, other becomes empty.  Positions of the moved
+        elements are no longer valid; navigate this list for fresh ones.
+        Raise TypeError if other does not match the type of this list.
+        """
+        _DoublyLinkedBase.concat(self, other)
+        other._owner._forward = self._owner
+        other._owner = _Owner()
+
     def add_first(self, element):
         """Insert element e at the front of the list and return new Position."""
         return self._insert_between(element, self._header, self._header._next)
@@ -95,6 +210,42 @@ class PositionalList(_DoublyLinkedBase):
         original = self._validate(pos)
         return self._insert_between(elem, original, original._next)
 
+    def extend_after(self, pos, iterable):
+        """Insert the elements of iterable, in order, after Position p."""
+        original = self._validate(pos)
+        self._insert_chain(iterable, original, original._next)
+
+    def splice(self, other, first, last):
+        """Move the elements from Position first through Position last of
+        list other to the back of this list.
+
+        Nodes are relinked rather than copied; the only cost beyond O(1)
+        is the walk over the moved run that counts it and stamps it with
+        its new owner, which allocates nothing.  Positions of the moved
+        elements are no longer valid; navigate this list for fresh ones.
+        Raise TypeError if other does not match the type of this list.
+        Raise ValueError if a Position is invalid or last precedes first.
+        """
+        if type(other) is not type(self):
+            raise TypeError('List types must match')
+        if other is self:
+            raise ValueError('Cannot splice a list into itself')
+        start = other._validate(first)
+        end = other._validate(last)
+        count = 1
+        walk = start
+        while walk is not end:
+            walk = walk._next
+            if walk is other._trailer:
+                raise ValueError('last does not follow first')
+            count += 1
+        owner = self._owner
+        walk = start
+        for _ in range(count):
+            walk._owner = owner
+            walk = walk._next
+        self._move_chain(other, start, end, count, self._trailer._prev, self._trailer)
+
     def delete(self, pos):
         """Remove and return the element at Position p."""
         original = self._validate(pos)
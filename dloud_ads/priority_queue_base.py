@@ -0,0 +1,24 @@
+"""Abstract base class for a priority queue."""
+
+class PriorityQueueBase:
+    """Abstract base class for a priority queue."""
+
+    class _Item:
+        """Lightweight composite to store priority queue items."""
+        __slots__ = '_key', '_value'
+
+        def __init__(self, key, value):
+            self._key = key
+            self._value = value
+
+        def __lt__(self, other):
+            """Compare items based on their keys."""
+            return self._key < other._key
+
+    def __len__(self):
+        """Return the number of items in the priority queue."""
+        raise NotImplementedError('must be implemented by subclass')
+
+    def is_empty(self):
+        """Return True if the priority queue is empty."""
+        return len(self) == 0
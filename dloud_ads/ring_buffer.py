@@ -0,0 +1,101 @@
+"""Bounded FIFO ring buffer built on the circular layout of ArrayQueue."""
+
+from .array_queue import ArrayQueue
+
+class RingBuffer(ArrayQueue):
+    """Bounded FIFO ring buffer built on the circular layout of ArrayQueue.
+
+    The underlying list is allocated once and never resized.  When the
+    buffer holds maxlen elements, adding another one either overwrites the
+    oldest element, raises ValueError, or is rejected by returning False,
+    depending on the on_full policy given at construction.
+    """
+    OVERWRITE = 'overwrite'
+    RAISE = 'raise'
+    REJECT = 'reject'
+
+    def __init__(self, maxlen, on_full=OVERWRITE):
+        """Create an empty ring buffer holding at most maxlen elements.
+
+        on_full is one of RingBuffer.OVERWRITE, RingBuffer.RAISE or
+        RingBuffer.REJECT.
+        Raise ValueError if maxlen is not positive or on_full is unknown.
+        """
+        if maxlen < 1:
+            raise ValueError('maxlen must be positive')
+        if on_full not in (self.OVERWRITE, self.RAISE, self.REJECT):
+            raise ValueError('unknown on_full policy: %r' % (on_full,))
+        ArrayQueue.__init__(self, capacity=maxlen)
+        self._maxlen = maxlen
+        self._on_full = on_full
+
+    def is_full(self):
+        """Return True if the ring buffer holds maxlen elements."""
+        return self._size == self._maxlen
+
+    def enqueue(self, element):
+        """Add an element to the back of the ring buffer.
+
+        Return True if the element was added, or False if the buffer is
+        full and its policy is REJECT.
+        Raise ValueError exception if the buffer is full and its policy is RAISE.
+        """
+        if self._size == self._maxlen:
+            if self._on_full == self.REJECT:
+                return False
+            if self._on_full == self.RAISE:
+                raise ValueError('Queue is full')
+            self._data[self._front] = self._VACANT
+            self._front = (self._front + 1) & (len(self._data) - 1)
+            self._size -= 1
+        ArrayQueue.enqueue(self, element)
+        return True
+
+    def enqueue_many(self, iterable):
+        """Add the elements of iterable, in order, to the back of the buffer.
+
+        Elements are added all or nothing: return True if they were added,
+        or False if they do not fit and the policy is REJECT.  With the
+        OVERWRITE policy, only the newest maxlen elements are kept.
+        Raise ValueError exception if they do not fit and the policy is RAISE.
+        """
+        items = list(iterable)
+        excess = self._size + len(items) - self._maxlen
+        if excess > 0:
+            if self._on_full == self.REJECT:
+                return False
+            if self._on_full == self.RAISE:
+                raise ValueError('Queue is full')
+            if len(items) > self._maxlen:
+                items = items[-self._maxlen:]
+            self.dequeue_many(min(excess, self._size))
+        ArrayQueue.enqueue_many(self, items)
+        return True
+
+    def peek(self, index):
+        """Return (but do not remove) the element index places from the front.
+
+        Negative indices count from the back, as with lists.
+        Raise IndexError exception if index is out of range.
+        """
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError('ring buffer index out of range')
+        return self._data[(self._front + index) & (len(self._data) - 1)]
+
+    def snapshot(self):
+        """Return a list of the elements, front to back, using at most two
+        slice copies."""
+        return self._copy_out(self._size)
+
+    def reserve(self, count):
+        """Check that the buffer can hold count elements; storage is fixed.
+
+        Raise ValueError if count exceeds maxlen.
+        """
+        if count > self._maxlen:
+            raise ValueError('count exceeds maxlen')
+
+    def shrink_to_fit(self):
+        """Do nothing, since the storage of a ring buffer is fixed."""
@@ -0,0 +1,212 @@
+"""Single-producer/single-consumer ring queue in shared memory."""
+
+import struct
+from itertools import islice
+from multiprocessing import shared_memory
+
+from .array_queue import ArrayQueue
+
+class SharedRingQueue:
+    """Single-producer/single-consumer ring queue in shared memory.
+
+    Records live in fixed-size slots of a multiprocessing.shared_memory
+    block, indexed like ArrayQueue's circular list but with free-running
+    head and tail counters masked by a power-of-two capacity.  Exactly one
+    process may enqueue and one may dequeue: the consumer only writes the
+    head counter and the producer only writes the tail counter, and each
+    side publishes its counter after touching the slots, so no lock is
+    needed on hardware that keeps stores in order (such as x86-64).
+
+    Records are either byte strings of at most slot_size bytes, or tuples
+    packed with the struct format record_format.
+    """
+    _HEADER = struct.Struct('<8sQQ32s')     # magic, capacity, slot_size, format
+    _COUNTER = struct.Struct('<Q')
+    _LENGTH = struct.Struct('<I')
+    _MAGIC = b'DLADSPSC'
+    _HEAD_OFFSET = 64                       # written by the consumer only
+    _TAIL_OFFSET = 128                      # written by the producer only
+    _DATA_OFFSET = 192
+
+    def __init__(self, capacity=1024, slot_size=256, record_format=None, name=None):
+        """Create a new shared queue of at least capacity slots.
+
+        capacity is rounded up to a power of two.  Without record_format,
+        each slot holds a byte string of at most slot_size bytes; with it,
+        slot_size is ignored and each slot holds one struct record.  name
+        is the shared memory block name (chosen by the system if None).
+        """
+        capacity = ArrayQueue._capacity_for(capacity)
+        if record_format is not None:
+            slot_size = struct.calcsize(record_format)
+        fmt = (record_format or '').encode('ascii')
+        if len(fmt) > 32:
+            raise ValueError('record_format is too long')
+        stride = slot_size + (0 if record_format else self._LENGTH.size)
+        self._shm = shared_memory.SharedMemory(
+            name=name, create=True, size=self._DATA_OFFSET + capacity * stride)
+        self._HEADER.pack_into(self._shm.buf, 0, self._MAGIC, capacity, slot_size, fmt)
+        self._COUNTER.pack_into(self._shm.buf, self._HEAD_OFFSET, 0)
+        self._COUNTER.pack_into(self._shm.buf, self._TAIL_OFFSET, 0)
+        self._setup(capacity, slot_size, record_format)
+
+    @classmethod
+    def attach(cls, name):
+        """Return a handle on the existing shared queue called name.
+
+        Before Python 3.13, attaching registers the block with the resource
+        tracker of this process, which is only harmless when that tracker
+        is shared with the creator (as for processes started through
+        multiprocessing by the creator).
+        Raise ValueError if the block does not hold a shared queue.
+        """
+        queue = cls.__new__(cls)
+        try:
+            queue._shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            queue._shm = shared_memory.SharedMemory(name=name)
+        magic, capacity, slot_size, fmt = cls._HEADER.unpack_from(queue._shm.buf, 0)
+        if magic != cls._MAGIC:
+            queue._shm.close()
+            raise ValueError('%s is not a shared ring queue' % name)
+        queue._setup(capacity, slot_size, fmt.rstrip(b'\0').decode('ascii') or None)
+        return queue
+
+    def _setup(self, capacity, slot_size, record_format):
+        """Initialize the per-process view of the queue layout."""
+        self._buf = self._shm.buf
+        self._capacity = capacity
+        self._slot_size = slot_size
+        self._record = struct.Struct(record_format) if record_format else None
+        self._stride = slot_size + (0 if record_format else self._LENGTH.size)
+
+    def name(self):
+        """Return the name of the shared memory block."""
+        return self._shm.name
+
+    def _head(self):
+        """Return the number of records dequeued so far."""
+        return self._COUNTER.unpack_from(self._buf, self._HEAD_OFFSET)[0]
+
+    def _tail(self):
+        """Return the number of records enqueued so far."""
+        return self._COUNTER.unpack_from(self._buf, self._TAIL_OFFSET)[0]
+
+    def __len__(self):
+        """Return the number of records in the queue (a snapshot)."""
+        return self._tail() - self._head()
+
+    def is_empty(self):
+        """Return True if the queue is empty."""
+        return len(self) == 0
+
+    def _write(self, index, record):
+        """Store record in the slot for counter value index."""
+        offset = self._DATA_OFFSET + (index & (self._capacity - 1)) * self._stride
+        if self._record is not None:
+            self._record.pack_into(self._buf, offset, *record)
+            return
+        size = len(record)
+        if size > self._slot_size:
+            raise ValueError('record is larger than slot_size')
+        self._LENGTH.pack_into(self._buf, offset, size)
+        offset += self._LENGTH.size
+        self._buf[offset:offset + size] = record
+
+    def _read(self, index):
+        """Return the record in the slot for counter value index."""
+        offset = self._DATA_OFFSET + (index & (self._capacity - 1)) * self._stride
+        if self._record is not None:
+            return self._record.unpack_from(self._buf, offset)
+        size = self._LENGTH.unpack_from(self._buf, offset)[0]
+        offset += self._LENGTH.size
+        return bytes(self._buf[offset:offset + size])
+
+    def enqueue(self, record):
+        """Add a record to the back of the queue (producer only).
+
+        Raise ValueError exception if the queue is full or the record does
+        not fit in a slot.
+        """
+        tail = self._tail()
+        if tail - self._head() == self._capacity:
+            raise ValueError('Queue is full')
+        self._write(tail, record)
+        self._COUNTER.pack_into(self._buf, self._TAIL_OFFSET, tail + 1)
+
+    def enqueue_many(self, records):
+        """Add as many of records as fit, in order (producer only).
+
+        The tail counter is published once for the whole batch.  If a record
+        does not fit in a slot, the records before it are still published
+        before the exception propagates.
+        Records beyond the free room are left unconsumed in the iterator.
+        Return the number of records added.
+        """
+        tail = self._tail()
+        room = self._capacity - (tail - self._head())
+        count = 0
+        try:
+            if self._record is None:
+                for record in islice(records, room):
+                    self._write(tail + count, record)
+                    count += 1
+            else:
+                pack_into, buf, stride = self._record.pack_into, self._buf, self._stride
+                mask = self._capacity - 1
+                for record in islice(records, room):
+                    pack_into(buf, self._DATA_OFFSET + ((tail + count) & mask) * stride,
+                              *record)
+                    count += 1
+        finally:
+            if count:
+                self._COUNTER.pack_into(self._buf, self._TAIL_OFFSET, tail + count)
+        return count
+
+    def dequeue(self):
+        """Remove and return the first record of the queue (consumer only).
+
+        Raise ValueError exception if the queue is empty.
+        """
+        head = self._head()
+        if head == self._tail():
+            raise ValueError('Queue is empty')
+        record = self._read(head)
+        self._COUNTER.pack_into(self._buf, self._HEAD_OFFSET, head + 1)
+        return record
+
+    def dequeue_many(self, count):
+        """Remove and return a list of up to count records (consumer only).
+
+        The head counter is published once for the whole batch, and struct
+        records are unpacked from at most two contiguous runs of slots.
+        Raise ValueError if count is negative.
+        """
+        if count < 0:
+            raise ValueError('count must be non-negative')
+        head = self._head()
+        count = min(count, self._tail() - head)
+        if self._record is None:
+            records = [self._read(head + k) for k in range(count)]
+        else:
+            start = head & (self._capacity - 1)
+            records = []
+            for first, stop in ((start, min(start + count, self._capacity)),
+                                (0, max(start + count - self._capacity, 0))):
+                if first < stop:
+                    offset = self._DATA_OFFSET + first * self._stride
+                    run = self._buf[offset:offset + (stop - first) * self._stride]
+                    records.extend(self._record.iter_unpack(run))
+                    run.release()
+        if count:
+            self._COUNTER.pack_into(self._buf, self._HEAD_OFFSET, head + count)
+        return records
+
+    def close(self):
+        """Release this process's view of the queue."""
+        self._buf = None
+        self._shm.close()
+
+    def unlink(self):
+        """Destroy the shared memory block; call once, after every close."""
+        self._shm.unlink()
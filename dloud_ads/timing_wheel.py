@@ -0,0 +1,193 @@
+"""Hierarchical timing wheel for scheduling timers in integer ticks."""
+
+from .doubly_linked_base import _DoublyLinkedBase
+
+class TimingWheel:
+    """Hierarchical timing wheel for scheduling timers in integer ticks.
+
+    The wheel has several levels of 2**wheel_bits slots each, used as
+    circular arrays indexed by the bits of the expiry tick: level 0 holds
+    timers due within the next 2**wheel_bits ticks, one slot per tick, and
+    each further level covers 2**wheel_bits times the range of the one
+    below with coarser slots.  Whenever the level-0 cursor wraps around,
+    the current slot of the next level is cascaded down, so each timer is
+    moved at most once per level.
+
+    Each slot is a doubly linked list whose nodes are the timers themselves,
+    and each timer remembers its slot, so schedule and cancel take O(1)
+    time and tick takes O(1) amortized time per timer.
+    """
+
+    class Timer(_DoublyLinkedBase._Node):
+        """Handle on a scheduled timer, returned by schedule.
+
+        A timer is also the node linking it into its slot.
+        """
+        __slots__ = '_expiry', '_slot'
+
+        def __init__(self, element, expiry):
+            """Constructor should not be invoked by user."""
+            _DoublyLinkedBase._Node.__init__(self, element, None, None)
+            self._expiry = expiry
+            self._slot = None
+
+        def element(self):
+            """Return the element carried by the timer."""
+            return self._element
+
+        def expiry(self):
+            """Return the tick at which the timer expires."""
+            return self._expiry
+
+        def is_active(self):
+            """Return True if the timer has neither expired nor been cancelled."""
+            return self._slot is not None
+
+    class _Slot(_DoublyLinkedBase):
+        """Nonpublic doubly linked list of the timers sharing a slot."""
+
+        def _link_last(self, timer):
+            """Link timer at the back of the slot."""
+            last = self._trailer._prev
+            timer._prev = last
+            timer._next = self._trailer
+            last._next = timer
+            self._trailer._prev = timer
+            self._size += 1
+            timer._slot = self
+
+        def _unlink(self, timer):
+            """Unlink timer from the slot."""
+            timer._prev._next = timer._next
+            timer._next._prev = timer._prev
+            timer._prev = timer._next = timer._slot = None
+            self._size -= 1
+
+        def _take_all(self):
+            """Unlink every timer and return them in order, in O(1) time each."""
+            timers = []
+            node = self._header._next
+            while node is not self._trailer:
+                timers.append(node)
+                following = node._next
+                node._prev = node._next = node._slot = None
+                node = following
+            self._header._next = self._trailer
+            self._trailer._prev = self._header
+            self._size = 0
+            return timers
+
+    def __init__(self, wheel_bits=8, levels=4):
+        """Create an empty wheel at tick 0.
+
+        Each level has 2**wheel_bits slots, so timers up to
+        2**(wheel_bits * levels) - 1 ticks ahead are placed exactly; later
+        ones wait in the last slot of the top level and are cascaded again,
+        which needs at least two levels.
+        Raise ValueError if levels is less than 2.
+        """
+        if levels < 2:
+            raise ValueError('levels must be at least 2')
+        self._bits = wheel_bits
+        self._mask = (1 << wheel_bits) - 1
+        self._levels = [[self._Slot() for _ in range(1 << wheel_bits)]
+                        for _ in range(levels)]
+        self._horizon = (1 << (wheel_bits * levels)) - 1
+        self._now = 0
+        self._size = 0
+
+    def __len__(self):
+        """Return the number of active timers."""
+        return self._size
+
+    def is_empty(self):
+        """Return True if no timer is active."""
+        return self._size == 0
+
+    def time(self):
+        """Return the current tick."""
+        return self._now
+
+    def _place(self, timer):
+        """Store timer in the slot matching its expiry, relative to now.
+
+        A timer beyond the horizon is placed as if it expired at the horizon,
+        and placed again when that slot is cascaded.
+        """
+        expiry = min(timer._expiry, self._now + self._horizon)
+        delta = expiry - self._now
+        level = 0
+        while delta >> (self._bits * (level + 1)) and level + 1 < len(self._levels):
+            level += 1
+        self._levels[level][(expiry >> (self._bits * level)) & self._mask]._link_last(timer)
+
+    def schedule(self, delay, element):
+        """Schedule element to expire delay ticks from now and return its Timer.
+
+        A delay of 0 expires at the next tick.
+        Raise ValueError if delay is negative.
+        """
+        if delay < 0:
+            raise ValueError('delay must be non-negative')
+        timer = self.Timer(element, self._now + max(delay, 1))
+        self._place(timer)
+        self._size += 1
+        return timer
+
+    def cancel(self, timer):
+        """Cancel an active timer in O(1) time and return its element.
+
+        Raise ValueError if the timer has already expired or been cancelled.
+        """
+        if not isinstance(timer, self.Timer):
+            raise TypeError('timer must be proper Timer type')
+        if timer._slot is None:
+            raise ValueError('Timer is not active')
+        timer._slot._unlink(timer)
+        self._size -= 1
+        return timer._element
+
+    def _cascade(self, level, index):
+        """Move the timers of a slot of the given level to lower levels."""
+        slot = self._levels[level][index]
+        if not slot.is_empty():
+            for timer in slot._take_all():
+                self._place(timer)
+
+    def tick(self):
+        """Advance the wheel by one tick and return the list of elements of
+        the timers expiring at the new tick.
+
+        Timers sharing an expiry are not necessarily returned in scheduling
+        order, since those cascaded from higher levels come after those
+        placed directly in the slot.
+        """
+        self._now += 1
+        index = self._now & self._mask
+        if index == 0:
+            for level in range(1, len(self._levels)):
+                upper = (self._now >> (self._bits * level)) & self._mask
+                self._cascade(level, upper)
+                if upper != 0:
+                    break
+        slot = self._levels[0][index]
+        if slot.is_empty():
+            return []
+        expired = [timer._element for timer in slot._take_all()]
+        self._size -= len(expired)
+        return expired
+
+    def advance(self, ticks):
+        """Advance the wheel by ticks and return the list of elements of all
+        timers expiring on the way, in expiry order.
+
+        When no timer is active, time jumps forward without visiting slots.
+        """
+        expired = []
+        stop = self._now + ticks
+        while self._now < stop:
+            if self._size == 0:
+                self._now = stop
+                break
+            expired.extend(self.tick())
+        return expired
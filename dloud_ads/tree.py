@@ -1,13 +1,20 @@
 """Abstract base class representing a tree structure."""
 
+from array import array
+from collections import namedtuple
+
 from .linked_queue import LinkedQueue
 
+TreeStats = namedtuple('TreeStats', 'depth height size leaves')
+
 class Tree:
     """Abstract base class representing a tree structure."""
+    _version = 0        # incremented by subclasses whenever the shape changes
 
     class Position:
         """An abstraction representing the location of a single element within a tree.
         """
+        __slots__ = ()
 
         def element(self):
             """Return the element stored at this Position."""
@@ -21,6 +28,10 @@ class Tree:
             """Return True if other does not represent the same location."""
             return not self == other
 
+        def __hash__(self):
+            """Return a hash value consistent with equality of locations."""
+            raise NotImplementedError('must be implemented by subclass')
+
     def root(self):
         """Return Position representing the tree's root (or None if empty)."""
         raise NotImplementedError('must be implemented by subclass')
@@ -55,21 +66,27 @@ class Tree:
 
     def depth(self, pos):
         """Return the number of levels separating Position p from the root."""
-        if self.is_root(pos):
-            return 0
-
-        return 1 + self.depth(self.parent(pos))
+        count = 0
+        while not self.is_root(pos):
+            pos = self.parent(pos)
+            count += 1
+        return count
 
     def _height1(self):
         """Return the height of the tree."""
-        return max(self.depth(p) for p in self.positions() if self.is_leaf(p))
+        return max(self.depths())
 
     def _height2(self, pos):
         """Return the height of the subtree rooted at Position p."""
-        if self.is_leaf(pos):
-            return 0
-
-        return 1 + max(self._height2(c) for c in self.children(pos))
+        best = 0
+        stack = [(pos, 0)]
+        while stack:
+            pos, level = stack.pop()
+            if level > best:
+                best = level
+            for child in self.children(pos):
+                stack.append((child, level + 1))
+        return best
 
     def height(self, pos=None):
         """Return the height of the subtree rooted at Position p.
@@ -80,6 +97,59 @@ class Tree:
             pos = self.root()
         return self._height2(pos)
 
+    def stats(self):
+        """Return a TreeStats tuple describing every subtree of the tree.
+
+        Each field is an array indexed by the preorder rank of a position:
+        depth of the position, height and size of its subtree, and the
+        number of leaves in its subtree.  Runs in O(n) time without
+        recursion.
+        """
+        parents = self._preorder_parents()
+        count = len(parents)
+        depth = array('l', [0]) * count
+        for k in range(1, count):
+            depth[k] = depth[parents[k]] + 1
+        height = array('l', [0]) * count
+        size = array('l', [1]) * count
+        leaves = array('l', [0]) * count
+        for k in range(count - 1, -1, -1):
+            if size[k] == 1:
+                leaves[k] = 1
+            if k > 0:
+                parent = parents[k]
+                size[parent] += size[k]
+                leaves[parent] += leaves[k]
+                if height[k] >= height[parent]:
+                    height[parent] = height[k] + 1
+        return TreeStats(depth, height, size, leaves)
+
+    def depths(self):
+        """Return an array with the depth of each position, in preorder."""
+        return self.stats().depth
+
+    def heights(self):
+        """Return an array with the height of each subtree, in preorder."""
+        return self.stats().height
+
+    def _preorder_parents(self):
+        """Return an array mapping each preorder rank to its parent's rank.
+
+        The root is mapped to -1.
+        """
+        parents = array('l')
+        if self.is_empty():
+            return parents
+        stack = [(self.root(), -1)]
+        while stack:
+            pos, parent = stack.pop()
+            index = len(parents)
+            parents.append(parent)
+            children = list(self.children(pos))
+            children.reverse()
+            stack.extend((child, index) for child in children)
+        return parents
+
     def __iter__(self):
         """Generate an iteration of the tree's elements."""
         for pos in self.positions():
@@ -96,11 +166,18 @@ class Tree:
                 yield pos
 
     def _subtree_preorder(self, pos):
-        """Generate a preorder iteration of positions in subtree rooted at p."""
-        yield pos
-        for child in self.children(pos):
-            for other in self._subtree_preorder(child):
-                yield other
+        """Generate a preorder iteration of positions in subtree rooted at p.
+
+        Uses an explicit stack instead of recursion, so each position is
+        yielded in O(1) amortized time regardless of the tree's depth.
+        """
+        stack = [pos]
+        while stack:
+            pos = stack.pop()
+            yield pos
+            children = list(self.children(pos))
+            children.reverse()
+            stack.extend(children)
 
     def postorder(self):
         """Generate a postorder iteration of positions in the tree."""
@@ -109,11 +186,20 @@ class Tree:
                 yield pos
 
     def _subtree_postorder(self, pos):
-        """Generate a postorder iteration of positions in subtree rooted at p."""
-        for child in self.children(pos):
-            for other in self._subtree_postorder(child):
-                yield other
-        yield pos
+        """Generate a postorder iteration of positions in subtree rooted at p.
+
+        Uses an explicit stack of (position, children iterator) frames
+        instead of recursion.
+        """
+        stack = [(pos, iter(self.children(pos)))]
+        while stack:
+            pos, children = stack[-1]
+            for child in children:
+                stack.append((child, iter(self.children(child))))
+                break
+            else:
+                stack.pop()
+                yield pos
 
     def breadthfirst(self):
         """Generate a breadth-first iteration of the positions of the tree."""
@@ -0,0 +1,38 @@
+"""FIFO queue of numbers using a typed array.array as underlying storage."""
+
+from array import array
+
+from .array_queue import ArrayQueue
+from .typed_array_stack import _as_array
+
+class TypedArrayQueue(ArrayQueue):
+    """FIFO queue of numbers using a typed array.array as underlying storage.
+
+    The circular layout is that of ArrayQueue, with a power-of-two capacity
+    that doubles when full and halves when less than a quarter full, but
+    elements are stored unboxed as C values of the array typecode.
+    enqueue_many and dequeue_many move whole arrays with at most two slice
+    copies and without creating a Python object per element.
+    """
+    _VACANT = 0
+
+    def __init__(self, typecode='d', capacity=None):
+        """Create an empty queue of elements of the given array typecode.
+
+        capacity is a hint for the number of elements the queue will hold;
+        it is rounded up to a power of two and becomes the minimum capacity.
+        """
+        self._typecode = typecode
+        ArrayQueue.__init__(self, capacity)
+
+    def _slots(self, count):
+        """Return an array of count zero elements."""
+        return array(self._typecode, bytes(count * array(self._typecode).itemsize))
+
+    def _items(self, values):
+        """Return the values of an array, buffer or iterable as an array."""
+        return _as_array(self._typecode, values)
+
+    def typecode(self):
+        """Return the array typecode of the elements."""
+        return self._typecode
@@ -0,0 +1,104 @@
+"""LIFO Stack of numbers using a typed array.array as underlying storage."""
+
+from array import array
+
+def _kind(code):
+    """Return 'f', 'i' or 'u' for float, signed or unsigned format codes."""
+    if code in 'efd':
+        return 'f'
+    if code in 'bhilqn':
+        return 'i'
+    if code in 'BHILQN':
+        return 'u'
+    return None
+
+def _as_array(typecode, values):
+    """Return values as an array of the given typecode, copying if needed.
+
+    Arrays of the same typecode are returned as is, and contiguous buffers
+    of the same kind and item size (such as NumPy arrays) are copied
+    without converting each item to a Python number.
+    """
+    if isinstance(values, array) and values.typecode == typecode:
+        return values
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return array(typecode, values)
+    answer = array(typecode)
+    code = view.format.lstrip('@=')
+    if len(code) == 1 and _kind(code) == _kind(typecode) and \
+            view.itemsize == answer.itemsize and view.c_contiguous:
+        answer.frombytes(view.cast('B'))
+    else:
+        answer.extend(view.tolist() if view.ndim > 0 else [view.tolist()])
+    return answer
+
+class TypedArrayStack:
+    """LIFO Stack of numbers using a typed array.array as underlying storage.
+
+    Elements are stored unboxed, as C values of the array typecode (for
+    instance 'd' for floats or 'q' for 64-bit integers), in an array that
+    grows and shrinks with amortized constant cost per element.
+    push_many and pop_many move whole arrays without creating a Python
+    object per element.
+    """
+
+    def __init__(self, typecode='d'):
+        """Create an empty stack of elements of the given array typecode."""
+        self._data = array(typecode)
+
+    def typecode(self):
+        """Return the array typecode of the elements."""
+        return self._data.typecode
+
+    def __len__(self):
+        """Return the number of elements in the stack."""
+        return len(self._data)
+
+    def is_empty(self):
+        """Return True if the stack is empty."""
+        return len(self._data) == 0
+
+    def push(self, element):
+        """Add element e to the top of the stack."""
+        self._data.append(element)
+
+    def push_many(self, values):
+        """Push the values of an array, buffer or iterable, in order.
+
+        The last value ends up at the top of the stack.
+        """
+        self._data.extend(_as_array(self._data.typecode, values))
+
+    def top(self):
+        """Return (but do not remove) the element at the top of the stack.
+
+        Raise ValueError exception if the stack is empty.
+        """
+        if self.is_empty():
+            raise ValueError('Stack is empty')
+        return self._data[-1]
+
+    def pop(self):
+        """Remove and return the element from the top of the stack (i.e., LIFO).
+
+        Raise ValueError exception if the stack is empty.
+        """
+        if self.is_empty():
+            raise ValueError('Stack is empty')
+        return self._data.pop()
+
+    def pop_many(self, count):
+        """Remove and return an array of the top count elements, top first.
+
+        Raise ValueError exception if the stack has fewer than count elements.
+        """
+        if count < 0 or count > len(self._data):
+            raise ValueError('Stack has fewer than %d elements' % count)
+        if count == 0:
+            return array(self._data.typecode)
+        answer = self._data[-count:]
+        del self._data[-count:]
+        answer.reverse()
+        return answer
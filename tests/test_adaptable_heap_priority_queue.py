@@ -0,0 +1,54 @@
+""" Unit tests for adaptable_heap_priority_queue.AdaptableHeapPriorityQueue """
+
+import random
+
+from dloud_ads import adaptable_heap_priority_queue
+
+def test_dummy():
+    """Test definition"""
+    the_queue = adaptable_heap_priority_queue.AdaptableHeapPriorityQueue([(4, 'x')])
+    loc_a = the_queue.add(5, 'A')
+    loc_b = the_queue.add(9, 'B')
+    loc_c = the_queue.add(7, 'C')
+    the_queue.update(loc_b, 1)
+    assert the_queue.min() == (1, 'B')
+    the_queue.update(loc_b, 8, 'b')
+    assert the_queue.remove(loc_c) == (7, 'C')
+    try:
+        the_queue.remove(loc_c)
+        assert False
+    except ValueError:
+        pass
+    try:
+        the_queue.update('loc', 1)
+        assert False
+    except TypeError:
+        pass
+    assert [the_queue.remove_min() for _ in range(3)] == [(4, 'x'), (5, 'A'), (8, 'b')]
+    try:
+        the_queue.update(loc_a, 0)
+        assert False
+    except ValueError:
+        pass
+    assert the_queue.is_empty()
+
+def test_random_updates():
+    """Test definition"""
+    rng = random.Random(11)
+    the_queue = adaptable_heap_priority_queue.AdaptableHeapPriorityQueue()
+    live = {}
+    for name in range(300):
+        live[name] = rng.randrange(1000)
+    locators = {name: the_queue.add(key, name) for name, key in live.items()}
+    for _ in range(1000):
+        name = rng.choice(list(live))
+        if rng.random() < 0.8:
+            live[name] = rng.randrange(1000)
+            the_queue.update(locators[name], live[name])
+        else:
+            assert the_queue.remove(locators.pop(name)) == (live.pop(name), name)
+        for loc in locators.values():
+            assert the_queue._data[loc._index] is loc
+    drained = [the_queue.remove_min() for _ in range(len(the_queue))]
+    assert [key for key, _ in drained] == sorted(live.values())
+    assert all(live[name] == key for key, name in drained)
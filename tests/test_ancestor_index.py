@@ -0,0 +1,115 @@
+""" Unit tests for ancestor_index.AncestorIndex """
+
+import random
+
+from dloud_ads import ancestor_index
+from dloud_ads.array_binary_tree import ArrayBinaryTree
+from dloud_ads.avl_tree_map import AVLTreeMap
+from dloud_ads.linked_binary_tree import LinkedBinaryTree
+
+def _random_tree(rng, count):
+    """Build a random LinkedBinaryTree of count positions, also returned."""
+    the_tree = LinkedBinaryTree()
+    positions = [the_tree._add_root(0)]
+    while len(positions) < count:
+        pos = rng.choice(positions)
+        if the_tree.left(pos) is None:
+            positions.append(the_tree._add_left(pos, len(positions)))
+        elif the_tree.right(pos) is None:
+            positions.append(the_tree._add_right(pos, len(positions)))
+    return the_tree, positions
+
+def _ancestors(the_tree, pos):
+    """Return the list of positions from pos up to the root."""
+    path = [pos]
+    while not the_tree.is_root(path[-1]):
+        path.append(the_tree.parent(path[-1]))
+    return path
+
+def test_dummy():
+    """Test definition"""
+    the_tree = ArrayBinaryTree()
+    root = the_tree._add_root('a')
+    left = the_tree._add_left(root, 'b')
+    right = the_tree._add_right(root, 'c')
+    deep = the_tree._add_right(left, 'd')
+    index = ancestor_index.AncestorIndex(the_tree)
+    assert len(index) == 4
+    assert index.lca(deep, right) == root
+    assert index.lca(deep, left) == left
+    assert index.lca(right, right) == right
+    assert index.is_ancestor(root, deep) and index.is_ancestor(deep, deep)
+    assert not index.is_ancestor(right, deep)
+    assert index.distance(deep, right) == 3
+    assert index.depth(deep) == 2
+    assert index.kth_ancestor(deep, 2) == root
+    assert index.kth_ancestor(deep, 0) == deep
+    assert index.kth_ancestor(deep, 3) is None
+    try:
+        index.kth_ancestor(deep, -1)
+        assert False
+    except ValueError:
+        pass
+
+    the_tree._replace(deep, 'e')
+    assert index.is_valid()
+    the_tree._add_left(right, 'f')
+    assert not index.is_valid()
+    try:
+        index.lca(deep, right)
+        assert False
+    except ValueError:
+        pass
+    index.rebuild()
+    assert index.distance(deep, the_tree.left(right)) == 4
+
+    other = ArrayBinaryTree()
+    try:
+        index.depth(other._add_root('x'))
+        assert False
+    except ValueError:
+        pass
+    assert len(ancestor_index.AncestorIndex(ArrayBinaryTree())) == 0
+
+def test_random_queries():
+    """Test definition"""
+    rng = random.Random(4)
+    the_tree, positions = _random_tree(rng, 400)
+    index = ancestor_index.AncestorIndex(the_tree)
+    for _ in range(500):
+        pos1, pos2 = rng.choice(positions), rng.choice(positions)
+        path1, path2 = _ancestors(the_tree, pos1), _ancestors(the_tree, pos2)
+        common = next(pos for pos in path1 if pos in path2)
+        assert index.lca(pos1, pos2) == common
+        assert index.is_ancestor(pos1, pos2) == (pos1 in path2)
+        assert index.distance(pos1, pos2) == path1.index(common) + path2.index(common)
+        k = rng.randrange(len(path1) + 1)
+        assert index.kth_ancestor(pos1, k) == (path1[k] if k < len(path1) else None)
+
+def test_invalidation():
+    """Test definition"""
+    the_tree, positions = _random_tree(random.Random(5), 20)
+    for mutate in (lambda: the_tree._delete(positions[-1]),
+                   lambda: the_tree._detach(positions[10]),
+                   lambda: the_tree._swap_subtrees(*the_tree.children(the_tree.root()))):
+        index = ancestor_index.AncestorIndex(the_tree)
+        mutate()
+        assert not index.is_valid()
+
+    the_map = AVLTreeMap.from_sorted((k, k) for k in range(10))
+    index = ancestor_index.AncestorIndex(the_map)
+    the_map[3] = 'same shape'
+    assert index.is_valid()
+    the_map[20] = 20
+    assert not index.is_valid()
+
+def test_deep_chain():
+    """Test definition"""
+    the_tree = LinkedBinaryTree()
+    chain = [the_tree._add_root(0)]
+    for depth in range(1, 5000):
+        chain.append(the_tree._add_left(chain[-1], depth))
+    index = ancestor_index.AncestorIndex(the_tree)
+    assert index.depth(chain[-1]) == 4999
+    assert index.lca(chain[-1], chain[1234]) == chain[1234]
+    assert index.kth_ancestor(chain[-1], 4000) == chain[999]
@@ -0,0 +1,85 @@
+""" Unit tests for array_binary_tree.ArrayBinaryTree """
+
+from dloud_ads import array_binary_tree
+
+def _sample_tree():
+    """Build the same tree used by the LinkedBinaryTree tests."""
+    the_tree = array_binary_tree.ArrayBinaryTree()
+    root = the_tree._add_root(1)
+    pos2 = the_tree._add_left(root, 2)
+    pos3 = the_tree._add_right(root, 3)
+    the_tree._add_left(pos2, 4)
+    pos5 = the_tree._add_right(pos2, 5)
+    the_tree._add_right(pos3, 6)
+    the_tree._add_left(pos5, 7)
+    return the_tree
+
+def test_dummy():
+    """Test definition"""
+    the_tree = array_binary_tree.ArrayBinaryTree()
+    assert the_tree.is_empty()
+    assert the_tree.root() is None
+
+    root = the_tree._add_root('a')
+    assert root.element() == 'a'
+    assert the_tree.is_root(root)
+    assert the_tree.left(root) is None
+    left = the_tree._add_left(root, 'b')
+    right = the_tree._add_right(root, 'c')
+    assert len(the_tree) == 3
+    assert the_tree.parent(left) == root
+    assert the_tree.sibling(left) == right
+    assert the_tree.num_children(root) == 2
+    assert the_tree._replace(right, 'd') == 'c'
+    assert right.element() == 'd'
+
+    try:
+        the_tree._add_left(root, 'e')
+        assert False
+    except ValueError:
+        pass
+    try:
+        the_tree._delete(root)
+        assert False
+    except ValueError:
+        pass
+
+    assert the_tree._delete(right) == 'd'
+    assert len(the_tree) == 2
+    assert the_tree.right(root) is None
+    assert len(the_tree._data) == 2
+    try:
+        the_tree.left(right)
+        assert False
+    except ValueError:
+        pass
+
+def test_traversals():
+    """Test definition"""
+    the_tree = _sample_tree()
+
+    assert [p.element() for p in the_tree.preorder()] == [1, 2, 4, 5, 7, 3, 6]
+    assert [p.element() for p in the_tree.postorder()] == [4, 7, 5, 2, 6, 3, 1]
+    assert [p.element() for p in the_tree.inorder()] == [4, 2, 7, 5, 1, 3, 6]
+    assert [p.element() for p in the_tree.breadthfirst()] == [1, 2, 3, 4, 5, 6, 7]
+    assert list(the_tree) == [4, 2, 7, 5, 1, 3, 6]
+    assert list(the_tree.iter_elements('preorder')) == [1, 2, 4, 5, 7, 3, 6]
+    assert list(the_tree.iter_elements('postorder')) == [4, 7, 5, 2, 6, 3, 1]
+    assert list(the_tree.iter_elements('breadthfirst')) == [1, 2, 3, 4, 5, 6, 7]
+
+    pos2 = the_tree.left(the_tree.root())
+    assert [p.element() for p in the_tree._subtree_postorder(pos2)] == [4, 7, 5, 2]
+    assert [the_tree.depth(p) for p in the_tree.preorder()] == [0, 1, 2, 2, 3, 1, 2]
+    assert the_tree.height() == 3
+    assert list(the_tree.stats().size) == [7, 4, 1, 2, 1, 2, 1]
+
+    empty = array_binary_tree.ArrayBinaryTree()
+    assert list(empty.iter_elements('preorder')) == []
+    assert list(empty.breadthfirst()) == []
+
+def test_positions_hashable():
+    """Test definition"""
+    the_tree = _sample_tree()
+    depths = dict((pos, the_tree.depth(pos)) for pos in the_tree.preorder())
+    assert depths[the_tree.root()] == 0
+    assert not hasattr(the_tree.root(), '__dict__')
@@ -20,13 +20,77 @@ def test_dummy():
     assert [the_queue.dequeue() for x in range(4)] == [0, 1, 2, 3]
     assert not the_queue
 
-    _ = [the_queue.enqueue(x) for x in range(9)]
-    assert len(the_queue) == 9
-    assert len(the_queue._data) == 10
+    _ = [the_queue.enqueue(x) for x in range(15)]
+    assert len(the_queue) == 15
+    assert len(the_queue._data) == 16
 
     _ = [the_queue.enqueue(x) for x in range(2)]
-    assert len(the_queue) == 11
-    assert len(the_queue._data) == 20
+    assert len(the_queue) == 17
+    assert len(the_queue._data) == 32
 
-    expected = [0, 1, 2, 3, 4, 5, 6, 7, 8, 0, 1]
-    assert [the_queue.dequeue() for x in range(11)] == expected
+    expected = list(range(15)) + [0, 1]
+    assert [the_queue.dequeue() for x in range(17)] == expected
+
+def test_bulk_operations():
+    """Test definition"""
+    the_queue = array_queue.ArrayQueue()
+    _ = [the_queue.enqueue(x) for x in range(12)]
+    assert [the_queue.dequeue() for x in range(10)] == list(range(10))
+
+    the_queue.enqueue_many(range(100, 110))
+    assert len(the_queue) == 12
+    assert len(the_queue._data) == 16
+    assert the_queue._data[:6] == [104, 105, 106, 107, 108, 109]
+
+    assert the_queue.dequeue_many(8) == [10, 11, 100, 101, 102, 103, 104, 105]
+    assert the_queue._data.count(None) == 12
+    the_queue.enqueue_many(iter(range(40)))
+    assert len(the_queue) == 44
+    assert len(the_queue._data) == 64
+    assert the_queue.dequeue_many(0) == []
+    assert the_queue.dequeue_many(5) == [106, 107, 108, 109, 0]
+    assert [the_queue.dequeue() for x in range(39)] == list(range(1, 40))
+    assert the_queue.is_empty()
+
+    try:
+        the_queue.dequeue_many(1)
+        assert False
+    except ValueError:
+        pass
+
+def test_capacity_control():
+    """Test definition"""
+    the_queue = array_queue.ArrayQueue(capacity=100)
+    assert len(the_queue._data) == 128
+    the_queue.enqueue_many(range(300))
+    assert len(the_queue._data) == 512
+    assert the_queue.dequeue_many(200) == list(range(200))
+    assert len(the_queue._data) == 256
+    assert the_queue.dequeue_many(80) == list(range(200, 280))
+    assert len(the_queue._data) == 128
+    assert [the_queue.dequeue() for x in range(20)] == list(range(280, 300))
+    assert len(the_queue._data) == 128
+
+    the_queue = array_queue.ArrayQueue()
+    the_queue.enqueue_many(range(64))
+    assert len(the_queue._data) == 64
+    assert [the_queue.dequeue() for x in range(49)] == list(range(49))
+    assert len(the_queue._data) == 32
+    assert [the_queue.dequeue() for x in range(8)] == list(range(49, 57))
+    assert len(the_queue._data) == 16
+    assert list(the_queue.dequeue_many(7)) == list(range(57, 64))
+    assert len(the_queue._data) == 16
+
+    the_queue.reserve(1000)
+    assert len(the_queue._data) == 1024
+    the_queue.enqueue_many(range(3))
+    assert the_queue.dequeue_many(3) == [0, 1, 2]
+    assert len(the_queue._data) == 1024
+    the_queue.enqueue_many(range(5))
+    the_queue.shrink_to_fit()
+    assert len(the_queue._data) == 8
+    assert the_queue.dequeue_many(5) == [0, 1, 2, 3, 4]
+    the_queue.shrink_to_fit()
+    assert len(the_queue._data) == 1
+    the_queue.enqueue_many('abc')
+    assert [the_queue.dequeue() for x in range(3)] == ['a', 'b', 'c']
@@ -27,3 +27,21 @@ def test_dummy():
 
     expected = [1, 0, 8, 7, 6, 5, 4, 3, 2, 1, 0]
     assert [the_queue.pop() for x in range(11)] == expected
+
+def test_bulk():
+    """Test definition"""
+    the_stack = array_stack.ArrayStack()
+    the_stack.push_many(range(6))
+    the_stack.push_many([])
+    assert len(the_stack) == 6
+    assert the_stack.peek_many(6) == [5, 4, 3, 2, 1, 0]
+    assert the_stack.peek_many(0) == []
+    assert the_stack.pop_many(2) == [5, 4]
+    assert the_stack.pop_many(0) == []
+    try:
+        the_stack.pop_many(5)
+        assert False
+    except ValueError:
+        pass
+    assert the_stack.pop_many(4) == [3, 2, 1, 0]
+    assert the_stack.is_empty()
@@ -0,0 +1,59 @@
+""" Unit tests for async_queue.AsyncQueue """
+
+import asyncio
+
+from dloud_ads import async_queue
+from dloud_ads.blocking_queue import Empty, Full
+from dloud_ads.linked_stack import LinkedStack
+
+def test_dummy():
+    """Test definition"""
+    the_queue = async_queue.AsyncQueue(maxsize=2)
+    the_queue.put_nowait(1)
+    the_queue.put_nowait(2)
+    assert the_queue.is_full()
+    try:
+        the_queue.put_nowait(3)
+        assert False
+    except Full:
+        pass
+    assert the_queue.get_nowait() == 1
+    assert the_queue.get_many_nowait(5) == [2]
+    try:
+        the_queue.get_nowait()
+        assert False
+    except Empty:
+        pass
+
+    the_stack = async_queue.AsyncQueue(LinkedStack())
+    the_stack.put_nowait('a')
+    the_stack.put_nowait('b')
+    assert the_stack.get_nowait() == 'b'
+
+def test_producers_and_consumers():
+    """Test definition"""
+
+    async def scenario():
+        the_queue = async_queue.AsyncQueue(maxsize=5)
+        results = []
+
+        async def produce(start):
+            for k in range(start, start + 100):
+                await the_queue.put(k)
+
+        async def consume(count):
+            while count > 0:
+                batch = await the_queue.get_many(3)
+                results.extend(batch)
+                count -= len(batch)
+
+        await asyncio.gather(*([produce(k * 100) for k in range(4)] +
+                               [consume(200), consume(150), consume(50)]))
+        try:
+            await asyncio.wait_for(the_queue.get(), 0.01)
+            assert False
+        except asyncio.TimeoutError:
+            pass
+        return results
+
+    assert sorted(asyncio.run(scenario())) == list(range(400))
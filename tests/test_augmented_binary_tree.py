@@ -0,0 +1,101 @@
+""" Unit tests for augmented_binary_tree.AugmentedBinaryTree """
+
+import random
+
+from dloud_ads import augmented_binary_tree
+
+def _check(the_tree):
+    """Assert every stored aggregate equals a fresh sum over its subtree."""
+    for pos in the_tree.positions():
+        assert the_tree.aggregate(pos) == sum(p.element() for p in the_tree._subtree_preorder(pos))
+    assert the_tree.aggregate() == sum(the_tree)
+
+def test_dummy():
+    """Test definition"""
+    the_tree = augmented_binary_tree.AugmentedBinaryTree()
+    assert the_tree.aggregate() == 0
+    root = the_tree._add_root(1)
+    left = the_tree._add_left(root, 2)
+    right = the_tree._add_right(root, 3)
+    leaf = the_tree._add_left(left, 4)
+    assert the_tree.aggregate() == 10
+    assert the_tree.aggregate(left) == 6
+    assert the_tree._replace(leaf, 10) == 4
+    assert the_tree.aggregate() == 16 and the_tree.aggregate(left) == 12
+    assert the_tree._delete(left) == 2
+    assert the_tree.aggregate() == 14
+    assert the_tree._delete_subtree(right) == 3
+    assert the_tree.aggregate() == 11
+    _check(the_tree)
+
+    words = augmented_binary_tree.AugmentedBinaryTree.from_sorted('abcdefg', identity='')
+    assert words.aggregate() == 'abcdefg'
+    assert words.aggregate(words.left(words.root())) == 'abc'
+    words._replace(words.root(), 'D')
+    assert words.aggregate() == 'abcDefg'
+
+    lowest = augmented_binary_tree.AugmentedBinaryTree.from_level_order(
+        [5, 3, 8, 1], combine=min, identity=float('inf'))
+    assert lowest.aggregate() == 1
+    assert lowest.aggregate(lowest.right(lowest.root())) == 8
+
+def test_restructuring():
+    """Test definition"""
+    cls = augmented_binary_tree.AugmentedBinaryTree
+    the_tree = cls.from_level_order(range(1, 16))
+    _check(the_tree)
+    root = the_tree.root()
+    left, right = the_tree.children(root)
+    the_tree._swap_subtrees(the_tree.left(left), the_tree.right(right))
+    _check(the_tree)
+    detached = the_tree._detach(right)
+    assert detached.aggregate() == sum(detached)
+    _check(the_tree)
+    leaf = the_tree.left(the_tree.left(left))
+    the_tree._attach(leaf, cls.from_sorted([100]), cls.from_sorted([200]))
+    _check(the_tree)
+    the_tree._graft_right(root, detached)
+    assert detached.aggregate() == 0
+    _check(the_tree)
+
+    other = cls.from_sorted([1], combine=max, identity=0)
+    try:
+        the_tree._graft_left(the_tree.left(leaf), other)
+        assert False
+    except ValueError:
+        pass
+    rebuilt = cls.from_preorder_inorder([1, 2, 3], [2, 1, 3], combine=max)
+    assert rebuilt.aggregate() == 3
+
+def test_random_updates():
+    """Test definition"""
+    rng = random.Random(7)
+    the_tree = augmented_binary_tree.AugmentedBinaryTree(intern_positions=True)
+    positions = [the_tree._add_root(rng.randrange(100))]
+    for _ in range(300):
+        pos = rng.choice(positions)
+        choice = rng.randrange(4)
+        if choice == 0 and the_tree.left(pos) is None:
+            positions.append(the_tree._add_left(pos, rng.randrange(100)))
+        elif choice == 1 and the_tree.right(pos) is None:
+            positions.append(the_tree._add_right(pos, rng.randrange(100)))
+        elif choice == 2:
+            the_tree._replace(pos, rng.randrange(100))
+        elif the_tree.num_children(pos) < 2 and len(positions) > 1:
+            the_tree._delete(pos)
+            positions.remove(pos)
+    _check(the_tree)
+
+def test_shared_monoid():
+    """Test definition"""
+    cls = augmented_binary_tree.AugmentedBinaryTree
+    count = lambda elem: 1
+    the_tree = cls.from_sorted('abc', value=count)
+    the_tree._graft_left(the_tree.left(the_tree.root()), cls.from_sorted('xy', value=count))
+    assert the_tree.aggregate() == 5
+    try:
+        the_tree._graft_right(the_tree.right(the_tree.root()),
+                              cls.from_sorted('z', value=lambda elem: 1))
+        assert False
+    except ValueError:
+        pass
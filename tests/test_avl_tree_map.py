@@ -0,0 +1,135 @@
+""" Unit tests for avl_tree_map.AVLTreeMap """
+
+import bisect
+import random
+
+from dloud_ads import avl_tree_map
+
+def _check_invariants(the_map):
+    """Check ordering, parent links, heights and balance of every node."""
+    count = 0
+    if the_map._root is not None:
+        assert the_map._root._parent is None
+        for node in the_map._postorder_nodes(the_map._root):
+            left, right = node._left, node._right
+            for child in (left, right):
+                if child is not None:
+                    assert child._parent is node
+            if left is not None:
+                assert left._element._key < node._element._key
+            if right is not None:
+                assert node._element._key < right._element._key
+            left_height = left._height if left is not None else 0
+            right_height = right._height if right is not None else 0
+            assert node._height == 1 + max(left_height, right_height)
+            assert abs(left_height - right_height) <= 1
+            count += 1
+    assert count == len(the_map)
+
+def test_dummy():
+    """Test definition"""
+    the_map = avl_tree_map.AVLTreeMap()
+    assert the_map.is_empty()
+    assert the_map.find_min() is None
+    assert list(the_map.find_range(None, None)) == []
+
+    for key in range(1, 32):
+        the_map[key] = str(key)
+    _check_invariants(the_map)
+    assert the_map.height() == 4
+    assert list(the_map) == list(range(1, 32))
+    assert list(reversed(the_map)) == list(range(31, 0, -1))
+    assert the_map[7] == '7'
+    assert 7 in the_map and 40 not in the_map
+    try:
+        _ = the_map[40]
+        assert False
+    except KeyError:
+        pass
+
+    the_map[7] = 'seven'
+    assert the_map.get(7) == 'seven'
+    assert len(the_map) == 31
+    del the_map[16]
+    try:
+        del the_map[16]
+        assert False
+    except KeyError:
+        pass
+    _check_invariants(the_map)
+    assert the_map.pop(1) == '1'
+    assert len(the_map) == 29
+
+    the_map.clear()
+    assert the_map.is_empty()
+    assert list(the_map) == []
+
+def test_searches():
+    """Test definition"""
+    the_map = avl_tree_map.AVLTreeMap.from_sorted((k, k * k) for k in range(0, 100, 10))
+    _check_invariants(the_map)
+    assert the_map.find_min() == (0, 0)
+    assert the_map.find_max() == (90, 8100)
+    assert the_map.find_lt(30) == (20, 400)
+    assert the_map.find_le(30) == (30, 900)
+    assert the_map.find_gt(30) == (40, 1600)
+    assert the_map.find_ge(31) == (40, 1600)
+    assert the_map.find_lt(0) is None
+    assert the_map.find_gt(90) is None
+    assert list(the_map.find_range(25, 60)) == [(30, 900), (40, 1600), (50, 2500)]
+    assert [key for key, _ in the_map.find_range(None, 20)] == [0, 10]
+    assert [key for key, _ in the_map.find_range(75, None)] == [80, 90]
+    assert list(the_map.find_range(91, None)) == []
+
+    try:
+        avl_tree_map.AVLTreeMap.from_sorted([(1, 'a'), (1, 'b')])
+        assert False
+    except ValueError:
+        pass
+    assert avl_tree_map.AVLTreeMap.from_sorted([]).is_empty()
+
+def test_random_operations():
+    """Test definition"""
+    rng = random.Random(7)
+    the_map = avl_tree_map.AVLTreeMap.from_sorted((k, k) for k in range(0, 200, 2))
+    expected = {k: k for k in range(0, 200, 2)}
+    for step in range(3000):
+        key = rng.randrange(300)
+        if rng.random() < 0.55:
+            the_map[key] = step
+            expected[key] = step
+        elif key in expected:
+            del the_map[key]
+            del expected[key]
+        if step % 500 == 0:
+            _check_invariants(the_map)
+    _check_invariants(the_map)
+    keys = sorted(expected)
+    assert list(the_map) == keys
+    assert dict(the_map.items()) == expected
+    for probe in range(-1, 301, 7):
+        index = bisect.bisect_left(keys, probe)
+        assert the_map.find_ge(probe) == \
+            ((keys[index], expected[keys[index]]) if index < len(keys) else None)
+        assert the_map.find_lt(probe) == \
+            ((keys[index - 1], expected[keys[index - 1]]) if index > 0 else None)
+
+def test_direct_restructuring_blocked():
+    """Test definition"""
+    the_map = avl_tree_map.AVLTreeMap.from_sorted((k, k) for k in range(7))
+    root = the_map.root()
+    left, right = the_map.children(root)
+    for action in (lambda: avl_tree_map.AVLTreeMap.from_level_order([]),
+                   lambda: avl_tree_map.AVLTreeMap.from_preorder_inorder([], []),
+                   lambda: the_map._add_left(the_map.left(left), None),
+                   lambda: the_map._delete(left),
+                   lambda: the_map._detach(left),
+                   lambda: the_map._graft_left(root, avl_tree_map.AVLTreeMap()),
+                   lambda: the_map._swap_subtrees(left, right),
+                   lambda: the_map._delete_subtree(right)):
+        try:
+            action()
+            assert False
+        except TypeError:
+            pass
+    assert list(the_map) == list(range(7))
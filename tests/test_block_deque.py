@@ -0,0 +1,57 @@
+""" Unit tests for block_deque.BlockDeque """
+
+import collections
+import random
+
+from dloud_ads import block_deque
+
+def test_dummy():
+    """Test definition"""
+    the_deque = block_deque.BlockDeque()
+    assert the_deque.is_empty()
+    assert not the_deque
+    for method in (the_deque.first, the_deque.last,
+                   the_deque.delete_first, the_deque.delete_last):
+        try:
+            method()
+            assert False
+        except ValueError:
+            pass
+
+    the_deque.insert_last(2)
+    the_deque.insert_first(1)
+    assert len(the_deque) == 2
+    assert the_deque.first() == 1
+    assert the_deque.last() == 2
+
+    _ = [the_deque.insert_last(x) for x in range(200)]
+    _ = [the_deque.insert_first(x) for x in range(200)]
+    assert len(the_deque) == 402
+    assert list(the_deque) == list(range(199, -1, -1)) + [1, 2] + list(range(200))
+    assert [the_deque.delete_first() for x in range(300)] == (
+        list(range(199, -1, -1)) + [1, 2] + list(range(98)))
+    assert [the_deque.delete_last() for x in range(102)] == list(range(199, 97, -1))
+    assert the_deque.is_empty()
+
+def test_against_collections_deque():
+    """Test definition"""
+    rng = random.Random(7)
+    the_deque = block_deque.BlockDeque()
+    reference = collections.deque()
+    for step in range(20000):
+        action = rng.random()
+        if action < 0.3:
+            the_deque.insert_last(step)
+            reference.append(step)
+        elif action < 0.6:
+            the_deque.insert_first(step)
+            reference.appendleft(step)
+        elif reference and action < 0.8:
+            assert the_deque.delete_first() == reference.popleft()
+        elif reference:
+            assert the_deque.delete_last() == reference.pop()
+        assert len(the_deque) == len(reference)
+        if reference:
+            assert the_deque.first() == reference[0]
+            assert the_deque.last() == reference[-1]
+    assert list(the_deque) == list(reference)
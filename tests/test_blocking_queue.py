@@ -0,0 +1,72 @@
+""" Unit tests for blocking_queue.BlockingQueue """
+
+import threading
+
+from dloud_ads import blocking_queue
+from dloud_ads.array_stack import ArrayStack
+from dloud_ads.linked_queue import LinkedQueue
+
+def test_dummy():
+    """Test definition"""
+    the_queue = blocking_queue.BlockingQueue(maxsize=3)
+    assert the_queue.is_empty()
+    _ = [the_queue.put(x) for x in range(3)]
+    assert len(the_queue) == 3
+    try:
+        the_queue.put(3, block=False)
+        assert False
+    except blocking_queue.Full:
+        pass
+    try:
+        the_queue.put(3, timeout=0.01)
+        assert False
+    except blocking_queue.Full:
+        pass
+    assert the_queue.get() == 0
+    assert the_queue.get_many(5) == [1, 2]
+    try:
+        the_queue.get(block=False)
+        assert False
+    except blocking_queue.Empty:
+        pass
+    try:
+        the_queue.get_many(2, timeout=0.01)
+        assert False
+    except ValueError:
+        pass
+
+    the_stack = blocking_queue.BlockingQueue(ArrayStack())
+    _ = [the_stack.put(x) for x in range(4)]
+    assert the_stack.get() == 3
+    assert the_stack.get_many(2) == [2, 1]
+
+    try:
+        blocking_queue.BlockingQueue(object())
+        assert False
+    except TypeError:
+        pass
+
+def test_producers_and_consumers():
+    """Test definition"""
+    the_queue = blocking_queue.BlockingQueue(LinkedQueue(), maxsize=10)
+    results = []
+
+    def produce(start):
+        for k in range(start, start + 500):
+            the_queue.put(k)
+
+    def consume(count):
+        taken = 0
+        while taken < count:
+            batch = the_queue.get_many(7, timeout=5)
+            results.extend(batch)
+            taken += len(batch)
+
+    threads = [threading.Thread(target=produce, args=(k * 500,)) for k in range(4)]
+    threads += [threading.Thread(target=consume, args=(1000,)) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(results) == list(range(2000))
+    assert the_queue.is_empty()
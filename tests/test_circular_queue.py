@@ -1,2 +1,66 @@
+""" Unit tests for circular_queue.CircularQueue """
+
+from dloud_ads import circular_queue
+
 def test_dummy():
-	assert True
\ No newline at end of file
+	assert True
+
+def test_pooling():
+    """Test definition"""
+    the_queue = circular_queue.CircularQueue(pool_size=8)
+    for _ in range(3):
+        _ = [the_queue.enqueue(x) for x in range(5)]
+        the_queue.rotate()
+        assert [the_queue.dequeue() for x in range(5)] == [1, 2, 3, 4, 0]
+    stats = the_queue.pool_stats()
+    assert stats['allocated'] == 5
+    assert stats['reused'] == 10
+
+def test_rotate_and_bulk():
+    """Test definition"""
+    the_queue = circular_queue.CircularQueue()
+    the_queue.rotate(3)
+    assert list(the_queue) == []
+    assert the_queue.dequeue_many(0) == []
+
+    the_queue.enqueue_many(range(6))
+    the_queue.enqueue_many([])
+    assert list(the_queue) == [0, 1, 2, 3, 4, 5]
+    the_queue.rotate(2)
+    assert list(the_queue) == [2, 3, 4, 5, 0, 1]
+    the_queue.rotate(-3)
+    assert list(the_queue) == [5, 0, 1, 2, 3, 4]
+    the_queue.rotate(13)
+    assert list(the_queue) == [0, 1, 2, 3, 4, 5]
+    the_queue.rotate(-6)
+    assert the_queue.first() == 0
+
+    assert the_queue.dequeue_many(4) == [0, 1, 2, 3]
+    try:
+        the_queue.dequeue_many(3)
+        assert False
+    except ValueError:
+        pass
+    the_queue.enqueue(6)
+    the_queue.rotate(-1)
+    assert list(the_queue) == [6, 4, 5]
+    assert the_queue.dequeue_many(3) == [6, 4, 5]
+    assert the_queue.is_empty()
+
+    the_queue.enqueue_many([7, 8])
+    the_queue.rotate()
+    assert [the_queue.dequeue() for x in range(2)] == [8, 7]
+
+def test_removed_nodes_unlinked():
+    """Test definition"""
+    the_queue = circular_queue.CircularQueue()
+    the_queue.enqueue_many(range(5))
+    nodes = []
+    walk = the_queue._tail._next
+    for _ in range(5):
+        nodes.append(walk)
+        walk = walk._next
+    the_queue.dequeue_many(3)
+    the_queue.dequeue()
+    the_queue.dequeue()
+    assert all(node._prev is None and node._next is None for node in nodes)
@@ -0,0 +1,39 @@
+""" Unit tests for heap_priority_queue.HeapPriorityQueue """
+
+import random
+
+from dloud_ads import heap_priority_queue
+
+def test_dummy():
+    """Test definition"""
+    the_queue = heap_priority_queue.HeapPriorityQueue()
+    assert the_queue.is_empty()
+    try:
+        the_queue.min()
+        assert False
+    except ValueError:
+        pass
+    try:
+        the_queue.remove_min()
+        assert False
+    except ValueError:
+        pass
+
+    for key, value in [(5, 'A'), (9, 'C'), (3, 'B'), (7, 'D')]:
+        the_queue.add(key, value)
+    assert len(the_queue) == 4
+    assert the_queue.min() == (3, 'B')
+    assert the_queue.remove_min() == (3, 'B')
+    assert the_queue.remove_min() == (5, 'A')
+    assert len(the_queue) == 2
+
+def test_heapify():
+    """Test definition"""
+    keys = list(range(500))
+    random.Random(3).shuffle(keys)
+    the_queue = heap_priority_queue.HeapPriorityQueue((key, str(key)) for key in keys)
+    data = the_queue._data
+    assert all(not data[j] < data[(j - 1) // 2] for j in range(1, len(data)))
+    the_queue.add(-1, 'first')
+    assert [the_queue.remove_min()[0] for _ in range(501)] == list(range(-1, 500))
+    assert the_queue.is_empty()
@@ -1,4 +1,320 @@
+""" Unit tests for linked_binary_tree.LinkedBinaryTree """
+
 from dloud_ads import linked_binary_tree
+from dloud_ads.binary_tree import BinaryTree
+from dloud_ads.tree import Tree
 
 def test_dummy():
-	pass
\ No newline at end of file
+	pass
+
+def _sample_tree():
+    """Build the tree
+
+            1
+          /   \\
+         2     3
+        / \\     \\
+       4   5     6
+          /
+         7
+    """
+    the_tree = linked_binary_tree.LinkedBinaryTree()
+    root = the_tree._add_root(1)
+    pos2 = the_tree._add_left(root, 2)
+    pos3 = the_tree._add_right(root, 3)
+    the_tree._add_left(pos2, 4)
+    pos5 = the_tree._add_right(pos2, 5)
+    the_tree._add_right(pos3, 6)
+    the_tree._add_left(pos5, 7)
+    return the_tree
+
+def _chain(depth):
+    """Build a degenerate tree alternating left and right children."""
+    the_tree = linked_binary_tree.LinkedBinaryTree()
+    walk = the_tree._add_root(0)
+    for k in range(1, depth):
+        if k % 2:
+            walk = the_tree._add_left(walk, k)
+        else:
+            walk = the_tree._add_right(walk, k)
+    return the_tree
+
+def test_traversals():
+    """Test definition"""
+    the_tree = _sample_tree()
+
+    assert [p.element() for p in the_tree.preorder()] == [1, 2, 4, 5, 7, 3, 6]
+    assert [p.element() for p in the_tree.postorder()] == [4, 7, 5, 2, 6, 3, 1]
+    assert [p.element() for p in the_tree.inorder()] == [4, 2, 7, 5, 1, 3, 6]
+    assert [p.element() for p in the_tree.breadthfirst()] == [1, 2, 3, 4, 5, 6, 7]
+    assert list(the_tree) == [4, 2, 7, 5, 1, 3, 6]
+
+    root = the_tree.root()
+    generic_pre = Tree._subtree_preorder(the_tree, root)
+    generic_post = Tree._subtree_postorder(the_tree, root)
+    generic_in = BinaryTree._subtree_inorder(the_tree, root)
+    assert [p.element() for p in generic_pre] == [1, 2, 4, 5, 7, 3, 6]
+    assert [p.element() for p in generic_post] == [4, 7, 5, 2, 6, 3, 1]
+    assert [p.element() for p in generic_in] == [4, 2, 7, 5, 1, 3, 6]
+
+    pos2 = the_tree.left(root)
+    assert [p.element() for p in the_tree._subtree_preorder(pos2)] == [2, 4, 5, 7]
+    assert [p.element() for p in the_tree._subtree_postorder(pos2)] == [4, 7, 5, 2]
+    assert [p.element() for p in the_tree._subtree_inorder(pos2)] == [4, 2, 7, 5]
+
+    empty = linked_binary_tree.LinkedBinaryTree()
+    assert list(empty.preorder()) == []
+    assert list(empty.postorder()) == []
+    assert list(empty.inorder()) == []
+    assert list(empty.breadthfirst()) == []
+
+def test_deep_traversals():
+    """Test definition"""
+    depth = 20000
+    the_tree = _chain(depth)
+
+    expected = list(range(depth))
+    assert [p.element() for p in the_tree.preorder()] == expected
+    assert [p.element() for p in the_tree.breadthfirst()] == expected
+    assert [p.element() for p in the_tree.postorder()] == expected[::-1]
+
+    root = the_tree.root()
+    inorder = [p.element() for p in the_tree.inorder()]
+    generic_in = BinaryTree._subtree_inorder(the_tree, root)
+    assert [p.element() for p in generic_in] == inorder
+    assert sorted(inorder) == expected
+    assert len(list(Tree._subtree_preorder(the_tree, root))) == depth
+    assert len(list(Tree._subtree_postorder(the_tree, root))) == depth
+
+def test_iter_elements():
+    """Test definition"""
+    the_tree = _sample_tree()
+
+    assert list(the_tree.iter_elements()) == [4, 2, 7, 5, 1, 3, 6]
+    assert list(the_tree.iter_elements('preorder')) == [1, 2, 4, 5, 7, 3, 6]
+    assert list(the_tree.iter_elements('postorder')) == [4, 7, 5, 2, 6, 3, 1]
+    assert list(the_tree.iter_elements('inorder')) == [4, 2, 7, 5, 1, 3, 6]
+    assert list(the_tree.iter_elements('breadthfirst')) == [1, 2, 3, 4, 5, 6, 7]
+    assert [n._element for n in the_tree._iter_nodes('preorder')] == [1, 2, 4, 5, 7, 3, 6]
+
+    root = the_tree.root()
+    assert [p.element() for p in the_tree.children(root)] == [2, 3]
+    assert list(the_tree.children(the_tree.left(the_tree.left(root)))) == []
+
+    empty = linked_binary_tree.LinkedBinaryTree()
+    assert list(empty.iter_elements('postorder')) == []
+
+    try:
+        the_tree.iter_elements('sideways')
+        assert False
+    except ValueError:
+        pass
+
+def test_stats():
+    """Test definition"""
+    the_tree = _sample_tree()
+
+    stats = the_tree.stats()
+    assert list(stats.depth) == [0, 1, 2, 2, 3, 1, 2]
+    assert list(stats.height) == [3, 2, 0, 1, 0, 1, 0]
+    assert list(stats.size) == [7, 4, 1, 2, 1, 2, 1]
+    assert list(stats.leaves) == [3, 2, 1, 1, 1, 1, 1]
+    assert list(the_tree.depths()) == list(stats.depth)
+    assert list(the_tree.heights()) == list(stats.height)
+    assert Tree._preorder_parents(the_tree) == the_tree._preorder_parents()
+
+    root = the_tree.root()
+    pos7 = the_tree.left(the_tree.right(the_tree.left(root)))
+    assert the_tree.depth(pos7) == 3
+    assert Tree.depth(the_tree, pos7) == 3
+    assert the_tree.height() == 3
+    assert the_tree.height(the_tree.right(root)) == 1
+    assert Tree._height2(the_tree, root) == 3
+    assert the_tree._height1() == 3
+
+    empty = linked_binary_tree.LinkedBinaryTree()
+    assert list(empty.stats().size) == []
+
+def test_deep_stats():
+    """Test definition"""
+    depth = 20000
+    the_tree = _chain(depth)
+
+    stats = the_tree.stats()
+    assert stats.height[0] == depth - 1
+    assert stats.depth[-1] == depth - 1
+    assert stats.size[0] == depth
+    assert stats.leaves[0] == 1
+    assert the_tree.height() == depth - 1
+    deepest = list(the_tree.preorder())[-1]
+    assert the_tree.depth(deepest) == depth - 1
+
+def test_bulk_construction():
+    """Test definition"""
+    cls = linked_binary_tree.LinkedBinaryTree
+
+    the_tree = cls.from_level_order(range(1, 11))
+    assert len(the_tree) == 10
+    assert list(the_tree.iter_elements('breadthfirst')) == list(range(1, 11))
+    assert list(the_tree.iter_elements('preorder')) == [1, 2, 4, 8, 9, 5, 10, 3, 6, 7]
+    leaf = the_tree.right(the_tree.right(the_tree.root()))
+    assert leaf.element() == 7
+    assert the_tree.parent(leaf).element() == 3
+    assert cls.from_level_order([]).is_empty()
+
+    the_tree = cls.from_sorted(range(1000))
+    assert len(the_tree) == 1000
+    assert list(the_tree) == list(range(1000))
+    assert the_tree.height() == 9
+    assert cls.from_sorted([]).root() is None
+
+    sample = _sample_tree()
+    pre = list(sample.iter_elements('preorder'))
+    ino = list(sample.iter_elements('inorder'))
+    the_tree = cls.from_preorder_inorder(pre, ino)
+    assert len(the_tree) == 7
+    assert list(the_tree.iter_elements('postorder')) == [4, 7, 5, 2, 6, 3, 1]
+    assert list(the_tree.iter_elements('breadthfirst')) == [1, 2, 3, 4, 5, 6, 7]
+    pos7 = [p for p in the_tree.preorder() if p.element() == 7][0]
+    assert the_tree.depth(pos7) == 3
+    assert cls.from_preorder_inorder([], []).is_empty()
+
+    chain = _chain(5000)
+    the_tree = cls.from_preorder_inorder(chain.iter_elements('preorder'),
+                                         chain.iter_elements('inorder'))
+    assert list(the_tree.iter_elements('postorder')) == list(chain.iter_elements('postorder'))
+
+    for pre, ino in (([1, 2], [1]), ([1, 2, 3], [3, 1, 2]), ([1, 2], [2, 3])):
+        try:
+            cls.from_preorder_inorder(pre, ino)
+            assert False
+        except ValueError:
+            pass
+
+def test_subtree_operations():
+    """Test definition"""
+    the_tree = _sample_tree()
+    root = the_tree.root()
+    pos2 = the_tree.left(root)
+    pos3 = the_tree.right(root)
+
+    subtree = the_tree._detach(pos2)
+    assert list(subtree.iter_elements('preorder')) == [2, 4, 5, 7]
+    assert list(the_tree.iter_elements('preorder')) == [1, 3, 6]
+    assert the_tree.left(root) is None
+    assert len(subtree) == 4
+    assert len(the_tree) == 3
+
+    the_tree._graft_left(pos3, subtree)
+    assert subtree.is_empty()
+    assert len(subtree) == 0
+    assert list(the_tree.iter_elements('preorder')) == [1, 3, 2, 4, 5, 7, 6]
+    assert len(the_tree) == 7
+    try:
+        the_tree._graft_left(pos3, linked_binary_tree.LinkedBinaryTree())
+        assert False
+    except ValueError:
+        pass
+
+    pos6 = the_tree.right(pos3)
+    new_pos2 = the_tree.left(pos3)
+    the_tree._swap_subtrees(pos6, new_pos2)
+    assert list(the_tree.iter_elements('preorder')) == [1, 3, 6, 2, 4, 5, 7]
+    try:
+        the_tree._swap_subtrees(pos3, pos6)
+        assert False
+    except ValueError:
+        pass
+
+    assert the_tree._delete_subtree(the_tree.right(pos3)) == 2
+    assert list(the_tree.iter_elements('preorder')) == [1, 3, 6]
+    assert len(the_tree) == 3
+    try:
+        the_tree.parent(new_pos2)
+        assert False
+    except ValueError:
+        pass
+
+    whole = the_tree._detach(the_tree.root())
+    assert the_tree.is_empty() and len(the_tree) == 0
+    assert len(whole) == 3
+
+    the_tree._add_root(0)
+    the_tree._graft_right(the_tree.root(), whole)
+    assert list(the_tree.iter_elements('preorder')) == [0, 1, 3, 6]
+    assert len(the_tree) == 4
+
+def test_position_interning():
+    """Test definition"""
+    the_tree = _sample_tree()
+    root = the_tree.root()
+    assert root == the_tree.root()
+    assert root is not the_tree.root()
+    assert not hasattr(root, '__dict__')
+
+    depths = dict((pos, the_tree.depth(pos)) for pos in the_tree.preorder())
+    assert len(depths) == 7
+    assert depths[the_tree.root()] == 0
+    assert depths[the_tree.left(the_tree.left(root))] == 2
+
+    interned = linked_binary_tree.LinkedBinaryTree(intern_positions=True)
+    root = interned._add_root(1)
+    left = interned._add_left(root, 2)
+    assert interned.root() is root
+    assert interned.left(root) is left
+    assert interned.parent(left) is root
+    assert list(interned.preorder())[1] is left
+    assert interned._detach(left)._positions is not None
+
+def test_stale_subtree_positions():
+    """Test definition"""
+    for cut in ('_detach', '_delete_subtree'):
+        the_tree = linked_binary_tree.LinkedBinaryTree.from_level_order(range(7))
+        left = the_tree.left(the_tree.root())
+        grandchild = the_tree.left(left)
+        result = getattr(the_tree, cut)(left)
+        for mutate in (lambda: the_tree._add_left(grandchild, 99),
+                       lambda: the_tree._replace(grandchild, 99),
+                       lambda: the_tree._delete(grandchild),
+                       lambda: the_tree._delete_subtree(grandchild)):
+            try:
+                mutate()
+                assert False
+            except ValueError:
+                pass
+        assert len(the_tree) == 4 == len(list(the_tree))
+        if cut == '_detach':
+            fresh = result.left(result.root())
+            result._add_left(fresh, 99)
+            assert len(result) == 4
+            the_tree._graft_left(the_tree.root(), result)
+            the_tree._add_left(the_tree.left(grandchild), 100)
+            assert len(the_tree) == 9 == len(list(the_tree))
+
+def test_subtree_sizes_and_owners():
+    """Test definition"""
+    the_tree = linked_binary_tree.LinkedBinaryTree.from_level_order(range(15))
+    left = the_tree.left(the_tree.root())
+    deep = the_tree.left(the_tree.left(left))
+    subtree = the_tree._detach(left)
+    assert the_tree._size == 8 and subtree._size == 7
+    try:
+        the_tree._replace(deep, 99)
+        assert False
+    except ValueError:
+        pass
+    fresh = subtree.left(subtree.left(subtree.root()))
+    assert subtree._delete_subtree(fresh) == 7
+    assert subtree._size == 6
+
+    other = linked_binary_tree.LinkedBinaryTree.from_sorted('abc')
+    other_root = other.root()
+    the_tree._graft_left(the_tree.root(), other)
+    assert the_tree._size == 11
+    for pos in (other_root, the_tree.left(the_tree.root())):
+        try:
+            other._add_left(pos, 'x')
+            assert False
+        except ValueError:
+            pass
+    assert the_tree.parent(the_tree.left(the_tree.root())) == the_tree.root()
@@ -1,2 +1,39 @@
+""" Unit tests for linked_deque.LinkedDeque """
+
+from dloud_ads import linked_deque
+from dloud_ads import positional_list
+
 def test_dummy():
-	pass
\ No newline at end of file
+	pass
+
+def test_bulk_operations():
+    """Test definition"""
+    the_deque = linked_deque.LinkedDeque()
+    the_deque.extend(range(4))
+    assert len(the_deque) == 4
+    assert the_deque.first() == 0
+    assert the_deque.last() == 3
+
+    other = linked_deque.LinkedDeque()
+    other.extend('xyz')
+    the_deque.concat(other)
+    assert other.is_empty()
+    assert len(the_deque) == 7
+    assert [the_deque.delete_first() for _ in range(7)] == [0, 1, 2, 3, 'x', 'y', 'z']
+
+    try:
+        the_deque.concat(positional_list.PositionalList())
+        assert False
+    except TypeError:
+        pass
+
+def test_pooling():
+    """Test definition"""
+    the_deque = linked_deque.LinkedDeque(pool_size=8)
+    for _ in range(3):
+        the_deque.insert_first(1)
+        the_deque.extend([2, 3])
+        assert [the_deque.delete_last() for x in range(3)] == [3, 2, 1]
+    stats = the_deque.pool_stats()
+    assert stats['allocated'] == 3
+    assert stats['reused'] == 6
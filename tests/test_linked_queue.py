@@ -28,3 +28,16 @@ def test_dummy():
 
     expected = [0, 1, 2, 3, 4, 5, 6, 7, 8, 0, 1]
     assert [the_queue.dequeue() for x in range(11)] == expected
+
+def test_pooling():
+    """Test definition"""
+    the_queue = linked_queue.LinkedQueue(pool_size=4)
+    assert linked_queue.LinkedQueue().pool_stats() is None
+
+    for _ in range(3):
+        _ = [the_queue.enqueue(x) for x in range(6)]
+        assert [the_queue.dequeue() for x in range(6)] == [0, 1, 2, 3, 4, 5]
+    stats = the_queue.pool_stats()
+    assert stats['allocated'] == 10
+    assert stats['reused'] == 8
+    assert stats['discarded'] == 6
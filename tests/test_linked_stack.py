@@ -28,3 +28,39 @@ def test_dummy():
 
     expected = [1, 0, 8, 7, 6, 5, 4, 3, 2, 1, 0]
     assert [the_queue.pop() for x in range(11)] == expected
+
+def test_pooling():
+    """Test definition"""
+    the_stack = linked_stack.LinkedStack(pool_size=4)
+    assert linked_stack.LinkedStack().pool_stats() is None
+
+    for _ in range(3):
+        _ = [the_stack.push(x) for x in range(4)]
+        assert [the_stack.pop() for x in range(4)] == [3, 2, 1, 0]
+    stats = the_stack.pool_stats()
+    assert stats['allocated'] == 4
+    assert stats['reused'] == 8
+    assert stats['free'] == 4
+
+def test_bulk():
+    """Test definition"""
+    for the_stack in (linked_stack.LinkedStack(), linked_stack.LinkedStack(pool_size=4)):
+        the_stack.push_many(range(6))
+        the_stack.push_many([])
+        assert len(the_stack) == 6
+        assert the_stack.peek_many(6) == [5, 4, 3, 2, 1, 0]
+        assert the_stack.pop_many(2) == [5, 4]
+        try:
+            the_stack.peek_many(5)
+            assert False
+        except ValueError:
+            pass
+        the_stack.push_many([7, 8])
+        assert the_stack.top() == 8
+        assert the_stack.pop_many(6) == [8, 7, 3, 2, 1, 0]
+        assert the_stack.is_empty()
+        assert the_stack.pop_many(0) == []
+    stats = the_stack.pool_stats()
+    assert stats['allocated'] == 6
+    assert stats['reused'] == 2
+    assert stats['free'] == 4
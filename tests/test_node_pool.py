@@ -0,0 +1,29 @@
+""" Unit tests for node_pool._NodePool """
+
+from dloud_ads import node_pool
+from dloud_ads.linked_stack import LinkedStack
+
+def test_dummy():
+    """Test definition"""
+    pool = node_pool._NodePool(2)
+    assert len(pool) == 0
+
+    first = pool.acquire(LinkedStack._Node, 'a', None)
+    second = pool.acquire(LinkedStack._Node, 'b', first)
+    third = pool.acquire(LinkedStack._Node, 'c', second)
+    for node in (first, second, third):
+        node._element = node._next = None
+        pool.release(node)
+    assert len(pool) == 2
+
+    recycled = pool.acquire(LinkedStack._Node, 'd', None)
+    assert recycled is second
+    assert recycled._element == 'd'
+    assert pool.stats() == {'capacity': 2, 'free': 1, 'allocated': 3,
+                            'reused': 1, 'discarded': 1}
+
+    try:
+        node_pool._NodePool(-1)
+        assert False
+    except ValueError:
+        pass
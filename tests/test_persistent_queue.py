@@ -0,0 +1,91 @@
+""" Unit tests for persistent_queue.PersistentQueue """
+
+import os
+
+from dloud_ads import persistent_queue
+
+def test_dummy(tmp_path):
+    """Test definition"""
+    path = str(tmp_path / 'queue.dat')
+    the_queue = persistent_queue.PersistentQueue(path, record_size=8, capacity=4)
+    assert the_queue.is_empty()
+    try:
+        the_queue.dequeue()
+        assert False
+    except ValueError:
+        pass
+
+    for k in range(3):
+        the_queue.enqueue(b'r%d' % k)
+    assert the_queue.dequeue() == b'r0'
+    assert the_queue.first() == b'r1'
+    the_queue.enqueue_many([b'a', b'', b'bbbbbbbb'])
+    assert len(the_queue) == 5
+    assert the_queue._capacity == 8
+    try:
+        the_queue.enqueue(b'123456789')
+        assert False
+    except ValueError:
+        pass
+    the_queue.close()
+
+    the_queue = persistent_queue.PersistentQueue(path)
+    assert len(the_queue) == 5
+    assert the_queue.dequeue_many(5) == [b'r1', b'r2', b'a', b'', b'bbbbbbbb']
+    try:
+        the_queue.dequeue_many(1)
+        assert False
+    except ValueError:
+        pass
+    the_queue.close()
+
+    try:
+        persistent_queue.PersistentQueue(path, record_size=16)
+        assert False
+    except ValueError:
+        pass
+
+def test_wraparound_and_resize(tmp_path):
+    """Test definition"""
+    path = str(tmp_path / 'queue.dat')
+    the_queue = persistent_queue.PersistentQueue(path, record_size=4, capacity=8,
+                                                 sync_every=0)
+    the_queue.enqueue_many(b'%d' % k for k in range(6))
+    assert the_queue.dequeue_many(5) == [b'%d' % k for k in range(5)]
+    the_queue.enqueue_many(b'%d' % k for k in range(6, 12))
+    assert the_queue._front + len(the_queue) > 8
+    assert os.path.getsize(path) == 64 + 8 * 8
+
+    the_queue.enqueue_many(b'%d' % k for k in range(12, 40))
+    assert the_queue._capacity == 64
+    assert the_queue.dequeue_many(30) == [b'%d' % k for k in range(5, 35)]
+    assert the_queue._capacity == 16
+    assert os.path.getsize(path) == 64 + 16 * 8
+    the_queue.close()
+
+    the_queue = persistent_queue.PersistentQueue(path)
+    assert [the_queue.dequeue() for _ in range(5)] == [b'%d' % k for k in range(35, 40)]
+    assert the_queue._capacity == 8
+    the_queue.close()
+
+def test_batches_and_chunked_resize(tmp_path):
+    """Test definition"""
+    path = str(tmp_path / 'queue.dat')
+    the_queue = persistent_queue.PersistentQueue(path, record_size=6, capacity=4)
+    the_queue._BATCH = 3
+    the_queue._COPY_CHUNK = 7
+    the_queue.enqueue_many(b'%d' % k for k in range(10))
+    assert len(the_queue) == 10 and the_queue._capacity == 16
+    assert the_queue.dequeue_many(2) == [b'0', b'1']
+    try:
+        the_queue.enqueue_many([b'x', b'y', b'z', b'w', b'too long'])
+        assert False
+    except ValueError:
+        pass
+    assert len(the_queue) == 8
+    the_queue.enqueue_many(b'%d' % k for k in range(10, 30))
+    the_queue.close()
+
+    the_queue = persistent_queue.PersistentQueue(path)
+    assert the_queue.dequeue_many(28) == [b'%d' % k for k in range(2, 30)]
+    the_queue.close()
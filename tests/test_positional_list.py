@@ -29,3 +29,118 @@ def test_dummy():
     value8 = the_list.replace(pos8, 7)
     assert value8 == 8
     assert [x for x in the_list] == [7, 3]
+
+def test_position_interning():
+    """Test definition"""
+    the_list = positional_list.PositionalList()
+    pos1 = the_list.add_last(1)
+    pos2 = the_list.add_last(2)
+    assert the_list.first() == pos1
+    assert the_list.first() is not pos1
+    assert not hasattr(pos1, '__dict__')
+    index = {pos1: 'one', pos2: 'two'}
+    assert index[the_list.last()] == 'two'
+
+    the_list = positional_list.PositionalList(intern_positions=True)
+    pos1 = the_list.add_last(1)
+    pos2 = the_list.add_last(2)
+    assert the_list.first() is pos1
+    assert the_list.after(pos1) is pos2
+    assert the_list.before(the_list.last()) is pos1
+
+def test_iteration():
+    """Test definition"""
+    the_list = positional_list.PositionalList()
+    positions = [the_list.add_last(x) for x in range(6)]
+
+    assert list(the_list) == [0, 1, 2, 3, 4, 5]
+    assert list(reversed(the_list)) == [5, 4, 3, 2, 1, 0]
+    assert list(the_list.positions()) == positions
+    assert list(the_list.reversed_positions()) == positions[::-1]
+
+    assert list(the_list.iter_range(positions[1], positions[4])) == [1, 2, 3]
+    assert list(the_list.iter_range(positions[2])) == [2, 3, 4, 5]
+    assert list(the_list.iter_range(stop=positions[2])) == [0, 1]
+    assert list(the_list.iter_range(positions[3], positions[3])) == []
+    assert list(the_list.iter_range()) == list(range(6))
+    backwards = the_list.iter_range(positions[4], positions[1])
+    try:
+        next(backwards)
+        assert False
+    except ValueError:
+        pass
+
+    empty = positional_list.PositionalList()
+    assert list(empty) == []
+    assert list(reversed(empty)) == []
+    assert list(empty.positions()) == []
+
+def test_bulk_operations():
+    """Test definition"""
+    the_list = positional_list.PositionalList()
+    the_list.extend(range(3))
+    assert list(the_list) == [0, 1, 2]
+    assert len(the_list) == 3
+    the_list.extend_after(the_list.first(), 'ab')
+    assert list(the_list) == [0, 'a', 'b', 1, 2]
+    the_list.extend([])
+    assert len(the_list) == 5
+    assert list(reversed(the_list)) == [2, 1, 'b', 'a', 0]
+
+    other = positional_list.PositionalList()
+    positions = [other.add_last(x) for x in range(10, 16)]
+    the_list.splice(other, positions[1], positions[3])
+    assert list(the_list) == [0, 'a', 'b', 1, 2, 11, 12, 13]
+    assert list(other) == [10, 14, 15]
+    assert len(the_list) == 8 and len(other) == 3
+    try:
+        the_list.splice(other, positions[5], positions[4])
+        assert False
+    except ValueError:
+        pass
+
+    the_list.concat(other)
+    assert list(the_list) == [0, 'a', 'b', 1, 2, 11, 12, 13, 10, 14, 15]
+    assert other.is_empty()
+    assert list(other) == []
+    other.add_last(99)
+    assert list(other) == [99]
+    assert the_list.last().element() == 15
+
+def test_moved_positions():
+    """Test definition"""
+    the_list = positional_list.PositionalList()
+    other = positional_list.PositionalList()
+    positions = [other.add_last(x) for x in range(5)]
+    the_list.splice(other, positions[1], positions[2])
+    moved = [other.delete, lambda pos: other.replace(pos, 0),
+             lambda pos: the_list.delete(pos)]
+    for action in moved:
+        try:
+            action(positions[1])
+            assert False
+        except ValueError:
+            pass
+    assert other.delete(positions[3]) == 3
+
+    the_list.concat(other)
+    for action in (other.delete, other.after, lambda pos: other.add_before(pos, 9)):
+        try:
+            action(positions[4])
+            assert False
+        except ValueError:
+            pass
+    assert len(other) == 0
+    assert list(the_list) == [1, 2, 0, 4]
+
+    third = positional_list.PositionalList()
+    fresh = the_list.last()
+    third.extend_after(third.add_last('x'), 'yz')
+    third.concat(the_list)
+    assert third.delete(third.last()) == 4
+    try:
+        the_list.delete(fresh)
+        assert False
+    except ValueError:
+        pass
+    assert list(third) == ['x', 'y', 'z', 1, 2, 0]
@@ -0,0 +1,61 @@
+""" Unit tests for ring_buffer.RingBuffer """
+
+from dloud_ads import ring_buffer
+
+def test_dummy():
+    """Test definition"""
+    the_buffer = ring_buffer.RingBuffer(5)
+    assert the_buffer.is_empty()
+    assert len(the_buffer._data) == 8
+
+    assert all(the_buffer.enqueue(x) for x in range(7))
+    assert the_buffer.is_full()
+    assert len(the_buffer) == 5
+    assert the_buffer.snapshot() == [2, 3, 4, 5, 6]
+    assert the_buffer.peek(0) == 2
+    assert the_buffer.peek(4) == 6
+    assert the_buffer.peek(-1) == 6
+    try:
+        the_buffer.peek(5)
+        assert False
+    except IndexError:
+        pass
+
+    _ = [the_buffer.enqueue(x) for x in range(10, 14)]
+    assert the_buffer.snapshot() == [6, 10, 11, 12, 13]
+    assert the_buffer.dequeue() == 6
+    assert the_buffer.enqueue_many([20, 21, 22])
+    assert the_buffer.snapshot() == [12, 13, 20, 21, 22]
+    assert the_buffer.enqueue_many(range(100))
+    assert the_buffer.snapshot() == [95, 96, 97, 98, 99]
+    assert len(the_buffer._data) == 8
+
+    assert [the_buffer.dequeue() for x in range(5)] == [95, 96, 97, 98, 99]
+    assert len(the_buffer._data) == 8
+    the_buffer.shrink_to_fit()
+    assert len(the_buffer._data) == 8
+
+def test_full_policies():
+    """Test definition"""
+    the_buffer = ring_buffer.RingBuffer(3, ring_buffer.RingBuffer.REJECT)
+    assert the_buffer.enqueue_many('abc')
+    assert not the_buffer.enqueue('d')
+    assert not the_buffer.enqueue_many('x')
+    assert the_buffer.snapshot() == ['a', 'b', 'c']
+
+    the_buffer = ring_buffer.RingBuffer(3, ring_buffer.RingBuffer.RAISE)
+    the_buffer.enqueue_many('ab')
+    for action in (lambda: the_buffer.enqueue_many('cd'),
+                   lambda: [the_buffer.enqueue(x) for x in 'cd']):
+        try:
+            action()
+            assert False
+        except ValueError:
+            pass
+    assert the_buffer.snapshot() == ['a', 'b', 'c']
+
+    try:
+        ring_buffer.RingBuffer(3, 'drop')
+        assert False
+    except ValueError:
+        pass
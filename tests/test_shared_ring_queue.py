@@ -0,0 +1,101 @@
+""" Unit tests for shared_ring_queue.SharedRingQueue """
+
+import multiprocessing
+import time
+
+from dloud_ads import shared_ring_queue
+
+def _produce(name, count):
+    """Enqueue count records into the queue called name, retrying when full."""
+    the_queue = shared_ring_queue.SharedRingQueue.attach(name)
+    sent = 0
+    while sent < count:
+        sent += the_queue.enqueue_many((k, k * 0.5) for k in range(sent, count))
+    the_queue.close()
+
+def test_dummy():
+    """Test definition"""
+    the_queue = shared_ring_queue.SharedRingQueue(capacity=5, slot_size=8)
+    try:
+        assert the_queue.is_empty()
+        assert the_queue._capacity == 8
+        for k in range(8):
+            the_queue.enqueue(b'x' * k)
+        try:
+            the_queue.enqueue(b'full')
+            assert False
+        except ValueError:
+            pass
+        assert len(the_queue) == 8
+        assert the_queue.dequeue() == b''
+        assert the_queue.dequeue() == b'x'
+        try:
+            the_queue.enqueue(b'x' * 9)
+            assert False
+        except ValueError:
+            pass
+
+        other = shared_ring_queue.SharedRingQueue.attach(the_queue.name())
+        assert len(other) == 6
+        assert other.enqueue_many([b'a', b'b', b'c']) == 2
+        assert the_queue.dequeue_many(100) == [b'x' * k for k in range(2, 8)] + [b'a', b'b']
+        assert other.is_empty()
+        try:
+            other.dequeue()
+            assert False
+        except ValueError:
+            pass
+        assert other.dequeue_many(3) == []
+        try:
+            other.enqueue_many([b'a', b'b', b'toolong!!', b'c'])
+            assert False
+        except ValueError:
+            pass
+        assert the_queue.dequeue_many(4) == [b'a', b'b']
+        try:
+            the_queue.dequeue_many(-1)
+            assert False
+        except ValueError:
+            pass
+        assert len(the_queue) == 0
+        other.close()
+    finally:
+        the_queue.close()
+        the_queue.unlink()
+
+def test_cross_process():
+    """Test definition"""
+    the_queue = shared_ring_queue.SharedRingQueue(capacity=64, record_format='<qd')
+    producer = multiprocessing.Process(target=_produce, args=(the_queue.name(), 5000))
+    try:
+        producer.start()
+        received = []
+        deadline = time.monotonic() + 60
+        while len(received) < 5000:
+            batch = the_queue.dequeue_many(32)
+            if not batch:
+                assert producer.is_alive() or len(the_queue), 'producer died early'
+                assert time.monotonic() < deadline, 'producer timed out'
+            received.extend(batch)
+        producer.join(60)
+        assert producer.exitcode == 0
+        assert received == [(k, k * 0.5) for k in range(5000)]
+    finally:
+        if producer.is_alive():
+            producer.kill()
+        the_queue.close()
+        the_queue.unlink()
+
+def test_enqueue_many_leaves_rest():
+    """Test definition"""
+    for record_format, records in ((None, [b'a', b'b', b'c', b'd']),
+                                   ('<q', [(1,), (2,), (3,), (4,)])):
+        the_queue = shared_ring_queue.SharedRingQueue(capacity=2, record_format=record_format)
+        try:
+            pending = (record for record in records)
+            assert the_queue.enqueue_many(pending) == 2
+            assert list(pending) == records[2:]
+            assert the_queue.dequeue_many(5) == records[:2]
+        finally:
+            the_queue.close()
+            the_queue.unlink()
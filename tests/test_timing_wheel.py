@@ -0,0 +1,79 @@
+""" Unit tests for timing_wheel.TimingWheel """
+
+import random
+
+from dloud_ads import timing_wheel
+
+def test_dummy():
+    """Test definition"""
+    the_wheel = timing_wheel.TimingWheel(wheel_bits=2, levels=2)
+    assert the_wheel.is_empty()
+    timer_a = the_wheel.schedule(3, 'a')
+    timer_b = the_wheel.schedule(0, 'b')
+    timer_c = the_wheel.schedule(9, 'c')
+    timer_d = the_wheel.schedule(40, 'd')
+    assert len(the_wheel) == 4
+    assert timer_c.expiry() == 9 and timer_c.element() == 'c'
+    try:
+        the_wheel.schedule(-1, 'x')
+        assert False
+    except ValueError:
+        pass
+
+    assert the_wheel.tick() == ['b']
+    assert not timer_b.is_active()
+    assert the_wheel.cancel(timer_a) == 'a'
+    try:
+        the_wheel.cancel(timer_a)
+        assert False
+    except ValueError:
+        pass
+    assert the_wheel.advance(7) == []
+    assert the_wheel.time() == 8
+    assert the_wheel.tick() == ['c']
+    assert timer_d.is_active()
+    assert the_wheel.advance(30) == []
+    assert the_wheel.advance(5) == ['d']
+    assert the_wheel.time() == 44
+    assert the_wheel.is_empty()
+    assert the_wheel.advance(1000) == []
+    assert the_wheel.time() == 1044
+
+def test_random_schedule():
+    """Test definition"""
+    rng = random.Random(2)
+    the_wheel = timing_wheel.TimingWheel(wheel_bits=3, levels=3)
+    timers = []
+    cancelled = set()
+    fired = []
+    for step in range(3000):
+        timers.append(the_wheel.schedule(rng.randrange(1200), step))
+        if rng.random() < 0.2:
+            timer = rng.choice(timers)
+            if timer.is_active():
+                the_wheel.cancel(timer)
+                cancelled.add(timer.element())
+        if step % 3 == 0:
+            now = the_wheel.time()
+            for element in the_wheel.advance(rng.randrange(4)):
+                assert now < timers[element].expiry() <= the_wheel.time()
+                fired.append((timers[element].expiry(), element))
+    while not the_wheel.is_empty():
+        for element in the_wheel.tick():
+            assert timers[element].expiry() == the_wheel.time()
+            fired.append((timers[element].expiry(), element))
+    assert sorted(element for _, element in fired) == \
+        [step for step in range(3000) if step not in cancelled]
+    assert [expiry for expiry, _ in fired] == sorted(expiry for expiry, _ in fired)
+
+def test_levels():
+    """Test definition"""
+    try:
+        timing_wheel.TimingWheel(wheel_bits=2, levels=1)
+        assert False
+    except ValueError:
+        pass
+    the_wheel = timing_wheel.TimingWheel(wheel_bits=2, levels=2)
+    the_wheel.schedule(40, 'far')
+    assert the_wheel.advance(39) == []
+    assert the_wheel.tick() == ['far']
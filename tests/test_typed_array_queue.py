@@ -0,0 +1,57 @@
+""" Unit tests for typed_array_queue.TypedArrayQueue """
+
+from array import array
+
+from dloud_ads import typed_array_queue
+
+def test_dummy():
+    """Test definition"""
+    the_queue = typed_array_queue.TypedArrayQueue('q')
+    assert the_queue.is_empty()
+    assert len(the_queue._data) == 16
+
+    _ = [the_queue.enqueue(x) for x in range(20)]
+    assert len(the_queue._data) == 32
+    assert the_queue.first() == 0
+    assert [the_queue.dequeue() for x in range(15)] == list(range(15))
+    assert len(the_queue._data) == 16
+    assert [the_queue.dequeue() for x in range(5)] == list(range(15, 20))
+    try:
+        the_queue.dequeue()
+        assert False
+    except ValueError:
+        pass
+
+def test_bulk():
+    """Test definition"""
+    the_queue = typed_array_queue.TypedArrayQueue('d', capacity=8)
+    the_queue.enqueue_many([0.0, 1.0, 2.0, 3.0, 4.0, 5.0])
+    assert the_queue.dequeue_many(4).tolist() == [0.0, 1.0, 2.0, 3.0]
+    the_queue.enqueue_many(array('d', [6.0, 7.0, 8.0, 9.0]))
+    assert len(the_queue._data) == 8
+    assert the_queue._front + len(the_queue) > 8
+
+    taken = the_queue.dequeue_many(5)
+    assert isinstance(taken, array) and taken.typecode == 'd'
+    assert taken.tolist() == [4.0, 5.0, 6.0, 7.0, 8.0]
+    try:
+        the_queue.dequeue_many(2)
+        assert False
+    except ValueError:
+        pass
+
+    the_queue.enqueue_many(array('d', range(100)))
+    assert len(the_queue) == 101
+    assert len(the_queue._data) == 128
+    assert the_queue.dequeue_many(101).tolist() == [9.0] + [float(x) for x in range(100)]
+    assert len(the_queue._data) == 8
+
+def test_inherited():
+    """Test definition"""
+    the_queue = typed_array_queue.TypedArrayQueue('i', capacity=4)
+    the_queue.reserve(100)
+    assert len(the_queue._data) == 128 and the_queue._data.typecode == 'i'
+    the_queue.enqueue_many(range(50))
+    assert the_queue.dequeue_many(50).tolist() == list(range(50))
+    the_queue.shrink_to_fit()
+    assert len(the_queue._data) == 1
@@ -0,0 +1,44 @@
+""" Unit tests for typed_array_stack.TypedArrayStack """
+
+from array import array
+
+from dloud_ads import typed_array_stack
+
+def test_dummy():
+    """Test definition"""
+    the_stack = typed_array_stack.TypedArrayStack('q')
+    assert the_stack.is_empty()
+    assert the_stack.typecode() == 'q'
+
+    _ = [the_stack.push(x) for x in range(4)]
+    assert the_stack.top() == 3
+    assert [the_stack.pop() for x in range(4)] == [3, 2, 1, 0]
+    try:
+        the_stack.pop()
+        assert False
+    except ValueError:
+        pass
+
+def test_bulk():
+    """Test definition"""
+    the_stack = typed_array_stack.TypedArrayStack('d')
+    the_stack.push_many(array('d', [1.0, 2.0, 3.0]))
+    the_stack.push_many(x / 2 for x in range(8, 11))
+    the_stack.push_many(memoryview(array('f', [6.5])))
+    assert len(the_stack) == 7
+
+    popped = the_stack.pop_many(3)
+    assert isinstance(popped, array) and popped.typecode == 'd'
+    assert popped.tolist() == [6.5, 5.0, 4.5]
+    assert the_stack.pop_many(0).tolist() == []
+    try:
+        the_stack.pop_many(5)
+        assert False
+    except ValueError:
+        pass
+    assert the_stack.pop_many(4).tolist() == [4.0, 3.0, 2.0, 1.0]
+    assert the_stack.is_empty()
+
+    ints = typed_array_stack.TypedArrayStack('q')
+    ints.push_many(memoryview(array('l', range(5))))
+    assert ints.pop_many(5).tolist() == [4, 3, 2, 1, 0]